@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for FX trade records
+
+Builds N FXTrade records under tracemalloc and reports the bytes held per
+trade (and the total for 1M trades), next to a plain __dict__-based class
+equivalent to the previous FXTrade implementation.
+
+Usage:
+    python benchmarks/bench_fx_memory.py
+    python benchmarks/bench_fx_memory.py --count 1000000 --extras
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from jgtcore.fx import FXTrade  # noqa: E402
+
+
+class DictTrade:
+    """FXTrade as it was before __slots__: every field in the instance __dict__."""
+
+    def __init__(self, trade_id=None, instrument=None, amount=None, buy_sell=None,
+                 open_rate=None, close_rate=None, open_time=None, close_time=None,
+                 pl=None, **kwargs):
+        self.trade_id = trade_id
+        self.instrument = instrument
+        self.amount = amount
+        self.buy_sell = buy_sell
+        self.open_rate = open_rate
+        self.close_rate = close_rate
+        self.open_time = open_time
+        self.close_time = close_time
+        self.pl = pl
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+
+INSTRUMENTS = ["EUR/USD", "GBP/USD", "USD/JPY", "AUD/USD", "USD/CAD", "EUR/JPY"]
+
+
+def measure(cls, count: int, extras: bool) -> int:
+    """Bytes allocated to hold `count` trades of cls."""
+    # Field values are shared across both runs so only the records are measured
+    instruments = INSTRUMENTS
+    kwargs = {"account_id": "ACC-1"} if extras else {}
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    trades = [
+        cls(i, instruments[i % 6], 1000, "B", 1.1, 1.2, None, None, 10.0, **kwargs)
+        for i in range(count)
+    ]
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del trades
+    return size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000, help="trades to build")
+    parser.add_argument("--extras", action="store_true", help="pass one extra keyword per trade")
+    args = parser.parse_args()
+
+    print(f"{'record':<10} {'bytes/trade':>12} {'MB per 1M':>10}")
+    for name, cls in (("dict", DictTrade), ("FXTrade", FXTrade)):
+        per_trade = measure(cls, args.count, args.extras) / args.count
+        print(f"{name:<10} {per_trade:>12.1f} {per_trade:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
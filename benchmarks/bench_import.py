@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for jgtcore
+
+Measures the wall time of fresh interpreters importing jgtcore (and a few
+typical entry points) so startup regressions are caught early.
+
+Usage:
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --runs 30 --max-ms 40
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name -> statement executed in a fresh interpreter
+CASES = {
+    "baseline": "pass",
+    "import jgtcore": "import jgtcore",
+    "config accessor": "from jgtcore import get_config_value",
+    "settings": "from jgtcore import get_settings",
+    "timeframe": "from jgtcore import TimeframeChecker",
+    "cli": "from jgtcore import new_parser",
+    "everything": "from jgtcore import *",
+}
+
+
+def time_statement(statement: str, runs: int) -> list:
+    """Run statement in `runs` fresh interpreters and return the timings (ms)."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = REPO_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", statement],
+            check=True,
+            env=env,
+            cwd=REPO_ROOT,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def loaded_jgtcore_modules(statement: str) -> list:
+    """List the jgtcore modules loaded by statement."""
+    code = (
+        f"{statement}\n"
+        "import sys, json\n"
+        "print(json.dumps(sorted(m for m in sys.modules if m.startswith('jgtcore'))))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15, help="interpreters per case")
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        default=None,
+        help="fail if 'import jgtcore' costs more than this over the baseline",
+    )
+    args = parser.parse_args()
+
+    results = {}
+    for name, statement in CASES.items():
+        timings = time_statement(statement, args.runs)
+        results[name] = statistics.median(timings)
+
+    baseline = results["baseline"]
+    print(f"{'case':<18} {'median ms':>10} {'over baseline':>14}")
+    for name, median in results.items():
+        print(f"{name:<18} {median:>10.1f} {median - baseline:>14.1f}")
+
+    print()
+    print("modules loaded by 'import jgtcore':", loaded_jgtcore_modules("import jgtcore"))
+
+    if args.max_ms is not None:
+        overhead = results["import jgtcore"] - baseline
+        if overhead > args.max_ms:
+            print(f"FAIL: import jgtcore overhead {overhead:.1f} ms > {args.max_ms} ms")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
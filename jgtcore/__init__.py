@@ -13,137 +13,119 @@ Main Functions:
 - Environment: setup_environment(), export_env_if_any()
 - Utilities: str_to_datetime(), is_market_open(), print_exception()
 - Trading: read_fx_str_from_config(), is_demo_mode()
-"""
 
-from .core import (  # Core configuration functions; Simple API wrappers; Environment helpers; Utility functions; Trading helpers; Helper functions for advanced use
-    dt_from_last_week_as_datetime,
-    dt_from_last_week_as_string_fxformat,
-    export_env_if_any,
-    get_config,
-    get_config_value,
-    get_setting,
-    get_settings,
-    is_demo_mode,
-    is_market_open,
-    load_arg_default_from_settings,
-    load_arg_default_from_settings_if_exist,
-    load_arg_from_jgt_env,
-    load_settings,
-    print_exception,
-    read_fx_str_from_config,
-    readconfig,
-    setup_environment,
-    str_to_datetime,
-    update_settings,
-    # NEW: Tracing configuration
-    get_tracing_config,
-)
+Public names are resolved lazily (PEP 562): `import jgtcore` only loads this
+file, and each submodule is imported the first time one of its names is used.
+This keeps the startup cost of short-lived CLI tools to what they actually use.
+"""
 
-from .timeframe import (  # Timeframe scheduling functions
-    get_current_time,
-    get_times_by_timeframe_str,
-    is_timeframe_reached,
-    simulate_timeframe_reached,
-    TimeframeChecker,
-)
+import importlib
 
 __version__ = "0.2.5"
 __author__ = "JGWill"
 __description__ = "Core library functions extracted from jgtutils"
 
-# Export the main functions that external packages are likely to use
-# Compatibility layer for jgtutils migration
-# Import compatibility functions for backward compatibility
-from .compatibility import COMPATIBILITY_MAP, get_compatible_function
-
-# NEW: Tracing infrastructure
-from .tracing import (
-    JGTTracer, create_session_tracer, 
-    get_trace_url, is_tracing_enabled
-)
-
-# Module structure for future migrations
-from . import cli, os, env, fx, logging as jgt_logging, constants
-
-__all__ = [
-    # Configuration functions
-    "readconfig",
-    "load_settings",
-    "get_settings",
-    "get_tracing_config",
+# Public name -> submodule that defines it
+_LAZY_ATTRIBUTES = {
+    # Core configuration functions
+    "readconfig": ".core",
+    "load_settings": ".core",
+    "get_settings": ".core",
+    "settings_snapshot": ".core",
+    "SettingsSnapshot": ".core",
+    "clear_settings_cache": ".core",
+    "clear_config_cache": ".core",
+    "get_tracing_config": ".core",
     # Simple API wrappers
-    "get_config",
-    "get_setting",
-    "setup_environment",
-    "get_config_value",
-    "is_demo_mode",
+    "get_config": ".core",
+    "get_setting": ".core",
+    "setup_environment": ".core",
+    "get_config_value": ".core",
+    "is_demo_mode": ".core",
     # Environment helpers
-    "load_arg_from_jgt_env",
-    "load_arg_default_from_settings",
-    "export_env_if_any",
+    "load_arg_from_jgt_env": ".core",
+    "load_arg_default_from_settings": ".core",
+    "export_env_if_any": ".core",
     # Utility functions
-    "str_to_datetime",
-    "print_exception",
-    "is_market_open",
-    "dt_from_last_week_as_datetime",
-    "dt_from_last_week_as_string_fxformat",
+    "str_to_datetime": ".core",
+    "print_exception": ".core",
+    "is_market_open": ".core",
+    "dt_from_last_week_as_datetime": ".core",
+    "dt_from_last_week_as_string_fxformat": ".core",
     # Trading helpers
-    "read_fx_str_from_config",
+    "read_fx_str_from_config": ".core",
     # Helper functions
-    "update_settings",
-    "load_arg_default_from_settings_if_exist",
+    "update_settings": ".core",
+    "load_arg_default_from_settings_if_exist": ".core",
     # Timeframe functions
-    "get_current_time",
-    "get_times_by_timeframe_str",
-    "is_timeframe_reached",
-    "simulate_timeframe_reached",
-    "TimeframeChecker",
+    "get_current_time": ".timeframe",
+    "get_times_by_timeframe_str": ".timeframe",
+    "is_timeframe_reached": ".timeframe",
+    "simulate_timeframe_reached": ".timeframe",
+    "TimeframeChecker": ".timeframe",
+    "TimeframeScheduler": ".timeframe",
+    "ReplayClock": ".timeframe",
     # Tracing infrastructure
-    "JGTTracer",
-    "create_session_tracer", 
-    "get_trace_url",
-    "is_tracing_enabled",
+    "JGTTracer": ".tracing",
+    "create_session_tracer": ".tracing",
+    "get_trace_url": ".tracing",
+    "is_tracing_enabled": ".tracing",
+    # Layered settings
+    "LayeredSettings": ".settings",
+    "get_layered_settings": ".settings",
+    "SettingsWatcher": ".settings",
+    "watch_settings": ".settings",
+    "resolve_args": ".settings",
+    "aload_settings": ".settings",
+    "aget_config": ".settings",
     # Compatibility utilities
-    "COMPATIBILITY_MAP",
-    "get_compatible_function",
-    # Module namespaces for migrations
-    "cli",
-    "os", 
-    "env",
-    "fx",
-    "jgt_logging",
-    "constants",
-]
-
-# Import commonly used functions from migrated modules for convenience
-from .cli import new_parser, parse_args, print_jsonl_message
-from .os import i2fn, fn2i, t2fn, fn2t
-from .env import load_env
-from .fx import FXTransactWrapper, FXTransactDataHelper, ftdh, ftw
-from .constants import NB_BARS_BY_DEFAULT_IN_CDS
-
-# Add to __all__ for direct access
-__all__.extend([
+    "COMPATIBILITY_MAP": ".compatibility",
+    "get_compatible_function": ".compatibility",
     # Commonly used CLI functions
-    "new_parser",
-    "parse_args", 
-    "print_jsonl_message",
-    
+    "new_parser": ".cli",
+    "parse_args": ".cli",
+    "print_jsonl_message": ".cli",
     # Commonly used OS functions
-    "i2fn",
-    "fn2i",
-    "t2fn",
-    "fn2t",
-    
+    "i2fn": ".os",
+    "fn2i": ".os",
+    "t2fn": ".os",
+    "fn2t": ".os",
     # Commonly used environment functions
-    "load_env",
-    
+    "load_env": ".env",
     # Commonly used FX functions
-    "FXTransactWrapper",
-    "FXTransactDataHelper",
-    "ftdh",
-    "ftw",
-    
+    "FXTransactWrapper": ".fx",
+    "FXTransactDataHelper": ".fx",
+    "ftdh": ".fx",
+    "ftw": ".fx",
     # Commonly used constants
-    "NB_BARS_BY_DEFAULT_IN_CDS",
-])
+    "NB_BARS_BY_DEFAULT_IN_CDS": ".constants",
+}
+
+# Module namespaces for migrations (attribute name -> submodule)
+_LAZY_MODULES = {
+    "cli": ".cli",
+    "os": ".os",
+    "env": ".env",
+    "fx": ".fx",
+    "jgt_logging": ".logging",
+    "constants": ".constants",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES) + list(_LAZY_MODULES)
+
+
+def __getattr__(name):
+    """Import the submodule providing `name` on first access."""
+    if name in _LAZY_MODULES:
+        value = importlib.import_module(_LAZY_MODULES[name], __name__)
+    elif name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
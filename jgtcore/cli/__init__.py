@@ -16,6 +16,7 @@ from .common import (
     add_settings_argument,
     load_arg_default_from_settings,
     load_arg_default_from_settings_if_exist,
+    resolve_arg_defaults,
     get_parsed_args,
     get_current_settings,
     SETTING_ARGNAME,
@@ -41,6 +42,7 @@ __all__ = [
     'add_settings_argument',
     'load_arg_default_from_settings',
     'load_arg_default_from_settings_if_exist',
+    'resolve_arg_defaults',
     'get_parsed_args',
     'get_current_settings',
     'SETTING_ARGNAME',
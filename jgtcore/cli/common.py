@@ -11,17 +11,10 @@ import os
 import sys
 from typing import Optional
 
-# Optional YAML support - graceful fallback to JSON-only if not available
-try:
-    import ruamel.yaml
-    yaml = ruamel.yaml.YAML()
-    HAS_YAML = True
-except ImportError:
-    yaml = None
-    HAS_YAML = False
-
-# Import core functions from jgtcore
-from ..core import load_settings, get_settings, update_settings
+# Import core functions from jgtcore (HAS_YAML is checked without importing
+# ruamel.yaml; the YAML instance is created on first access, see __getattr__)
+from ..core import HAS_YAML, load_settings, get_settings, update_settings, settings_snapshot
+from ..settings.resolver import get_arg_resolver
 
 # CLI constants
 SETTING_ARGNAME = 'settings'
@@ -30,9 +23,19 @@ SETTING_ARGNAME_ALIAS = 'ls'
 # Global variables for parser state
 default_parser = None
 args = None
+# Immutable SettingsSnapshot, replaced (never mutated) when settings reload
 settings = None
 
 
+def __getattr__(name):
+    """Create the module's YAML instance on first access to `yaml`."""
+    if name == 'yaml':
+        from ..core import _get_yaml
+
+        return _get_yaml()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def new_parser(description: str, epilog: str = None, prog: str = None,
                enable_specified_settings: bool = True,
                add_exiting_quietly_flag: bool = False,
@@ -91,8 +94,9 @@ def parse_args(parser: Optional[argparse.ArgumentParser] = None) -> argparse.Nam
     args = parser.parse_args()
     
     try:
-        # Set jgtcommon_settings in the args to store settings
-        setattr(args, 'jgtcommon_settings', get_settings())
+        # Set jgtcommon_settings in the args to store settings (a private,
+        # mutable copy of the published snapshot)
+        setattr(args, 'jgtcommon_settings', settings_snapshot().to_dict())
     except:
         pass
     
@@ -148,7 +152,7 @@ def _preload_settings_from_args(parser: Optional[argparse.ArgumentParser] = None
     
     args_partial, unknown = parser.parse_known_args()
     custom_path = getattr(args_partial, SETTING_ARGNAME, None)
-    settings = load_settings(custom_path)
+    settings = settings_snapshot(custom_path)
     
     return parser
 
@@ -170,23 +174,33 @@ def load_arg_default_from_settings(argname: str, default_value,
     Returns:
         Value from settings or default
     """
+    return get_arg_resolver(_current_settings()).resolve(
+        argname, default_value, alias, from_jgt_env, exclude_env_alias
+    )
+
+
+def _current_settings():
+    """Return the CLI settings, publishing the current snapshot on first use."""
     global settings
     
-    if settings is None or len(settings) == 0:
-        settings = load_settings()
-    
-    value = settings.get(argname, default_value)
-    if alias is not None and value == default_value:
-        value = settings.get(alias, default_value)
-    
-    if from_jgt_env:
-        from ..env import load_arg_from_jgt_env
-        _alias = None if exclude_env_alias else alias
-        env_value = load_arg_from_jgt_env(argname, _alias)
-        if env_value is not None:
-            value = env_value
+    current = settings
+    if current is None or len(current) == 0:
+        current = settings = settings_snapshot()
+    return current
+
+
+def resolve_arg_defaults(specs) -> dict:
+    """
+    Resolve the defaults of many arguments at once from the CLI settings.
     
-    return value
+    Args:
+        specs: Argument names, tuples (argname, default_value, alias,
+            from_jgt_env, exclude_env_alias) or dicts of the same keywords
+        
+    Returns:
+        Dictionary of argname to resolved value
+    """
+    return get_arg_resolver(_current_settings()).resolve_args(specs)
 
 
 def load_arg_default_from_settings_if_exist(argname: str, default_value,
@@ -286,12 +300,12 @@ def get_parsed_args() -> Optional[argparse.Namespace]:
     return args
 
 
-def get_current_settings() -> Optional[dict]:
+def get_current_settings():
     """
     Get the currently loaded settings.
     
     Returns:
-        Settings dictionary or None if not loaded
+        Read-only SettingsSnapshot or None if not loaded
     """
     global settings
     return settings
@@ -303,6 +317,7 @@ __all__ = [
     'add_settings_argument',
     'load_arg_default_from_settings',
     'load_arg_default_from_settings_if_exist',
+    'resolve_arg_defaults',
     'get_parsed_args',
     'get_current_settings',
     'SETTING_ARGNAME',
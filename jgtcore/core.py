@@ -21,31 +21,139 @@ jgtcore.core - Core library functions extracted from jgtutils
 Provides configuration, settings, and utility functions without CLI dependencies.
 """
 
+import copy
+import functools
+import importlib.util
 import json
 
-# Optional YAML support - graceful fallback to JSON-only if not available
+# Optional YAML support - graceful fallback to JSON-only if not available.
+# ruamel.yaml is only imported when a YAML file is actually read (see _get_yaml).
 try:
-    import ruamel.yaml
-
-    yaml = ruamel.yaml.YAML()
-    HAS_YAML = True
+    HAS_YAML = importlib.util.find_spec("ruamel.yaml") is not None
 except ImportError:
-    yaml = None
     HAS_YAML = False
+yaml = None
 
 import os
 import sys
+import threading
 import traceback
-from datetime import datetime, time, timedelta, timezone
-from typing import Any, Dict, Optional, Tuple
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 # Global variables for caching
 settings: Dict[str, Any] = {}
 _JGT_CONFIG_JSON_SECRET: Optional[str] = None
 
+
+def _freeze(value: Any) -> Any:
+    """Return a read-only copy of value (mappings become proxies, lists tuples)."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Return a mutable deep copy of a frozen value."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    if isinstance(value, frozenset):
+        return set(value)
+    return value
+
+
+class SettingsSnapshot(Mapping):
+    """
+    Immutable, published view of the settings.
+
+    Snapshots are built off to the side by writers and swapped in with a
+    single reference assignment, so readers never block, copy or observe a
+    half-merged state. Nested mappings and lists are frozen as well; use
+    to_dict() to get a mutable copy.
+    """
+
+    __slots__ = ("_data", "version")
+
+    def __init__(self, data: Optional[Mapping] = None, version: int = 0):
+        """
+        Initialize the snapshot.
+
+        Args:
+            data: Settings to freeze (copied)
+            version: Monotonic publication counter
+        """
+        self._data = _freeze(data or {})
+        self.version = version
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def __repr__(self) -> str:
+        return f"SettingsSnapshot(version={self.version}, keys={len(self._data)})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a mutable deep copy of the settings."""
+        return _thaw(self._data)
+
+
+# (settings dict the snapshot was built from, snapshot), swapped as one reference
+_settings_published: Tuple[Optional[Dict[str, Any]], SettingsSnapshot] = (
+    None,
+    SettingsSnapshot(),
+)
+
+# Serializes settings loads and publications; readers never take it
+_settings_write_lock = threading.RLock()
+
+# ruamel YAML instances keep their parser state on themselves: one per thread
+_yaml_local = threading.local()
+
 # Core Configuration Functions
 
 
+def _get_yaml():
+    """
+    Return this thread's ruamel YAML instance, importing it on first use.
+
+    A YAML instance is not thread-safe, so sources parsed concurrently (see
+    jgtcore.settings.aio) each use their own thread's instance; the module
+    attribute yaml is the first one created.
+    """
+    global yaml, HAS_YAML
+    instance = getattr(_yaml_local, "yaml", None)
+    if instance is None and HAS_YAML:
+        try:
+            import ruamel.yaml
+
+            instance = _yaml_local.yaml = ruamel.yaml.YAML()
+        except ImportError:
+            HAS_YAML = False
+        else:
+            if yaml is None:
+                yaml = instance
+    return instance
+
+
 def _load_settings_from_path(path: str) -> Dict[str, Any]:
     """Load settings from a JSON file path."""
     if os.path.exists(path):
@@ -64,6 +172,9 @@ def _load_settings_from_path_yaml(
         return {}
 
     if os.path.exists(path):
+        yaml = _get_yaml()
+        if yaml is None:
+            return {}
         with open(path, "r") as f:
             if key is not None:
                 try:
@@ -106,83 +217,233 @@ def _settings_loaded(_settings: Dict[str, Any]) -> None:
     return
 
 
-def load_settings(
-    custom_path: Optional[str] = None, old: Optional[Dict[str, Any]] = None
+# Settings Source Cache
+#
+# Every settings source is fingerprinted (files by path/inode/mtime_ns/size,
+# environment variables by a hash of their value).  Parsed sources and the
+# merged result are kept until one of those fingerprints changes, so repeated
+# loads only cost a handful of stat() calls.
+
+
+class _SettingsSource(NamedTuple):
+    """A single settings layer, in the order load_settings merges them."""
+
+    name: str
+    kind: str  # "json", "yaml" or "env"
+    location: str  # file path or environment variable name
+    key: Optional[str] = None  # YAML key to extract (e.g. "jgt" in _config.yml)
+
+
+_SOURCE_CACHE: Dict[_SettingsSource, Tuple[Any, Dict[str, Any]]] = {}
+_SNAPSHOT_ENV_NAME = "JGT_SETTINGS_SNAPSHOT"
+_MERGED_CACHE: Dict[Optional[str], Tuple[Tuple[Any, ...], Dict[str, Any]]] = {}
+_settings_state: Optional[Tuple[Tuple[Optional[str], Tuple[Any, ...]], Dict[str, Any]]] = None
+
+
+def _settings_sources(custom_path: Optional[str] = None) -> List[_SettingsSource]:
+    """List the settings sources in order of precedence (lowest first)."""
+    cwd = os.getcwd()
+    sources = [
+        _SettingsSource("system", "json", os.path.join("/etc", "jgt", "settings.json")),
+        _SettingsSource("env:JGT_SETTINGS_SYSTEM", "env", "JGT_SETTINGS_SYSTEM"),
+        _SettingsSource(
+            "user", "json", os.path.join(os.path.expanduser("~"), ".jgt", "settings.json")
+        ),
+        _SettingsSource("env:JGT_SETTINGS", "env", "JGT_SETTINGS"),
+        _SettingsSource("env:JGT_SETTINGS_USER", "env", "JGT_SETTINGS_USER"),
+        _SettingsSource("current", "json", os.path.join(cwd, ".jgt", "settings.json")),
+        _SettingsSource("current_yaml", "yaml", os.path.join(cwd, ".jgt", "settings.yml")),
+        _SettingsSource("jubook_yaml", "yaml", os.path.join(cwd, "_config.yml"), "jgt"),
+        _SettingsSource("jgt_yaml", "yaml", os.path.join(cwd, "jgt.yml")),
+    ]
+    if custom_path is not None and custom_path != "":
+        if ".json" in custom_path:
+            sources.append(_SettingsSource("custom", "json", custom_path))
+        elif ".yml" in custom_path:
+            sources.append(_SettingsSource("custom", "yaml", custom_path))
+    sources.append(
+        _SettingsSource("env:JGT_SETTINGS_PROCESS", "env", "JGT_SETTINGS_PROCESS")
+    )
+    return sources
+
+
+def _stat_fingerprint(path: str) -> Optional[Tuple[int, int, int]]:
+    """Return (inode, mtime_ns, size) for path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _env_fingerprint(name: str) -> Optional[str]:
+    """Return a stable hash of an environment variable value, or None if unset."""
+    value = os.environ.get(name)
+    if value is None:
+        return None
+    import hashlib  # deferred: only needed when a JGT_SETTINGS* variable is set
+
+    return hashlib.sha1(value.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _source_fingerprint(source: _SettingsSource) -> Any:
+    """Fingerprint a settings source so changes can be detected cheaply."""
+    if source.kind == "env":
+        return _env_fingerprint(source.location)
+    return _stat_fingerprint(source.location)
+
+
+def _parse_settings_source(source: _SettingsSource) -> Dict[str, Any]:
+    """Read and parse a settings source, bypassing the cache."""
+    if source.kind == "env":
+        if source.location in os.environ:
+            return json.loads(os.environ[source.location])
+        return {}
+    if source.kind == "yaml":
+        return _load_settings_from_path_yaml(source.location, key=source.key)
+    return _load_settings_from_path(source.location)
+
+
+def _load_settings_source(
+    source: _SettingsSource, fingerprint: Any
 ) -> Dict[str, Any]:
     """
-    Load settings from multiple locations in order of precedence.
+    Return the parsed content of a settings source, reparsing only on change.
 
-    Args:
-        custom_path: Optional custom path to settings file
-        old: Existing settings to merge with
-
-    Returns:
-        Merged settings dictionary
+    The returned dictionary is shared with the cache and must not be mutated.
     """
-    system_settings_path = os.path.join("/etc", "jgt", "settings.json")
-    home_settings_path = os.path.join(os.path.expanduser("~"), ".jgt", "settings.json")
-    current_settings_path = os.path.join(os.getcwd(), ".jgt", "settings.json")
-    yaml_current_settings_path = os.path.join(os.getcwd(), ".jgt", "settings.yml")
-    jgt_yaml_current_settings_path = os.path.join(os.getcwd(), "jgt.yml")
-    jubook_jgt_yaml_current_settings_path = os.path.join(os.getcwd(), "_config.yml")
+    if fingerprint is None:
+        _SOURCE_CACHE.pop(source, None)
+        return {}
+    cached = _SOURCE_CACHE.get(source)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    parsed = _parse_settings_source(source)
+    if parsed is None:
+        parsed = {}
+    _SOURCE_CACHE[source] = (fingerprint, parsed)
+    return parsed
 
-    _settings = {}
-    if old is not None:
-        _settings = old
 
-    # Load system settings
-    system_settings = _load_settings_from_path(system_settings_path)
-    update_settings(_settings, system_settings)
+def _settings_fingerprint(
+    sources: List[_SettingsSource],
+) -> Tuple[Any, ...]:
+    """Fingerprint every source of a settings load."""
+    return tuple((source, _source_fingerprint(source)) for source in sources)
 
-    # Load from env JGT_SETTINGS_SYSTEM if exists
-    if "JGT_SETTINGS_SYSTEM" in os.environ:
-        env_settings_system = json.loads(os.environ["JGT_SETTINGS_SYSTEM"])
-        update_settings(_settings, env_settings_system)
 
-    # Load user settings
-    user_settings = _load_settings_from_path(home_settings_path)
-    update_settings(_settings, user_settings)
+def _merge_settings_sources(
+    fingerprint: Tuple[Any, ...], target: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Merge the (cached) parsed sources into target in precedence order."""
+    for source, source_fingerprint in fingerprint:
+        layer = _load_settings_source(source, source_fingerprint)
+        if layer:
+            # update_settings mutates both sides, keep the cached layer intact
+            update_settings(target, copy.deepcopy(layer))
+    return target
 
-    # Load from env JGT_SETTINGS or JGT_SETTINGS_USER if exists
-    if "JGT_SETTINGS" in os.environ:
-        env_settings_user = json.loads(os.environ["JGT_SETTINGS"])
-        update_settings(_settings, env_settings_user)
 
-    if "JGT_SETTINGS_USER" in os.environ:
-        env_settings_user = json.loads(os.environ["JGT_SETTINGS_USER"])
-        update_settings(_settings, env_settings_user)
+def _merge_settings_over(
+    custom_path: Optional[str], fingerprint: Tuple[Any, ...], old: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Merge the sources over a copy of old; hold the write lock.
 
-    # Load current directory settings
-    current_settings = _load_settings_from_path(current_settings_path)
-    update_settings(_settings, current_settings)
+    old is never modified. When old is the global settings, the result is
+    published in its place: settings that were loaded from the sources stay
+    reloadable by get_settings() (keyed by custom_path and fingerprint),
+    settings the application assigned stay assigned.
+    """
+    merged = _merge_settings_sources(fingerprint, copy.deepcopy(old))
+    if old is settings:
+        state = _settings_state
+        loaded = not old or (state is not None and state[1] is old)
+        _publish_settings(merged, (custom_path, fingerprint) if loaded else None)
+    return merged
 
-    current_settings_yaml = _load_settings_from_path_yaml(yaml_current_settings_path)
-    update_settings(_settings, current_settings_yaml)
 
-    jubook_jgt_current_settings_yaml = _load_settings_from_path_yaml(
-        jubook_jgt_yaml_current_settings_path, key="jgt"
-    )
-    update_settings(_settings, jubook_jgt_current_settings_yaml)
+def _load_settings_cached(
+    custom_path: Optional[str] = None,
+) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+    """
+    Return (fingerprint, merged settings) using the source cache.
 
-    jgt_current_settings_yaml = _load_settings_from_path_yaml(
-        jgt_yaml_current_settings_path
-    )
-    update_settings(_settings, jgt_current_settings_yaml)
+    The merged dictionary is shared with the cache and must not be mutated.
+    """
+    fingerprint = _settings_fingerprint(_settings_sources(custom_path))
+    cached = _MERGED_CACHE.get(custom_path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached
+    with _settings_write_lock:
+        return _merge_settings_cached(custom_path, fingerprint)
+
+
+def _merge_settings_cached(
+    custom_path: Optional[str], fingerprint: Tuple[Any, ...]
+) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+    """Merge (or load the compiled snapshot of) the sources; hold the write lock."""
+    cached = _MERGED_CACHE.get(custom_path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached
+
+    compiled = _compiled_snapshots()
+    merged = None
+    if compiled is not None:
+        merged = compiled.load_compiled_settings(custom_path, fingerprint)
+    if merged is None:
+        merged = _merge_settings_sources(fingerprint, {})
+        if compiled is not None:
+            compiled.store_compiled_settings(custom_path, fingerprint, merged)
+    _MERGED_CACHE[custom_path] = (fingerprint, merged)
+    return fingerprint, merged
+
+
+def _compiled_snapshots():
+    """Return the compiled snapshot module if JGT_SETTINGS_SNAPSHOT is enabled."""
+    if os.environ.get(_SNAPSHOT_ENV_NAME, "").lower() not in ("1", "true", "yes", "on"):
+        return None
+    from .settings import compiled
+
+    return compiled
+
+
+def clear_settings_cache() -> None:
+    """Drop every cached settings source and merged result."""
+    global settings, _settings_state, _settings_published
+    with _settings_write_lock:
+        _SOURCE_CACHE.clear()
+        _MERGED_CACHE.clear()
+        if _settings_state is not None and _settings_state[1] is settings:
+            settings = {}
+        _settings_state = None
+        _settings_published = (None, SettingsSnapshot())
 
-    # Load custom settings if provided
-    if custom_path is not None and custom_path != "":
-        custom_settings = {}
-        if ".json" in custom_path:
-            custom_settings = _load_settings_from_path(custom_path)
-        else:
-            if ".yml" in custom_path:
-                custom_settings = _load_settings_from_path_yaml(custom_path)
-        update_settings(_settings, custom_settings)
 
-    # Load process-level settings from environment
-    if "JGT_SETTINGS_PROCESS" in os.environ:
-        env_settings_process = json.loads(os.environ["JGT_SETTINGS_PROCESS"])
-        update_settings(_settings, env_settings_process)
+def load_settings(
+    custom_path: Optional[str] = None, old: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Load settings from multiple locations in order of precedence.
+
+    Sources are only reread when their stat (or environment value) changed
+    since the previous call; otherwise the cached merge is reused.
+
+    Args:
+        custom_path: Optional custom path to settings file
+        old: Existing settings to merge with (left unchanged; if it is the
+            global settings, the merged copy is published in its place)
+
+    Returns:
+        Merged settings dictionary
+    """
+    if old is not None:
+        fingerprint = _settings_fingerprint(_settings_sources(custom_path))
+        with _settings_write_lock:
+            _settings = _merge_settings_over(custom_path, fingerprint, old)
+    else:
+        _, merged = _load_settings_cached(custom_path)
+        _settings = copy.deepcopy(merged)
 
     _settings_loaded(_settings)
 
@@ -191,7 +452,11 @@ def load_settings(
 
 def get_settings(custom_path: Optional[str] = None) -> Dict[str, Any]:
     """
-    Get cached settings, loading them if necessary.
+    Get cached settings, reloading them when a source changed.
+
+    Each reload publishes a new dictionary (and SettingsSnapshot) instead of
+    updating the previous one in place; treat the returned dict as read-only
+    and use settings_snapshot() from concurrent readers.
 
     Args:
         custom_path: Optional custom path to settings file
@@ -199,10 +464,84 @@ def get_settings(custom_path: Optional[str] = None) -> Dict[str, Any]:
     Returns:
         Settings dictionary
     """
-    global settings
-    if settings is None or len(settings) == 0:
-        settings = load_settings(custom_path=custom_path)
-    return settings
+    state = _settings_state
+    current = settings
+    if current and (state is None or state[1] is not current):
+        # Settings were assigned by the application, keep them as-is
+        return current
+
+    fingerprint = _settings_fingerprint(_settings_sources(custom_path))
+    state_key = (custom_path, fingerprint)
+    if state is not None and state[0] == state_key:
+        return current
+
+    with _settings_write_lock:
+        state = _settings_state
+        if state is not None and state[0] == state_key:
+            return state[1]
+        fingerprint, merged = _merge_settings_cached(custom_path, fingerprint)
+        new_settings = copy.deepcopy(merged)
+        _settings_loaded(new_settings)
+        return _publish_settings(new_settings, (custom_path, fingerprint))
+
+
+def _publish_settings(
+    new_settings: Dict[str, Any],
+    state_key: Optional[Tuple[Optional[str], Tuple[Any, ...]]],
+) -> Dict[str, Any]:
+    """
+    Swap in a new settings dictionary as the global settings.
+
+    The frozen snapshot is built before anything is published; each global
+    is then replaced by a single reference assignment. Without a state_key
+    the settings are kept as assigned (not reloaded by get_settings()).
+    """
+    global settings, _settings_state, _settings_published
+    with _settings_write_lock:
+        version = _settings_published[1].version + 1
+        _settings_published = (new_settings, SettingsSnapshot(new_settings, version))
+        _settings_state = (state_key, new_settings) if state_key is not None else None
+        settings = new_settings
+    return new_settings
+
+
+def settings_snapshot(custom_path: Optional[str] = None) -> SettingsSnapshot:
+    """
+    Get the currently published, immutable settings snapshot.
+
+    Readers never take a lock nor copy: this returns the last snapshot
+    published by get_settings() or a settings watcher. Only the first call
+    (or a call after the application assigned jgtcore.core.settings) builds one.
+
+    Args:
+        custom_path: Optional custom settings path; when given, the settings
+            are (re)loaded for it through get_settings()
+
+    Returns:
+        SettingsSnapshot instance
+    """
+    global _settings_published
+    source, snapshot = _settings_published
+    if custom_path is None and source is not None and source is settings:
+        return snapshot
+
+    current = get_settings(custom_path)
+    with _settings_write_lock:
+        source, snapshot = _settings_published
+        if source is not current:
+            snapshot = SettingsSnapshot(current, snapshot.version + 1)
+            _settings_published = (current, snapshot)
+    return snapshot
+
+
+def _settings_resolver() -> Any:
+    """ArgResolver for get_settings(): compiled when it is the published dict."""
+    from .settings.resolver import get_arg_resolver
+
+    current = get_settings()
+    source, snapshot = _settings_published
+    # A dict assigned by the application has no snapshot; read it live
+    return get_arg_resolver(snapshot if source is current else current)
 
 
 def load_arg_default_from_settings(
@@ -225,13 +564,7 @@ def load_arg_default_from_settings(
     Returns:
         Setting value or default
     """
-    global settings
-    if settings is None or len(settings) == 0:
-        settings = load_settings()
-
-    _value = settings.get(argname, default_value)
-    if alias is not None and _value == default_value:
-        _value = settings.get(alias, default_value)  # try alias might be used
+    _value = _settings_resolver().settings_value(argname, default_value, alias)
 
     if from_jgt_env:
         _alias = None if exclude_env_alias else alias
@@ -273,14 +606,7 @@ def load_arg_default_from_settings_if_exist(
     Returns:
         Setting value or None
     """
-    global settings
-    if settings is None or len(settings) == 0:
-        settings = load_settings()
-
-    _value = settings.get(argname, None)
-    if alias is not None and _value == None:
-        _value = settings.get(alias, None)  # try alias might be used
-    return _value
+    return _settings_resolver().settings_value(argname, None, alias)
 
 
 def export_env_if_any(config: Dict[str, Any]) -> None:
@@ -299,10 +625,169 @@ def _set_demo_credential(config: Dict[str, Any], demo: bool = False) -> None:
         config["connection"] = "Demo"
 
 
-def readconfig(
+# Parsed Config Cache
+#
+# readconfig resolves its source once (file path or environment variable) and
+# keeps the parsed dictionary keyed by the file stat.  A config file that
+# appears later higher up in the lookup chain is only picked up after
+# clear_config_cache().
+
+_CONFIG_FILE_CACHE: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+_CONFIG_LOCATIONS: Dict[Tuple[Any, ...], Tuple[str, str]] = {}
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_config_json(json_str: str) -> Dict[str, Any]:
+    """Parse a JSON config string once; the result is shared and read-only."""
+    return json.loads(json_str)
+
+
+def _read_config_file(
+    path: str, fingerprint: Optional[Tuple[int, int, int]] = None
+) -> Dict[str, Any]:
+    """Parse a JSON config file, reusing the cached parse while its stat matches."""
+    compiled = None
+    if fingerprint is not None:
+        cached = _CONFIG_FILE_CACHE.get(path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        compiled = _compiled_snapshots()
+        if compiled is not None:
+            config = compiled.load_compiled_config(path, fingerprint)
+            if config is not None:
+                _CONFIG_FILE_CACHE[path] = (fingerprint, config)
+                return config
+    with open(path, "r") as f:
+        config = json.load(f)
+    if fingerprint is not None:
+        _CONFIG_FILE_CACHE[path] = (fingerprint, config)
+        if compiled is not None:
+            compiled.store_compiled_config(path, fingerprint, config)
+    return config
+
+
+def _home_dir() -> str:
+    """Return the home directory used to resolve config files."""
+    try:
+        home_dir = os.path.expanduser("~")
+    except:
+        home_dir = os.environ["HOME"]
+    if home_dir == "":
+        home_dir = os.environ["HOME"]
+    return home_dir
+
+
+def _locate_config(
+    config_file: str,
+    home_dir: str,
+    config_file_path_env_name: str,
+    config_values_env_name: str,
+    exists: Optional[Callable[[str], bool]] = None,
+    isfile: Optional[Callable[[str], bool]] = None,
+) -> Tuple[str, str]:
+    """
+    Find where the configuration comes from, without parsing it.
+
+    exists/isfile default to the os.path probes; the async loader passes
+    lookups into stats it already gathered concurrently.
+
+    Returns:
+        ("file", path) or ("env", variable name)
+    """
+    exists = exists or os.path.exists
+    isfile = isfile or os.path.isfile
+
+    # if file does not exist try set the path to the file in the HOME
+    if not exists(config_file):
+        config_file = os.path.join(home_dir, config_file)
+    if exists(config_file):
+        return "file", os.path.abspath(config_file)
+
+    config_file = os.path.join(home_dir, config_file)
+    if not isfile(config_file) and os.getenv("JGT_CONFIG_JSON_SECRET"):
+        return "env", "JGT_CONFIG_JSON_SECRET"
+
+    # if file dont exist, try loading from env var JGT_CONFIG
+    if not exists(config_file):
+        if os.getenv(config_values_env_name):
+            return "env", config_values_env_name
+        # if not found, try loading from env var JGT_CONFIG_PATH
+        env_config_file = os.getenv(config_file_path_env_name)
+        if env_config_file:
+            return "file", os.path.abspath(env_config_file)
+
+    if config_file is not None and exists(config_file):
+        return "file", os.path.abspath(config_file)
+
+    # Last attempt to read
+    another_config = "config.json"
+    if not exists(another_config):
+        another_config = os.path.join(os.path.expanduser("~"), ".jgt", "config.json")
+    if not exists(another_config):
+        another_config = "/etc/jgt/config.json"
+    for candidate in (another_config, "/home/jgi/.jgt/config.json", "/etc/jgt/config.json"):
+        if isfile(candidate):
+            return "file", os.path.abspath(candidate)
+
+    raise Exception(
+        f"Configuration not found. Please provide a config file or set the JGT_CONFIG environment variable to the JSON config string. (config_file={config_file})"
+    )
+
+
+def _config_candidates(
+    config_file: str, home_dir: str, config_file_path_env_name: str
+) -> List[str]:
+    """List every path _locate_config may probe, so they can be stat'ed up front."""
+    home_config = os.path.join(home_dir, config_file)
+    candidates = [
+        config_file,
+        home_config,
+        os.path.join(home_dir, home_config),
+        "config.json",
+        os.path.join(os.path.expanduser("~"), ".jgt", "config.json"),
+        "/etc/jgt/config.json",
+        "/home/jgi/.jgt/config.json",
+    ]
+    env_config_file = os.getenv(config_file_path_env_name)
+    if env_config_file:
+        candidates.append(env_config_file)
+    return list(dict.fromkeys(candidates))
+
+
+def _config_location_key(
+    config_file: str,
+    home_dir: str,
+    config_file_path_env_name: str,
+    config_values_env_name: str,
+) -> Tuple[Optional[str], ...]:
+    """Key under which a resolved config location is remembered."""
+    return (
+        config_file,
+        home_dir,
+        os.getcwd(),
+        config_file_path_env_name,
+        config_values_env_name,
+        os.environ.get("JGT_CONFIG_JSON_SECRET"),
+        os.environ.get(config_values_env_name),
+        os.environ.get(config_file_path_env_name),
+    )
+
+
+def _load_located_config(location: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+    """Load a located config source, or None if it vanished."""
+    kind, where = location
+    if kind == "env":
+        value = os.environ.get(where)
+        return _parse_config_json(value) if value else None
+    fingerprint = _stat_fingerprint(where)
+    if fingerprint is None:
+        return None
+    return _read_config_file(where, fingerprint)
+
+
+def _readconfig_shared(
     json_config_str: Optional[str] = None,
     config_file: str = "config.json",
-    export_env: bool = False,
     config_file_path_env_name: str = "JGT_CONFIG_PATH",
     config_values_env_name: str = "JGT_CONFIG",
     force_read_json: bool = False,
@@ -310,158 +795,114 @@ def readconfig(
     use_demo_json_config: bool = False,
 ) -> Dict[str, Any]:
     """
-    Read configuration from various sources.
+    Resolve and parse the configuration through the cache.
 
-    Args:
-        json_config_str: JSON string containing config
-        config_file: Config file name
-        export_env: Whether to export config to environment variables
-        config_file_path_env_name: Environment variable name for config file path
-        config_values_env_name: Environment variable name for config JSON
-        force_read_json: Force reading from default JSON file
-        demo: Whether to use demo credentials
-        use_demo_json_config: Whether to use demo-specific config file
-
-    Returns:
-        Configuration dictionary
+    The returned dictionary is shared with the cache and must not be mutated;
+    see readconfig for the arguments.
     """
     global _JGT_CONFIG_JSON_SECRET
 
-    try:
-        home_dir = os.path.expanduser("~")
-    except:
-        home_dir = os.environ["HOME"]
-    if home_dir == "":
-        home_dir = os.environ["HOME"]
+    home_dir = _home_dir()
 
     # demo_config are assumed to be $HOME/.jgt/config_demo.json
     if demo and use_demo_json_config:
         config_file = os.path.join(home_dir, ".jgt/config_demo.json")
-        # check if exist, advise and raise exception if not
+        # check if exist, advise and fallback if not
         if not os.path.exists(config_file):
             print(
                 f"Configuration not found. create : {config_file} or we will try to use the _demo in the usual config.json"
             )
-            config = readconfig(force_read_json=True)
-            _set_demo_credential(config, demo)
-            return config
+            return _readconfig_shared(force_read_json=True)
 
     # force_read_json are assumed to be $HOME/.jgt/config.json
     if force_read_json:
         config_file = os.path.join(home_dir, ".jgt/config.json")
+        fingerprint = _stat_fingerprint(config_file)
         # check if exist, advise and raise exception if not
-        if not os.path.exists(config_file):
+        if fingerprint is None:
             raise Exception(f"Configuration not found. create : {config_file})")
-        # load and return config
-        with open(config_file, "r") as f:
-            config = json.load(f)
-            if export_env:
-                export_env_if_any(config)
-            _set_demo_credential(config, demo)
-            return config
+        return _read_config_file(config_file, fingerprint)
 
     # Try reading config from JSON string first
     if json_config_str is not None:
-        config = json.loads(json_config_str)
         _JGT_CONFIG_JSON_SECRET = json_config_str
-        if export_env:
-            export_env_if_any(config)
-        _set_demo_credential(config, demo)
-        return config
+        return _parse_config_json(json_config_str)
 
     # Try cached config
     if _JGT_CONFIG_JSON_SECRET is not None:
-        config = json.loads(_JGT_CONFIG_JSON_SECRET)
-        if export_env:
-            export_env_if_any(config)
-        _set_demo_credential(config, demo)
-        return config
+        return _parse_config_json(_JGT_CONFIG_JSON_SECRET)
 
-    config = None
+    location_key = _config_location_key(
+        config_file, home_dir, config_file_path_env_name, config_values_env_name
+    )
+    location = _CONFIG_LOCATIONS.get(location_key)
+    if location is not None:
+        config = _load_located_config(location)
+        if config is not None:
+            return config
+        del _CONFIG_LOCATIONS[location_key]
 
-    # if file does not exist try set the path to the file in the HOME
-    if not os.path.exists(config_file):
-        config_file = os.path.join(home_dir, config_file)
+    location = _locate_config(
+        config_file, home_dir, config_file_path_env_name, config_values_env_name
+    )
+    config = _load_located_config(location)
+    if config is None:
+        # Raises the same FileNotFoundError an unresolvable JGT_CONFIG_PATH did
+        config = _read_config_file(location[1])
+    _CONFIG_LOCATIONS[location_key] = location
+    return config
 
-    if os.path.exists(config_file):
-        with open(config_file, "r") as f:
-            config = json.load(f)
-            if export_env:
-                export_env_if_any(config)
-            _set_demo_credential(config, demo)
-            return config
-    else:
-        config_file = os.path.join(home_dir, config_file)
-        if os.path.isfile(config_file):
-            with open(config_file, "r") as f:
-                config = json.load(f)
-        else:
-            # If config file still not found, try reading from environment variable
-            config_json_str = os.getenv("JGT_CONFIG_JSON_SECRET")
-            if config_json_str:
-                config = json.loads(config_json_str)
-                if export_env:
-                    export_env_if_any(config)
-                _set_demo_credential(config, demo)
-                return config
 
-    # if file dont exist, try loading from env var JGT_CONFIG
-    if not os.path.exists(config_file):
-        config_json_str = os.getenv(config_values_env_name)
+def clear_config_cache() -> None:
+    """Forget the resolved config source and every parsed config."""
+    global _JGT_CONFIG_JSON_SECRET
+    _JGT_CONFIG_JSON_SECRET = None
+    _CONFIG_FILE_CACHE.clear()
+    _CONFIG_LOCATIONS.clear()
+    _parse_config_json.cache_clear()
 
-        if config_json_str:
-            config = json.loads(config_json_str)
-            if export_env:
-                export_env_if_any(config)
-        else:
-            # if not found, try loading from env var JGT_CONFIG_PATH
-            config_file = os.getenv(config_file_path_env_name)
-            if config_file:
-                with open(config_file, "r") as f:
-                    config = json.load(f)
-                    if export_env:
-                        export_env_if_any(config)
-
-    # Read config file
-    if config is None:
-        if config_file is not None and os.path.exists(config_file):
-            with open(config_file, "r") as file:
-                config = json.load(file)
 
-    if config is None:
-        # Last attempt to read
-        try:
-            another_config = "config.json"
-            if not os.path.exists(another_config):
-                another_config = os.path.join(
-                    os.path.expanduser("~"), ".jgt", "config.json"
-                )
-
-            if not os.path.exists(another_config):
-                another_config = "/etc/jgt/config.json"
-            with open(another_config, "r") as file:
-                config = json.load(file)
-        except:
-            pass
-
-        if config is None:
-            try:
-                with open("/home/jgi/.jgt/config.json", "r") as file:
-                    config = json.load(file)
-            except:
-                pass
-        if config is None:
-            try:
-                with open("/etc/jgt/config.json", "r") as file:
-                    config = json.load(file)
-            except:
-                pass
-
-        if config is None:
-            raise Exception(
-                f"Configuration not found. Please provide a config file or set the JGT_CONFIG environment variable to the JSON config string. (config_file={config_file})"
-            )
+def readconfig(
+    json_config_str: Optional[str] = None,
+    config_file: str = "config.json",
+    export_env: bool = False,
+    config_file_path_env_name: str = "JGT_CONFIG_PATH",
+    config_values_env_name: str = "JGT_CONFIG",
+    force_read_json: bool = False,
+    demo: bool = False,
+    use_demo_json_config: bool = False,
+) -> Dict[str, Any]:
+    """
+    Read configuration from various sources.
+
+    The source is resolved and parsed once per process and reparsed only when
+    the config file changes on disk; each call gets its own deep copy with
+    the demo credentials overlaid when requested, so callers may mutate it.
+
+    Args:
+        json_config_str: JSON string containing config
+        config_file: Config file name
+        export_env: Whether to export config to environment variables
+        config_file_path_env_name: Environment variable name for config file path
+        config_values_env_name: Environment variable name for config JSON
+        force_read_json: Force reading from default JSON file
+        demo: Whether to use demo credentials
+        use_demo_json_config: Whether to use demo-specific config file
 
+    Returns:
+        Configuration dictionary
+    """
+    config = copy.deepcopy(
+        _readconfig_shared(
+            json_config_str=json_config_str,
+            config_file=config_file,
+            config_file_path_env_name=config_file_path_env_name,
+            config_values_env_name=config_values_env_name,
+            force_read_json=force_read_json,
+            demo=demo,
+            use_demo_json_config=use_demo_json_config,
+        )
+    )
     if export_env:
         export_env_if_any(config)
     _set_demo_credential(config, demo)
@@ -511,7 +952,7 @@ def is_market_open(
     Check if forex market is currently open.
 
     Args:
-        current_time: Time to check (defaults to now)
+        current_time: Time to check (defaults to now; naive times are UTC)
         exit_cli_if_closed: Whether to exit if market is closed (not recommended for library use)
         market_closed_callback: Callback to call if market is closed
 
@@ -519,24 +960,15 @@ def is_market_open(
         True if market is open
     """
     if current_time is None:
-        current_time = datetime.utcnow()
-
-    # Define market open and close times
-    market_open_time = time(21, 0)  # 21:00 UTC
-    market_close_time = time(21, 15)  # 21:15 UTC
-
-    # Get the current day of the week (0=Monday, 6=Sunday)
-    current_day = current_time.weekday()
-
-    current_time_utc = current_time.time()
-    # Check if the market is open
-    if current_day == 6:  # Sunday
-        if current_time_utc >= market_open_time:
-            return True
-    elif current_day == 4:  # Friday
-        if current_time_utc < market_close_time:
-            return True
-    elif 0 <= current_day < 4:  # Monday to Thursday
+        current_time = datetime.now(timezone.utc)
+    elif current_time.tzinfo is None:
+        current_time = current_time.replace(tzinfo=timezone.utc)
+
+    # Sunday to Friday 17:00 New York (DST-aware, holidays closed), see
+    # jgtcore.timeframe.market
+    from .timeframe.market import is_market_open as _is_open
+
+    if _is_open(current_time):
         return True
 
     if market_closed_callback is not None:
@@ -650,8 +1082,10 @@ def get_config_value(key: str, default: Any = None, demo: bool = False) -> Any:
     Returns:
         Configuration value or default
     """
-    config = readconfig(demo=demo)
-    return config.get(key, default)
+    if demo:
+        return readconfig(demo=demo).get(key, default)
+    # Nested sections are copied so the cached config cannot be altered
+    return copy.deepcopy(_readconfig_shared().get(key, default))
 
 
 def is_demo_mode() -> bool:
@@ -662,7 +1096,7 @@ def is_demo_mode() -> bool:
         True if demo mode is active
     """
     try:
-        config = readconfig()
+        config = _readconfig_shared()
         return config.get("connection", "").lower() == "demo"
     except:
         return False
@@ -672,27 +1106,21 @@ def is_demo_mode() -> bool:
 
 def _resolve_env_variables(config_value):
     """Resolve ${VAR_NAME} placeholders with environment variables."""
-    import re
-    
-    if isinstance(config_value, str):
-        # Replace ${VAR_NAME} with environment variable value
-        pattern = r'\$\{([^}]+)\}'
-        
-        def replace_env_var(match):
-            env_var = match.group(1)
-            return os.getenv(env_var, match.group(0))  # Return original if not found
-            
-        return re.sub(pattern, replace_env_var, config_value)
-    elif isinstance(config_value, dict):
-        return {k: _resolve_env_variables(v) for k, v in config_value.items()}
-    elif isinstance(config_value, list):
-        return [_resolve_env_variables(item) for item in config_value]
-    else:
-        return config_value
+    from .settings.template import resolve_templates
+
+    return resolve_templates(config_value)
+
+
+# .env file name -> (path, stat fingerprint) of the copy last applied
+_ENV_FILES_LOADED: Dict[str, Tuple[str, Optional[Tuple[int, int, int]]]] = {}
 
 
 def _load_env_file(env_file_path=".env.caishen"):
-    """Load environment variables from .env.caishen file."""
+    """Load environment variables from .env.caishen file.
+
+    The file is applied once; later calls only stat the candidates and
+    re-read when the file found (or its mtime/size) changes.
+    """
     # Try multiple potential locations (removed duplicate /src path)
     search_paths = [
         os.path.join(os.getcwd(), env_file_path),  # Current directory
@@ -704,13 +1132,17 @@ def _load_env_file(env_file_path=".env.caishen"):
     # Filter out None values and find existing file
     valid_paths = [path for path in search_paths if path is not None]
     env_path = None
+    fingerprint = None
     
     for path in valid_paths:
-        if os.path.exists(path):
+        fingerprint = _stat_fingerprint(path)
+        if fingerprint is not None:
             env_path = path
             break
     
     if env_path:
+        if _ENV_FILES_LOADED.get(env_file_path) == (env_path, fingerprint):
+            return
         try:
             variables_loaded = 0
             with open(env_path, 'r') as f:
@@ -726,27 +1158,52 @@ def _load_env_file(env_file_path=".env.caishen"):
                         except ValueError:
                             print(f"Warning: Invalid format in {env_file_path} line {line_num}: {line}")
             
+            _ENV_FILES_LOADED[env_file_path] = (env_path, fingerprint)
             if variables_loaded > 0:
                 print(f"Loaded {variables_loaded} environment variables from {env_path}")
                 
         except Exception as e:
             print(f"Warning: Error loading {env_file_path} from {env_path}: {e}")
     else:
+        _ENV_FILES_LOADED.pop(env_file_path, None)
         # Only show warning if file was explicitly requested (not default search)
         if env_file_path != ".env.caishen":
             print(f"Warning: Environment file {env_file_path} not found in any of: {valid_paths}")
 
 
+# (tracing section, compiled templates) for the last shared config seen
+_tracing_compiled: Optional[Tuple[Any, Any]] = None
+
+
 def get_tracing_config(config=None):
-    """Get tracing configuration with environment variable resolution."""
-    if config is None:
-        config = readconfig()
+    """Get tracing configuration with environment variable resolution.
+
+    The tracing section of the shared configuration is compiled once per
+    config object; a config passed by the caller may be edited between
+    calls, so it is compiled every time. Either way the templates are
+    resolved against the current environment and the returned dict is a
+    fresh deep copy the caller may mutate.
+    """
+    global _tracing_compiled
+    shared = config is None
+    if shared:
+        config = _readconfig_shared()
     
     # Load .env.caishen if available
     _load_env_file(".env.caishen")
     
     tracing_config = config.get("tracing", {})
-    if tracing_config:
-        tracing_config = _resolve_env_variables(tracing_config)
-    
-    return tracing_config
+    if not tracing_config:
+        return copy.deepcopy(tracing_config)
+    if not isinstance(tracing_config, dict):
+        return _resolve_env_variables(tracing_config)
+
+    from .settings.template import compile_config
+
+    if not shared:
+        return copy.deepcopy(compile_config(tracing_config).resolve())
+    compiled = _tracing_compiled
+    if compiled is None or compiled[0] is not tracing_config:
+        compiled = (tracing_config, compile_config(tracing_config))
+        _tracing_compiled = compiled
+    return copy.deepcopy(compiled[1].resolve())
@@ -6,6 +6,7 @@ Handles loading environment variables from various sources including
 .env files, JGT-specific configurations, and YAML config files.
 """
 
+import importlib.util
 import os
 from typing import Optional, Dict, Any
 
@@ -17,14 +18,27 @@ except ImportError:
     load_dotenv = None
     HAS_DOTENV = False
 
-# Optional YAML support - graceful fallback to JSON-only if not available
+# Optional YAML support - graceful fallback to JSON-only if not available.
+# ruamel.yaml is only imported when a YAML file is actually read (see _get_yaml).
 try:
-    from ruamel.yaml import YAML
-    yaml = YAML()
-    HAS_YAML = True
+    HAS_YAML = importlib.util.find_spec("ruamel.yaml") is not None
 except ImportError:
-    yaml = None
     HAS_YAML = False
+yaml = None
+
+
+def _get_yaml():
+    """Return the module's ruamel YAML instance, importing it on first use."""
+    global yaml, HAS_YAML
+    if yaml is None and HAS_YAML:
+        try:
+            from ruamel.yaml import YAML
+
+            yaml = YAML()
+        except ImportError:
+            HAS_YAML = False
+    return yaml
+
 
 # JGT Environment constants
 JGT_SUBDIR_NAME = ".jgt"
@@ -174,7 +188,7 @@ def load_jgtyaml_env(config_file: str = "_config.yaml", jgt_key: str = "jgt") ->
     Returns:
         True if file exists and was loaded, False otherwise
     """
-    if not HAS_YAML:
+    if _get_yaml() is None:
         return False
         
     try:
@@ -6,6 +6,9 @@ This module contains FX trading-related functions migrated from jgtutils:
 - Collection management (FXTrades, FXOrders)
 - High-level transaction wrapper (FXTransactWrapper)
 - Data persistence utilities (FXTransactDataHelper)
+- Columnar trade store with vectorized aggregates (FXTradeColumns, optional numpy)
+- Append-only JSONL journal with snapshot compaction (FXTransactJournal)
+- Constant-memory streaming loaders with filters (iter_trades, iter_orders)
 
 Provides core FX trading data handling without CLI dependencies.
 """
@@ -40,6 +43,22 @@ from .transact import (
     sanitize_filename,
 )
 
+from .journal import (
+    FXTransactJournal,
+)
+
+from .stream import (
+    iter_orders,
+    iter_records,
+    iter_trades,
+)
+
+from .columnar import (
+    FXTradeColumns,
+    FXTradeView,
+    HAS_NUMPY,
+)
+
 __all__ = [
     # Core classes
     'FXTrade',
@@ -68,4 +87,17 @@ __all__ = [
     
     # Utilities
     'sanitize_filename',
+    
+    # Journal
+    'FXTransactJournal',
+    
+    # Streaming loaders
+    'iter_trades',
+    'iter_orders',
+    'iter_records',
+    
+    # Columnar storage
+    'FXTradeColumns',
+    'FXTradeView',
+    'HAS_NUMPY',
 ]
\ No newline at end of file
@@ -0,0 +1,408 @@
+"""
+Columnar FX trade store
+
+FXTradeColumns keeps trades as NumPy columns instead of FXTrade objects:
+amount, open_rate, close_rate and pl as float64 arrays (None is NaN),
+instrument and buy_sell as categorical int32 codes, and the remaining
+fields (trade_id, open/close time, extras) as plain lists. Aggregates such
+as pl_by_instrument() and net_exposure() are single np.bincount calls;
+indexing or iterating yields FXTrade views that read and write the columns.
+
+The float columns only hold numbers: amount, open_rate, close_rate and pl
+must be int, float (NumPy scalars included) or None. Anything else, numeric
+strings too, raises a ValueError naming the field, where the list-backed
+FXTrades would have kept the value as given.
+
+Used as the backing list of FXTrades(columnar=True), or directly:
+
+    columns = FXTradeColumns.from_dicts(data["trades"])
+    columns.pl_by_instrument()  # {"EUR/USD": 1520.5, ...}
+"""
+
+import importlib.util
+import numbers
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .transact import FXTrade
+
+# Optional NumPy support; numpy is only imported when a store is created.
+try:
+    HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+except ImportError:
+    HAS_NUMPY = False
+np = None
+
+# Float columns; None is stored as NaN
+FLOAT_COLUMNS = ('amount', 'open_rate', 'close_rate', 'pl')
+# Categorical columns: int32 codes into a per-store list of values
+CATEGORY_COLUMNS = ('instrument', 'buy_sell')
+# Columns kept as Python lists
+OBJECT_COLUMNS = ('trade_id', 'open_time', 'close_time')
+
+_INITIAL_CAPACITY = 64
+
+
+def _get_numpy():
+    """Return the numpy module, importing it on first use."""
+    global np
+    if np is None:
+        if not HAS_NUMPY:
+            raise ImportError("numpy is required for columnar FX trade storage")
+        import numpy
+
+        np = numpy
+    return np
+
+
+def _side_sign(buy_sell: Any) -> int:
+    """+1 for buys, -1 for sells, 0 when the side is unknown."""
+    if not isinstance(buy_sell, str) or not buy_sell:
+        return 0
+    side = buy_sell[0].upper()
+    return 1 if side == 'B' else -1 if side == 'S' else 0
+
+
+def _column_float(name: str, value: Any) -> float:
+    """Value to store in a float column (None is NaN)."""
+    if value is None:
+        return float('nan')
+    if isinstance(value, numbers.Real) and not isinstance(value, bool):
+        return float(value)
+    raise ValueError(
+        f"{name} must be a number or None in a columnar store, got {type(value).__name__} {value!r}"
+    )
+
+
+def _float_property(name: str) -> property:
+    def get(self):
+        value = self._store._floats[name][self._row]
+        return None if value != value else float(value)
+
+    def set(self, value):
+        self._store._floats[name][self._row] = _column_float(name, value)
+
+    return property(get, set, doc=f"{name} (float column)")
+
+
+def _category_property(name: str) -> property:
+    def get(self):
+        store = self._store
+        return store._categories[name][store._codes[name][self._row]]
+
+    def set(self, value):
+        store = self._store
+        store._codes[name][self._row] = store._encode(name, value)
+
+    return property(get, set, doc=f"{name} (categorical column)")
+
+
+def _object_property(name: str) -> property:
+    def get(self):
+        return self._store._objects[name][self._row]
+
+    def set(self, value):
+        self._store._objects[name][self._row] = value
+
+    return property(get, set, doc=f"{name} (object column)")
+
+
+class FXTradeView(FXTrade):
+    """
+    FXTrade reading and writing one row of an FXTradeColumns store.
+
+    Views are valid until rows before them are removed from the store, or
+    their row is swapped by swap_remove().
+    """
+
+    __slots__ = ('_store', '_row')
+
+    def __init__(self, store: 'FXTradeColumns', row: int):
+        object.__setattr__(self, '_store', store)
+        object.__setattr__(self, '_row', row)
+
+    @property
+    def _extras(self):
+        return self._store._extras[self._row]
+
+    @_extras.setter
+    def _extras(self, value):
+        self._store._extras[self._row] = value
+
+    def detach(self) -> FXTrade:
+        """Copy the row into a standalone FXTrade."""
+        return FXTrade.from_dict({**self.to_dict(), **self.extras})
+
+    def __reduce__(self):
+        # Pickle/copy as a detached FXTrade
+        return FXTrade.from_dict, ({**self.to_dict(), **self.extras},)
+
+    def __repr__(self):
+        return f"FXTradeView(row={self._row}, trade_id={self.trade_id!r})"
+
+
+for _name in FLOAT_COLUMNS:
+    setattr(FXTradeView, _name, _float_property(_name))
+for _name in CATEGORY_COLUMNS:
+    setattr(FXTradeView, _name, _category_property(_name))
+for _name in OBJECT_COLUMNS:
+    setattr(FXTradeView, _name, _object_property(_name))
+del _name
+
+
+class FXTradeColumns:
+    """
+    Append-friendly columnar store of FX trades.
+
+    Behaves like a list of FXTrade (append, len, indexing, iteration,
+    deletion) while keeping the numeric fields in NumPy arrays.
+    """
+
+    def __init__(self, trades: Optional[Iterable[Any]] = None):
+        """
+        Initialize the store.
+
+        Args:
+            trades: FXTrade objects or trade dictionaries to load
+
+        Raises:
+            ImportError: If numpy is not installed
+            ValueError: If a float field of a trade is not a number or None
+        """
+        np = _get_numpy()
+        self._size = 0
+        self._floats = {name: np.empty(_INITIAL_CAPACITY) for name in FLOAT_COLUMNS}
+        self._codes = {name: np.empty(_INITIAL_CAPACITY, dtype=np.int32) for name in CATEGORY_COLUMNS}
+        self._categories: Dict[str, List[Any]] = {name: [] for name in CATEGORY_COLUMNS}
+        self._lookup: Dict[str, Dict[Any, int]] = {name: {} for name in CATEGORY_COLUMNS}
+        self._objects: Dict[str, List[Any]] = {name: [] for name in OBJECT_COLUMNS}
+        self._extras: List[Optional[tuple]] = []
+        if trades is not None:
+            self.extend(trades)
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[FXTrade]) -> 'FXTradeColumns':
+        """Build a store from FXTrade objects."""
+        return cls(trades)
+
+    @classmethod
+    def from_dicts(cls, rows: Iterable[Dict[str, Any]]) -> 'FXTradeColumns':
+        """Build a store from trade dictionaries without creating FXTrade objects."""
+        return cls(rows)
+
+    # Storage
+
+    def _encode(self, name: str, value: Any) -> int:
+        lookup = self._lookup[name]
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(self._categories[name])
+            self._categories[name].append(value)
+        return code
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._floats['amount'])
+        if size <= capacity:
+            return
+        np = _get_numpy()
+        while capacity < size:
+            capacity *= 2
+        for columns in (self._floats, self._codes):
+            for name, column in columns.items():
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:self._size] = column[:self._size]
+                columns[name] = grown
+
+    def check(self, trade: Any) -> None:
+        """
+        Check that a trade can be stored, without storing it.
+
+        Args:
+            trade: FXTrade object or trade dictionary
+
+        Raises:
+            ValueError: If a float field is not a number or None
+        """
+        get = trade.get if isinstance(trade, dict) else lambda name: getattr(trade, name, None)  # noqa: E731
+        for name in FLOAT_COLUMNS:
+            _column_float(name, get(name))
+
+    def append(self, trade: Any) -> None:
+        """
+        Append a trade.
+
+        Args:
+            trade: FXTrade object or trade dictionary
+
+        Raises:
+            ValueError: If a float field is not a number or None
+        """
+        if isinstance(trade, dict):
+            get = trade.get
+            extras = {k: v for k, v in trade.items() if k not in FXTrade._FIELDS}
+        else:
+            get = lambda name: getattr(trade, name, None)  # noqa: E731
+            extras = trade.extras
+        floats = [(name, _column_float(name, get(name))) for name in FLOAT_COLUMNS]
+        row = self._size
+        self._reserve(row + 1)
+        for name, value in floats:
+            self._floats[name][row] = value
+        for name in CATEGORY_COLUMNS:
+            self._codes[name][row] = self._encode(name, get(name))
+        for name in OBJECT_COLUMNS:
+            self._objects[name].append(get(name))
+        self._extras.append(None)
+        self._size = row + 1
+        if extras:
+            FXTradeView(self, row)._set_extras(extras)
+
+    def extend(self, trades: Iterable[Any]) -> None:
+        """Append several trades."""
+        for trade in trades:
+            self.append(trade)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [FXTradeView(self, row) for row in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("trade index out of range")
+        return FXTradeView(self, index)
+
+    def __setitem__(self, index: int, trade: Any) -> None:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("trade index out of range")
+        if isinstance(trade, dict):
+            trade = FXTrade.from_dict(trade)
+        # Check the float fields first so a bad value leaves the row intact
+        for name in FLOAT_COLUMNS:
+            _column_float(name, getattr(trade, name, None))
+        view = FXTradeView(self, index)
+        for name in FXTrade._FIELDS:
+            setattr(view, name, getattr(trade, name, None))
+        view._set_extras(trade.extras)
+
+    def __delitem__(self, index: int) -> None:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("trade index out of range")
+        size = self._size
+        for columns in (self._floats, self._codes):
+            for column in columns.values():
+                column[index:size - 1] = column[index + 1:size]
+        for column in self._objects.values():
+            del column[index]
+        del self._extras[index]
+        self._size = size - 1
+
+    def swap_remove(self, index: int) -> None:
+        """Delete a row in O(1) by moving the last row into its place."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("trade index out of range")
+        last = self._size - 1
+        if index != last:
+            for columns in (self._floats, self._codes):
+                for column in columns.values():
+                    column[index] = column[last]
+            for column in self._objects.values():
+                column[index] = column[last]
+            self._extras[index] = self._extras[last]
+        for column in self._objects.values():
+            column.pop()
+        self._extras.pop()
+        self._size = last
+    
+    def pop(self, index: int = -1) -> FXTrade:
+        """Remove a row and return it as a detached FXTrade."""
+        trade = self[index].detach()
+        del self[index]
+        return trade
+
+    def __iter__(self) -> Iterator[FXTrade]:
+        for row in range(self._size):
+            yield FXTradeView(self, row)
+
+    def column(self, name: str) -> Any:
+        """
+        Get a column for the live rows.
+
+        Args:
+            name: Field name
+
+        Returns:
+            float64 array for numeric fields, array of values for
+            categorical fields, list for the other fields
+        """
+        if name in self._floats:
+            return self._floats[name][:self._size]
+        if name in self._codes:
+            np = _get_numpy()
+            categories = np.asarray(self._categories[name], dtype=object)
+            return categories[self._codes[name][:self._size]]
+        if name in self._objects:
+            return list(self._objects[name])
+        raise KeyError(name)
+
+    def to_trades(self) -> List[FXTrade]:
+        """Detached FXTrade objects for every row."""
+        return [view.detach() for view in self]
+
+    # Aggregates
+
+    def _by_category(self, name: str, weights: Any) -> Dict[Any, float]:
+        np = _get_numpy()
+        categories = self._categories[name]
+        codes = self._codes[name][:self._size]
+        totals = np.bincount(codes, weights=weights, minlength=len(categories))
+        present = np.bincount(codes, minlength=len(categories)) > 0
+        return {categories[code]: float(totals[code]) for code in np.flatnonzero(present)}
+
+    def _signs(self) -> Any:
+        np = _get_numpy()
+        signs = np.array([_side_sign(side) for side in self._categories['buy_sell']], dtype=np.float64)
+        if not len(signs):
+            return np.zeros(self._size)
+        return signs[self._codes['buy_sell'][:self._size]]
+
+    def total_pl(self) -> float:
+        """Sum of P/L over all trades (missing P/L counts as 0)."""
+        np = _get_numpy()
+        return float(np.nansum(self._floats['pl'][:self._size]))
+
+    def pl_by_instrument(self) -> Dict[str, float]:
+        """Sum of P/L per instrument (missing P/L counts as 0)."""
+        np = _get_numpy()
+        return self._by_category('instrument', np.nan_to_num(self._floats['pl'][:self._size]))
+
+    def net_exposure(self) -> Dict[str, float]:
+        """Signed amount per instrument (buys positive, sells negative)."""
+        np = _get_numpy()
+        amounts = np.nan_to_num(self._floats['amount'][:self._size])
+        return self._by_category('instrument', amounts * self._signs())
+
+    def exposure_by_side(self) -> Dict[str, float]:
+        """Total amount per buy_sell value."""
+        np = _get_numpy()
+        return self._by_category('buy_sell', np.nan_to_num(self._floats['amount'][:self._size]))
+
+    def average_open_rate(self) -> Dict[str, float]:
+        """Amount-weighted average open rate per instrument."""
+        np = _get_numpy()
+        amounts = np.abs(np.nan_to_num(self._floats['amount'][:self._size]))
+        rates = self._floats['open_rate'][:self._size]
+        amounts = np.where(np.isnan(rates), 0.0, amounts)
+        weighted = self._by_category('instrument', amounts * np.nan_to_num(rates))
+        totals = self._by_category('instrument', amounts)
+        return {
+            instrument: weighted[instrument] / total if total else float('nan')
+            for instrument, total in totals.items()
+        }
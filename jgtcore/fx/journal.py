@@ -0,0 +1,281 @@
+"""
+Append-only journal for FX trades and orders
+
+FXTransactJournal keeps an FXTransactWrapper in memory and persists each
+change as one compact JSON line appended to a journal file, instead of
+rewriting the whole collection on every save:
+
+    {"seq":1,"op":"add","kind":"trade","data":{"trade_id":"T1",...}}
+    {"seq":2,"op":"update","kind":"order","id":"O7","fields":{"status":"executed"}}
+    {"seq":3,"op":"rename","kind":"trade","id":"T1","data":{"trade_id":"T9",...}}
+    {"seq":4,"op":"remove","kind":"trade","id":"T1"}
+
+A change is checked first (a record the collection would reject is never
+journaled), then written, then made by applying that same entry, so memory
+always matches what a reload would replay. If applying still fails, the
+entry is cut from the journal again. Id changes are journaled as "rename"
+(remove the old id, then upsert the full record).
+
+Every compact_every entries (or on compact()) the collection is written to a
+snapshot file (the save_wrapper_json layout plus the "journal_seq" of the
+last entry it holds, replaced atomically) and the journal is truncated.
+Loading replays the journal entries newer than the snapshot, so a crash
+between the two steps does not apply an entry twice, and a partially
+written last line is dropped.
+"""
+
+import json
+import os
+from typing import Any, Dict, Optional, Union
+
+from .transact import FXOrder, FXTrade, FXTransactWrapper
+
+JOURNAL_SNAPSHOT_SUFFIX = ".snapshot.json"
+DEFAULT_COMPACT_EVERY = 10000
+
+
+def _dumps(record: Dict[str, Any]) -> str:
+    return json.dumps(record, separators=(',', ':'))
+
+
+class FXTransactJournal:
+    """
+    Trades and orders persisted as a snapshot plus an append-only journal.
+
+    Usage:
+        with FXTransactJournal("fxtransact.jsonl") as journal:
+            journal.add_trade({"trade_id": "T1", "instrument": "EUR/USD"})
+            journal.update_order("O7", status="executed")
+    """
+
+    def __init__(
+        self,
+        journal_path: str,
+        snapshot_path: Optional[str] = None,
+        compact_every: Optional[int] = DEFAULT_COMPACT_EVERY,
+        fsync: bool = False,
+    ):
+        """
+        Open a journal, replaying snapshot and journal into memory.
+
+        Args:
+            journal_path: JSONL journal file (created if missing)
+            snapshot_path: Snapshot file (defaults to journal_path +
+                ".snapshot.json")
+            compact_every: Compact after this many journal entries
+                (None = only on compact())
+            fsync: fsync the journal after every entry
+        """
+        self.journal_path = journal_path
+        self.snapshot_path = snapshot_path or journal_path + JOURNAL_SNAPSHOT_SUFFIX
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self._file = None
+        self.entries = 0
+        # Sequence number of the last entry written or held by the snapshot
+        self.seq = 0
+        self.wrapper = self._load()
+
+    # Loading
+
+    def _load(self) -> FXTransactWrapper:
+        wrapper = FXTransactWrapper()
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'r') as f:
+                data = json.load(f)
+            self.seq = data.get('journal_seq', 0)
+            wrapper = FXTransactWrapper.from_dict(data)
+        snapshot_seq = self.seq
+        if not os.path.exists(self.journal_path):
+            return wrapper
+
+        valid_end = 0
+        with open(self.journal_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    # Partially written last entry (crash mid-append)
+                    break
+                valid_end += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    print(f"Warning: skipping unreadable journal entry in {self.journal_path}")
+                    continue
+                seq = record.get('seq')
+                if seq is not None:
+                    if seq <= snapshot_seq:
+                        # Already in the snapshot (crash before truncation)
+                        continue
+                    self.seq = max(self.seq, seq)
+                try:
+                    self._apply(wrapper, record)
+                except (KeyError, TypeError, ValueError) as e:
+                    print(f"Warning: skipping journal entry that cannot be applied in {self.journal_path}: {e}")
+                    continue
+                self.entries += 1
+        if valid_end != os.path.getsize(self.journal_path):
+            with open(self.journal_path, 'rb+') as f:
+                f.truncate(valid_end)
+        return wrapper
+
+    @staticmethod
+    def _apply(wrapper: FXTransactWrapper, record: Dict[str, Any]) -> Any:
+        """Apply one journal entry to the collections."""
+        op = record.get('op')
+        collection = wrapper.trades if record.get('kind') == 'trade' else wrapper.orders
+        if op in ('add', 'upsert'):
+            return collection.upsert(record['data'])
+        if op == 'update':
+            if record['id'] in collection:
+                return collection.update(record['id'], **record['fields'])
+        elif op == 'rename':
+            if record['id'] in collection:
+                collection.remove(record['id'])
+            return collection.upsert(record['data'])
+        elif op == 'remove':
+            if record['id'] in collection:
+                return collection.remove(record['id'])
+        else:
+            print(f"Warning: unknown journal operation {op!r}")
+        return None
+
+    # Journal
+
+    def _commit(self, record: Dict[str, Any]) -> Any:
+        """Write an entry, then apply it to the in-memory collections."""
+        record = {'seq': self.seq + 1, **record}
+        # Serialize first: an entry that cannot be written changes nothing
+        line = _dumps(record) + '\n'
+        if self._file is None:
+            self._file = open(self.journal_path, 'a')
+        start = self._file.tell()
+        self._file.write(line)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        try:
+            result = self._apply(self.wrapper, record)
+        except Exception:
+            # Keep the journal replayable: drop the entry that failed
+            self._file.truncate(start)
+            self._file.flush()
+            raise
+        self.seq = record['seq']
+        self.entries += 1
+        if self.compact_every is not None and self.entries >= self.compact_every:
+            self.compact()
+        return result
+
+    @staticmethod
+    def _check(collection, data: Dict[str, Any]) -> None:
+        """Raise if the collection's store would reject a record built from data."""
+        check = getattr(collection._items(), 'check', None)
+        if check is not None:
+            check(collection._coerce(data))
+
+    def _add(self, op: str, kind: str, collection, record: Union[FXTrade, FXOrder]) -> Any:
+        record_id = getattr(record, collection._ID_FIELD)
+        if op == 'add' and record_id is not None and record_id in collection:
+            raise ValueError(f"Duplicate {collection._ID_FIELD}: {record_id}")
+        self._check(collection, record.to_dict())
+        self._commit({'op': op, 'kind': kind, 'data': record.to_dict()})
+        if record_id is None:
+            return collection._items()[-1]
+        return collection.get(record_id)
+
+    def _update(self, kind: str, collection, record_id: Any, fields: Dict[str, Any]) -> Any:
+        record = collection.get(record_id)
+        if record is None:
+            raise KeyError(record_id)
+        new_id = fields.get(collection._ID_FIELD, record_id)
+        self._check(collection, {**record.to_dict(), **fields})
+        if new_id == record_id:
+            return self._commit({'op': 'update', 'kind': kind, 'id': record_id, 'fields': fields})
+        if new_id is None or new_id in collection:
+            raise ValueError(f"Duplicate {collection._ID_FIELD}: {new_id}")
+        data = {**record.to_dict(), **fields}
+        self._commit({'op': 'rename', 'kind': kind, 'id': record_id, 'data': data})
+        return collection.get(new_id)
+
+    def _remove(self, kind: str, collection, record_id: Any) -> Any:
+        if record_id not in collection:
+            raise KeyError(record_id)
+        return self._commit({'op': 'remove', 'kind': kind, 'id': record_id})
+
+    # Trades
+
+    @property
+    def trades(self):
+        """In-memory FXTrades collection."""
+        return self.wrapper.trades
+
+    def add_trade(self, trade_data: Union[FXTrade, str, Dict[str, Any]]) -> FXTrade:
+        """Add a trade (rejecting duplicate ids) and journal it; returns the stored trade."""
+        return self._add('add', 'trade', self.trades, self.trades._coerce(trade_data))
+
+    def upsert_trade(self, trade_data: Union[FXTrade, str, Dict[str, Any]]) -> FXTrade:
+        """Insert or replace a trade and journal it; returns the stored trade."""
+        return self._add('upsert', 'trade', self.trades, self.trades._coerce(trade_data))
+
+    def update_trade(self, record_id: Any, **fields: Any) -> FXTrade:
+        """Change fields of a trade and journal the change (a new id as a rename)."""
+        return self._update('trade', self.trades, record_id, fields)
+
+    def remove_trade(self, trade_id: Any) -> FXTrade:
+        """Remove a trade and journal the removal."""
+        return self._remove('trade', self.trades, trade_id)
+
+    # Orders
+
+    @property
+    def orders(self):
+        """In-memory FXOrders collection."""
+        return self.wrapper.orders
+
+    def add_order(self, order_data: Union[FXOrder, str, Dict[str, Any]]) -> FXOrder:
+        """Add an order (rejecting duplicate ids) and journal it; returns the stored order."""
+        return self._add('add', 'order', self.orders, self.orders._coerce(order_data))
+
+    def upsert_order(self, order_data: Union[FXOrder, str, Dict[str, Any]]) -> FXOrder:
+        """Insert or replace an order and journal it; returns the stored order."""
+        return self._add('upsert', 'order', self.orders, self.orders._coerce(order_data))
+
+    def update_order(self, record_id: Any, **fields: Any) -> FXOrder:
+        """Change fields of an order and journal the change (a new id as a rename)."""
+        return self._update('order', self.orders, record_id, fields)
+
+    def remove_order(self, order_id: Any) -> FXOrder:
+        """Remove an order and journal the removal."""
+        return self._remove('order', self.orders, order_id)
+
+    # Compaction
+
+    def compact(self) -> None:
+        """Write the collection to the snapshot and truncate the journal."""
+        tmp_path = self.snapshot_path + '.tmp'
+        data = self.wrapper.to_dict()
+        data['journal_seq'] = self.seq
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+
+        if self._file is not None:
+            self._file.close()
+        self._file = open(self.journal_path, 'w')
+        self.entries = 0
+
+    def close(self) -> None:
+        """Close the journal file (the journal stays on disk)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'FXTransactJournal':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,284 @@
+"""
+Streaming loaders for large FX transaction files
+
+iter_trades() and iter_orders() read a file in fixed-size chunks and yield
+one record at a time, so memory stays flat however large the file is. Both
+layouts written by this package are recognised:
+
+    {"trades": [{...}, {...}], "orders": [...]}   # save_*_json layout
+    {"trade_id": "T1", ...}                       # JSONL, one record per line
+    {"trade_id": "T2", ...}
+
+A top-level object holding a "trades" or "orders" key is read as the
+save_*_json layout whatever its other keys are; anything else is JSONL.
+A bare top-level list of records is accepted too. Filters are applied to
+the decoded dictionaries, before any FXTrade/FXOrder is built:
+
+    for trade in iter_trades("archive.json", instrument="EUR/USD"):
+        ...
+
+Journal files (FXTransactJournal) hold operations rather than records and
+should be opened with FXTransactJournal instead.
+"""
+
+import json
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from .transact import FXOrder, FXTrade
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Top-level keys of the save_*_json layouts
+COLLECTION_KEYS = ('trades', 'orders')
+
+_WHITESPACE = ' \t\r\n'
+_NUMBER_CHARS = '0123456789.eE+-'
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+
+class _JSONStream:
+    """Incremental JSON scanner over a text file."""
+
+    def __init__(self, f, chunk_size: int):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._mark: Optional[int] = None
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read the next chunk, dropping consumed text. False at end of file."""
+        if self._eof:
+            return False
+        data = self._file.read(self._chunk_size)
+        if not data:
+            self._eof = True
+            return False
+        cut = self._pos if self._mark is None else self._mark
+        if cut:
+            self._buf = self._buf[cut:]
+            self._pos -= cut
+            if self._mark is not None:
+                self._mark -= cut
+        self._buf += data
+        return True
+
+    def mark(self) -> None:
+        self._mark = self._pos
+
+    def reset(self) -> None:
+        self._pos = self._mark
+        self._mark = None
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of file)."""
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON stream, found {found or 'end of file'!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number running up to the buffer end ("0." of "0.5") may
+            # continue in the next chunk
+            if (
+                isinstance(value, (int, float))
+                and not self._buf[end:].strip(_NUMBER_CHARS)
+                and self._fill()
+            ):
+                continue
+            self._pos = end
+            return value
+
+    def items(self) -> Iterator[Any]:
+        """Decode the elements of the array at the current position."""
+        self.expect('[')
+        if self.peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            found = self.peek()
+            self._pos += 1
+            if found == ']':
+                return
+            if found != ',':
+                raise ValueError(f"Expected ',' or ']' in JSON array, found {found or 'end of file'!r}")
+
+    def keys(self) -> Iterator[str]:
+        """Walk the object at the current position; the caller consumes each value."""
+        self.expect('{')
+        if self.peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(':')
+            yield key
+            found = self.peek()
+            self._pos += 1
+            if found == '}':
+                return
+            if found != ',':
+                raise ValueError(f"Expected ',' or '}}' in JSON object, found {found or 'end of file'!r}")
+
+    def skip(self) -> None:
+        """Consume the value at the current position (arrays element by element)."""
+        if self.peek() == '[':
+            for _ in self.items():
+                pass
+        else:
+            self.value()
+
+    def has_key(self, names) -> bool:
+        """Whether the object at the current position has one of names, without consuming it."""
+        self.mark()
+        try:
+            for key in self.keys():
+                if key in names:
+                    return True
+                self.skip()
+            return False
+        finally:
+            self.reset()
+
+
+def _matcher(predicate: Optional[Predicate], filters: Dict[str, Any]) -> Optional[Predicate]:
+    """Combine field filters and a predicate into one test on record dicts."""
+    if not filters:
+        return predicate
+    tests = []
+    for field, wanted in filters.items():
+        if isinstance(wanted, (set, frozenset, list, tuple)):
+            wanted = frozenset(wanted)
+            tests.append(lambda record, f=field, w=wanted: record.get(f) in w)
+        else:
+            tests.append(lambda record, f=field, w=wanted: record.get(f) == w)
+    if predicate is not None:
+        tests.append(predicate)
+    return lambda record: all(test(record) for test in tests)
+
+
+def iter_records(
+    filepath: str,
+    key: str,
+    predicate: Optional[Predicate] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **filters: Any,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream record dictionaries from a JSON or JSONL file.
+
+    Args:
+        filepath: Source file path
+        key: Collection to read from the {"trades": [...]} layout
+            ("trades" or "orders"); ignored for JSONL and bare lists
+        predicate: Optional test on each record dictionary
+        chunk_size: Characters read per chunk
+        **filters: Field values records must match; a set, list or tuple
+            matches any of its values
+
+    Yields:
+        Record dictionaries
+
+    Raises:
+        ValueError: If the file is not valid JSON/JSONL
+    """
+    matches = _matcher(predicate, filters)
+    with open(filepath, 'r') as f:
+        stream = _JSONStream(f, chunk_size)
+        first = stream.peek()
+        if first == '[':
+            records = stream.items()
+        elif first == '{' and stream.has_key(COLLECTION_KEYS):
+            records = _collection(stream, key)
+        elif first in ('{', ''):
+            records = _lines(stream)
+        else:
+            raise ValueError(f"Unexpected {first!r} at the start of {filepath}")
+        for record in records:
+            if matches is None or matches(record):
+                yield record
+
+
+def _collection(stream: _JSONStream, key: str) -> Iterator[Dict[str, Any]]:
+    for name in stream.keys():
+        if name == key and stream.peek() == '[':
+            yield from stream.items()
+            # Nothing after the wanted list is needed
+            return
+        stream.skip()
+
+
+def _lines(stream: _JSONStream) -> Iterator[Dict[str, Any]]:
+    while stream.peek():
+        record = stream.value()
+        if not isinstance(record, dict):
+            raise ValueError(f"Expected a JSON object per line, got {type(record).__name__}")
+        yield record
+
+
+def iter_trades(
+    filepath: str,
+    predicate: Optional[Predicate] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **filters: Any,
+) -> Iterator[FXTrade]:
+    """
+    Stream trades from a trades/wrapper JSON file or a JSONL file.
+
+    Args:
+        filepath: Source file path
+        predicate: Optional test on each trade dictionary
+        chunk_size: Characters read per chunk
+        **filters: Field values trades must match (e.g. instrument="EUR/USD")
+
+    Yields:
+        FXTrade objects, only for matching records
+    """
+    for record in iter_records(filepath, 'trades', predicate, chunk_size, **filters):
+        yield FXTrade.from_dict(record)
+
+
+def iter_orders(
+    filepath: str,
+    predicate: Optional[Predicate] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **filters: Any,
+) -> Iterator[FXOrder]:
+    """
+    Stream orders from an orders/wrapper JSON file or a JSONL file.
+
+    Args:
+        filepath: Source file path
+        predicate: Optional test on each order dictionary
+        chunk_size: Characters read per chunk
+        **filters: Field values orders must match (e.g. status="waiting")
+
+    Yields:
+        FXOrder objects, only for matching records
+    """
+    for record in iter_records(filepath, 'orders', predicate, chunk_size, **filters):
+        yield FXOrder.from_dict(record)
@@ -4,6 +4,10 @@ FX trading utilities for jgtcore
 Core FX transaction data handling migrated from jgtutils.
 Provides data structures and utilities for managing FX trades and orders
 without CLI dependencies.
+
+FXTrade and FXOrder keep their core fields in __slots__; any other keyword
+is stored in one per-record (keys, *values) tuple, allocated only when used,
+whose keys tuple is shared by records with the same extra names.
 """
 
 import datetime
@@ -50,13 +54,91 @@ def sanitize_filename(filename: str) -> str:
     return filename.strip()
 
 
-class FXTrade:
+# Interned extras key tuples, shared by every record with the same extra names.
+# Bounded so that records with ever-changing extra names cannot grow it
+# without limit; past the cap, new key tuples are simply not shared.
+_EXTRA_KEYS: Dict[tuple, tuple] = {}
+_MAX_EXTRA_KEYS = 1024
+
+
+class _SlottedRecord:
+    """
+    Base for compact records: core fields in __slots__, other attributes in
+    one lazily allocated extras slot.
+    
+    The extras slot is None or a tuple (keys, *values) whose keys tuple is
+    interned, so records sharing extra names only pay for their values.
+    """
+    
+    __slots__ = ('_extras',)
+    
+    def __getattr__(self, name: str) -> Any:
+        # Only called when the slots have no such attribute
+        if name.startswith('__') or name == '_extras':
+            raise AttributeError(name)
+        extras = self._extras
+        if extras is not None and name in extras[0]:
+            return extras[extras[0].index(name) + 1]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        try:
+            object.__setattr__(self, name, value)
+        except AttributeError:
+            extras = self.extras
+            extras[name] = value
+            self._set_extras(extras)
+    
+    def __delattr__(self, name: str) -> None:
+        extras = self.extras
+        if name in extras:
+            del extras[name]
+            self._set_extras(extras)
+        else:
+            object.__delattr__(self, name)
+    
+    def _set_extras(self, extras: Dict[str, Any]) -> None:
+        if not extras:
+            object.__setattr__(self, '_extras', None)
+            return
+        keys = tuple(extras)
+        interned = _EXTRA_KEYS.get(keys)
+        if interned is not None:
+            keys = interned
+        elif len(_EXTRA_KEYS) < _MAX_EXTRA_KEYS:
+            _EXTRA_KEYS[keys] = keys
+        object.__setattr__(self, '_extras', (keys,) + tuple(extras.values()))
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = {name: getattr(self, name) for name in self._FIELDS}
+        state.update(self.extras)
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        object.__setattr__(self, '_extras', None)
+        for name, value in state.items():
+            setattr(self, name, value)
+    
+    @property
+    def extras(self) -> Dict[str, Any]:
+        """Additional (non-core) attributes passed as keywords (a copy)."""
+        extras = self._extras
+        if extras is None:
+            return {}
+        return dict(zip(extras[0], extras[1:]))
+
+
+class FXTrade(_SlottedRecord):
     """
     Represents an FX trade with comprehensive trade data.
     
     Core data structure for individual FX trading transactions.
     """
     
+    _FIELDS = ('trade_id', 'instrument', 'amount', 'buy_sell', 'open_rate',
+               'close_rate', 'open_time', 'close_time', 'pl')
+    __slots__ = _FIELDS
+    
     def __init__(self, trade_id: Optional[str] = None, instrument: Optional[str] = None,
                  amount: Optional[float] = None, buy_sell: Optional[str] = None,
                  open_rate: Optional[float] = None, close_rate: Optional[float] = None,
@@ -77,6 +159,7 @@ class FXTrade:
             pl: Profit/loss
             **kwargs: Additional trade data
         """
+        object.__setattr__(self, '_extras', None)
         self.trade_id = trade_id
         self.instrument = instrument
         self.amount = amount
@@ -88,8 +171,8 @@ class FXTrade:
         self.pl = pl
         
         # Store additional attributes
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+        if kwargs:
+            self._set_extras(kwargs)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert trade to dictionary."""
@@ -127,43 +210,344 @@ class FXTrade:
         return cls.from_dict(data)
 
 
-class FXTrades:
+class _IndexedCollection:
+    """
+    Hash indexes over a record collection: by id and by a few fields.
+    
+    The indexes are built on first lookup and kept in sync by the
+    collection's own mutators (add, upsert, update, remove). Lookups and
+    replacement are O(1): a position map locates each record. remove()
+    keeps the list order; the positions after the removed record are
+    refreshed lazily, the next time one of them is needed. If the list is
+    replaced or changes length behind the collection's back, the indexes
+    are rebuilt on the next lookup.
+    """
+    
+    _ITEMS = ''
+    _ID_FIELD = ''
+    _INDEXED_FIELDS: tuple = ()
+    
+    def _items(self):
+        return getattr(self, self._ITEMS)
+    
+    @classmethod
+    def _check_unique_ids(cls, rows: List[Dict[str, Any]]) -> None:
+        """Raise ValueError if two record dictionaries share an id."""
+        seen = set()
+        for row in rows:
+            record_id = row.get(cls._ID_FIELD)
+            if record_id is None:
+                continue
+            if record_id in seen:
+                raise ValueError(f"Duplicate {cls._ID_FIELD}: {record_id}")
+            seen.add(record_id)
+    
+    @staticmethod
+    def _key(record: Any, record_id: Any) -> Any:
+        # Records without an id are indexed by identity
+        return record_id if record_id is not None else ('object', id(record))
+    
+    def _indexes(self) -> Dict[str, Any]:
+        items = self._items()
+        indexes = self.__dict__.get('_index_state')
+        if indexes is None or indexes['items'] is not items or indexes['size'] != len(items):
+            indexes = {
+                'items': items,
+                'size': 0,
+                'id': {},
+                'pos': {},
+                # First position whose 'pos' entry may be out of date
+                'stale': None,
+                'fields': {field: {} for field in self._INDEXED_FIELDS},
+            }
+            self._index_state = indexes
+            for position, record in enumerate(items):
+                self._index_add(record, position)
+            indexes['size'] = len(items)
+        return indexes
+    
+    def _index_add(self, record: Any, position: int) -> None:
+        indexes = self._index_state
+        record_id = getattr(record, self._ID_FIELD)
+        previous = indexes['id'].get(record_id) if record_id is not None else None
+        if previous is not None:
+            # Duplicate id already in the list: the later record wins
+            self._index_discard(previous)
+        key = self._key(record, record_id)
+        if record_id is not None:
+            indexes['id'][record_id] = record
+            indexes['pos'][record_id] = position
+        for field, index in indexes['fields'].items():
+            index.setdefault(getattr(record, field, None), {})[key] = record
+    
+    def _position(self, record_id: Any) -> int:
+        indexes = self._index_state
+        position = indexes['pos'][record_id]
+        stale = indexes['stale']
+        if stale is None or position < stale:
+            return position
+        # Records after a removal moved up; refresh their positions
+        items = self._items()
+        ids, positions = indexes['id'], indexes['pos']
+        for position in range(stale, len(items)):
+            record = items[position]
+            item_id = getattr(record, self._ID_FIELD)
+            if item_id is not None and ids.get(item_id) is record:
+                positions[item_id] = position
+        indexes['stale'] = None
+        return positions[record_id]
+    
+    def _index_discard(self, record: Any) -> None:
+        indexes = self._index_state
+        record_id = getattr(record, self._ID_FIELD)
+        key = self._key(record, record_id)
+        if record_id is not None and indexes['id'].get(record_id) is record:
+            del indexes['id'][record_id]
+            del indexes['pos'][record_id]
+        for field, index in indexes['fields'].items():
+            value = getattr(record, field, None)
+            bucket = index.get(value)
+            if bucket is not None and bucket.get(key) is record:
+                del bucket[key]
+                if not bucket:
+                    del index[value]
+    
+    def _append(self, record: Any) -> None:
+        """Append a new record, rejecting duplicate ids."""
+        indexes = self._indexes()
+        record_id = getattr(record, self._ID_FIELD)
+        if record_id is not None and record_id in indexes['id']:
+            raise ValueError(f"Duplicate {self._ID_FIELD}: {record_id}")
+        items = self._items()
+        items.append(record)
+        # items[-1] is the record itself, or its view in a columnar store
+        self._index_add(items[-1], len(items) - 1)
+        indexes['size'] = len(items)
+    
+    def get(self, record_id: Any, default: Any = None) -> Any:
+        """
+        Get a record by id.
+        
+        Args:
+            record_id: Record id
+            default: Returned when no record has that id
+            
+        Returns:
+            The record or default
+        """
+        return self._indexes()['id'].get(record_id, default)
+    
+    def __contains__(self, record_id: Any) -> bool:
+        return record_id in self._indexes()['id']
+    
+    def remove(self, record_id: Any) -> Any:
+        """
+        Remove a record by id, keeping the order of the others.
+        
+        Args:
+            record_id: Record id
+            
+        Returns:
+            The removed record
+            
+        Raises:
+            KeyError: If no record has that id
+        """
+        indexes = self._indexes()
+        record = indexes['id'].get(record_id)
+        if record is None:
+            raise KeyError(record_id)
+        items = self._items()
+        position = self._position(record_id)
+        last = len(items) - 1
+        self._index_discard(record)
+        if hasattr(items, 'swap_remove'):
+            # Columnar store: return a standalone copy of the row
+            removed = record.detach()
+            del items[position]
+            if position != last:
+                # Indexed views of the later rows now point one row off
+                self._index_state = None
+                return removed
+        else:
+            removed = record
+            del items[position]
+            if position != last:
+                stale = indexes['stale']
+                indexes['stale'] = position if stale is None else min(stale, position)
+        indexes['size'] = len(items)
+        return removed
+    
+    def upsert(self, record: Any) -> Any:
+        """
+        Insert a record, or replace the record with the same id in place.
+        
+        Args:
+            record: Record (or JSON string/dictionary)
+            
+        Returns:
+            The replaced record, or None if it was inserted
+        """
+        record = self._coerce(record)
+        indexes = self._indexes()
+        record_id = getattr(record, self._ID_FIELD)
+        previous = indexes['id'].get(record_id) if record_id is not None else None
+        if previous is None:
+            self._append(record)
+            return None
+        items = self._items()
+        position = self._position(record_id)
+        replaced = previous.detach() if hasattr(items, 'swap_remove') else previous
+        self._index_discard(previous)
+        items[position] = record
+        self._index_add(items[position], position)
+        return replaced
+    
+    def update(self, record_id: Any, **fields: Any) -> Any:
+        """
+        Change fields of a record and keep the indexes in sync.
+        
+        Args:
+            record_id: Record id
+            **fields: Field values to set
+            
+        Returns:
+            The updated record
+            
+        Raises:
+            KeyError: If no record has that id
+            ValueError: If the id is changed to one already present
+        """
+        record = self.get(record_id)
+        if record is None:
+            raise KeyError(record_id)
+        indexes = self._index_state
+        new_id = fields.get(self._ID_FIELD, record_id)
+        if new_id != record_id:
+            if new_id is not None and new_id in indexes['id']:
+                raise ValueError(f"Duplicate {self._ID_FIELD}: {new_id}")
+            position = self._position(record_id)
+            self._index_discard(record)
+            for name, value in fields.items():
+                setattr(record, name, value)
+            self._index_add(record, position)
+            return record
+        
+        before = {field: getattr(record, field, None) for field in self._INDEXED_FIELDS}
+        for name, value in fields.items():
+            setattr(record, name, value)
+        key = self._key(record, record_id)
+        for field, index in indexes['fields'].items():
+            old, new = before[field], getattr(record, field, None)
+            if old == new:
+                continue
+            bucket = index.get(old)
+            if bucket is not None:
+                bucket.pop(key, None)
+                if not bucket:
+                    del index[old]
+            index.setdefault(new, {})[key] = record
+        return record
+    
+    def _by_field(self, field: str, value: Any) -> List[Any]:
+        return list(self._indexes()['fields'][field].get(value, {}).values())
+    
+    def by_instrument(self, instrument: str) -> List[Any]:
+        """Records for an instrument, in the order they were indexed."""
+        return self._by_field('instrument', instrument)
+
+
+class FXTrades(_IndexedCollection):
     """
     Collection wrapper for multiple FX trades.
     
     Manages a collection of FXTrade objects with serialization capabilities.
+    With columnar=True the trades are backed by an FXTradeColumns store
+    (NumPy columns) and the aggregates below are vectorized; amount, rates
+    and pl must then be numbers or None. Trades are
+    indexed by trade_id and instrument (get, remove, upsert, by_instrument).
     """
     
-    def __init__(self, trades: Optional[List[FXTrade]] = None):
+    _ITEMS = 'trades'
+    _ID_FIELD = 'trade_id'
+    _INDEXED_FIELDS = ('instrument',)
+    
+    def __init__(self, trades: Optional[List[FXTrade]] = None, columnar: bool = False):
         """
         Initialize trades collection.
         
         Args:
             trades: List of FXTrade objects
+            columnar: Store trades in NumPy columns (requires numpy)
+
+        Raises:
+            ValueError: If columnar and a trade's amount, rates or pl is
+                not a number or None
         """
-        self.trades = trades or []
+        if columnar:
+            from .columnar import FXTradeColumns
+            
+            if not isinstance(trades, FXTradeColumns):
+                trades = FXTradeColumns(trades or [])
+            self.trades = trades
+        else:
+            self.trades = trades or []
     
-    def add_trade(self, trade_data: Union[FXTrade, str, Dict[str, Any]]):
-        """
-        Add trade to collection.
+    @property
+    def columnar(self) -> bool:
+        """True if the trades are backed by an FXTradeColumns store."""
+        from .columnar import FXTradeColumns
         
-        Args:
-            trade_data: FXTrade object, JSON string, or dictionary
-        """
+        return isinstance(self.trades, FXTradeColumns)
+    
+    @staticmethod
+    def _coerce(trade_data: Union[FXTrade, str, Dict[str, Any]]) -> FXTrade:
         if isinstance(trade_data, FXTrade):
-            self.trades.append(trade_data)
+            return trade_data
         elif isinstance(trade_data, str):
             try:
-                trade = FXTrade.from_json_string(trade_data)
-                self.trades.append(trade)
+                return FXTrade.from_json_string(trade_data)
             except json.JSONDecodeError:
                 raise ValueError(f"Invalid JSON string: {trade_data}")
         elif isinstance(trade_data, dict):
-            trade = FXTrade.from_dict(trade_data)
-            self.trades.append(trade)
+            return FXTrade.from_dict(trade_data)
         else:
             raise TypeError("trade_data must be FXTrade, string, or dict")
     
+    def add_trade(self, trade_data: Union[FXTrade, str, Dict[str, Any]]):
+        """
+        Add trade to collection.
+        
+        Args:
+            trade_data: FXTrade object, JSON string, or dictionary
+            
+        Raises:
+            ValueError: If the JSON is invalid, the trade_id is already
+                present, or a columnar store gets a non-numeric amount,
+                rate or pl
+        """
+        self._append(self._coerce(trade_data))
+    
+    def pl_by_instrument(self) -> Dict[str, float]:
+        """Sum of P/L per instrument (missing P/L counts as 0)."""
+        if self.columnar:
+            return self.trades.pl_by_instrument()
+        totals: Dict[str, float] = {}
+        for trade in self.trades:
+            totals[trade.instrument] = totals.get(trade.instrument, 0.0) + (trade.pl or 0.0)
+        return totals
+    
+    def net_exposure(self) -> Dict[str, float]:
+        """Signed amount per instrument (buys positive, sells negative)."""
+        if self.columnar:
+            return self.trades.net_exposure()
+        totals: Dict[str, float] = {}
+        for trade in self.trades:
+            side = str(trade.buy_sell or '')[:1].upper()
+            sign = 1 if side == 'B' else -1 if side == 'S' else 0
+            totals[trade.instrument] = totals.get(trade.instrument, 0.0) + sign * (trade.amount or 0.0)
+        return totals
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert trades collection to dictionary."""
         return {
@@ -185,25 +569,40 @@ class FXTrades:
         return sanitize_filename(f"{prefix}.{ext}")
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'FXTrades':
-        """Create trades collection from dictionary."""
-        trades = [FXTrade.from_dict(trade_data) for trade_data in data.get('trades', [])]
+    def from_dict(cls, data: Dict[str, Any], columnar: bool = False) -> 'FXTrades':
+        """
+        Create trades collection from dictionary.
+        
+        Raises:
+            ValueError: If two trades share a trade_id
+        """
+        rows = data.get('trades', [])
+        cls._check_unique_ids(rows)
+        if columnar:
+            from .columnar import FXTradeColumns
+            
+            return cls(FXTradeColumns.from_dicts(rows), columnar=True)
+        trades = [FXTrade.from_dict(trade_data) for trade_data in rows]
         return cls(trades)
     
     @classmethod
-    def from_json_string(cls, json_str: str) -> 'FXTrades':
+    def from_json_string(cls, json_str: str, columnar: bool = False) -> 'FXTrades':
         """Create trades collection from JSON string."""
         data = json.loads(json_str)
-        return cls.from_dict(data)
+        return cls.from_dict(data, columnar=columnar)
 
 
-class FXOrder:
+class FXOrder(_SlottedRecord):
     """
     Represents an FX order with detailed order information.
     
     Core data structure for FX order management.
     """
     
+    _FIELDS = ('order_id', 'instrument', 'amount', 'buy_sell', 'rate', 'stop',
+               'limit', 'status', 'time_in_force')
+    __slots__ = _FIELDS
+    
     def __init__(self, order_id: Optional[str] = None, instrument: Optional[str] = None,
                  amount: Optional[float] = None, buy_sell: Optional[str] = None,
                  rate: Optional[float] = None, stop: Optional[float] = None,
@@ -224,6 +623,7 @@ class FXOrder:
             time_in_force: Order time in force
             **kwargs: Additional order data
         """
+        object.__setattr__(self, '_extras', None)
         self.order_id = order_id
         self.instrument = instrument
         self.amount = amount
@@ -235,8 +635,8 @@ class FXOrder:
         self.time_in_force = time_in_force
         
         # Store additional attributes
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+        if kwargs:
+            self._set_extras(kwargs)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert order to dictionary."""
@@ -274,13 +674,19 @@ class FXOrder:
         return cls.from_dict(data)
 
 
-class FXOrders:
+class FXOrders(_IndexedCollection):
     """
     Collection wrapper for multiple FX orders.
     
     Manages a collection of FXOrder objects with serialization capabilities.
+    Orders are indexed by order_id, instrument and status (get, remove,
+    upsert, update, by_instrument, by_status).
     """
     
+    _ITEMS = 'orders'
+    _ID_FIELD = 'order_id'
+    _INDEXED_FIELDS = ('instrument', 'status')
+    
     def __init__(self, orders: Optional[List[FXOrder]] = None):
         """
         Initialize orders collection.
@@ -290,27 +696,36 @@ class FXOrders:
         """
         self.orders = orders or []
     
-    def add_order(self, order_data: Union[FXOrder, str, Dict[str, Any]]):
-        """
-        Add order to collection.
-        
-        Args:
-            order_data: FXOrder object, JSON string, or dictionary
-        """
+    @staticmethod
+    def _coerce(order_data: Union[FXOrder, str, Dict[str, Any]]) -> FXOrder:
         if isinstance(order_data, FXOrder):
-            self.orders.append(order_data)
+            return order_data
         elif isinstance(order_data, str):
             try:
-                order = FXOrder.from_json_string(order_data)
-                self.orders.append(order)
+                return FXOrder.from_json_string(order_data)
             except json.JSONDecodeError:
                 raise ValueError(f"Invalid JSON string: {order_data}")
         elif isinstance(order_data, dict):
-            order = FXOrder.from_dict(order_data)
-            self.orders.append(order)
+            return FXOrder.from_dict(order_data)
         else:
             raise TypeError("order_data must be FXOrder, string, or dict")
     
+    def add_order(self, order_data: Union[FXOrder, str, Dict[str, Any]]):
+        """
+        Add order to collection.
+        
+        Args:
+            order_data: FXOrder object, JSON string, or dictionary
+            
+        Raises:
+            ValueError: If the JSON is invalid or the order_id is already present
+        """
+        self._append(self._coerce(order_data))
+    
+    def by_status(self, status: str) -> List[FXOrder]:
+        """Orders with a status, in the order they were indexed."""
+        return self._by_field('status', status)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert orders collection to dictionary."""
         return {
@@ -333,8 +748,15 @@ class FXOrders:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'FXOrders':
-        """Create orders collection from dictionary."""
-        orders = [FXOrder.from_dict(order_data) for order_data in data.get('orders', [])]
+        """
+        Create orders collection from dictionary.
+        
+        Raises:
+            ValueError: If two orders share an order_id
+        """
+        rows = data.get('orders', [])
+        cls._check_unique_ids(rows)
+        orders = [FXOrder.from_dict(order_data) for order_data in rows]
         return cls(orders)
     
     @classmethod
@@ -525,6 +947,57 @@ class FXTransactDataHelper:
             return FXTransactWrapper.from_json_string(json_str)
         except Exception:
             return None
+    
+    @staticmethod
+    def iter_trades(filepath: str, predicate=None, **filters):
+        """
+        Stream trades from a JSON or JSONL file without loading it whole.
+        
+        Args:
+            filepath: Source file path
+            predicate: Optional test on each trade dictionary
+            **filters: Field values trades must match (e.g. instrument="EUR/USD")
+            
+        Returns:
+            Iterator of FXTrade objects
+        """
+        from .stream import iter_trades
+        
+        return iter_trades(filepath, predicate, **filters)
+    
+    @staticmethod
+    def iter_orders(filepath: str, predicate=None, **filters):
+        """
+        Stream orders from a JSON or JSONL file without loading it whole.
+        
+        Args:
+            filepath: Source file path
+            predicate: Optional test on each order dictionary
+            **filters: Field values orders must match (e.g. status="waiting")
+            
+        Returns:
+            Iterator of FXOrder objects
+        """
+        from .stream import iter_orders
+        
+        return iter_orders(filepath, predicate, **filters)
+    
+    @staticmethod
+    def open_journal(journal_path: str, snapshot_path: Optional[str] = None, **kwargs):
+        """
+        Open an append-only journal (snapshot + JSONL) of trades and orders.
+        
+        Args:
+            journal_path: JSONL journal file
+            snapshot_path: Snapshot file (defaults to journal_path + ".snapshot.json")
+            **kwargs: FXTransactJournal options (compact_every, fsync)
+            
+        Returns:
+            FXTransactJournal with the replayed trades and orders
+        """
+        from .journal import FXTransactJournal
+        
+        return FXTransactJournal(journal_path, snapshot_path, **kwargs)
 
 
 # Legacy aliases for backward compatibility
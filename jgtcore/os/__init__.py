@@ -25,6 +25,9 @@ from .helpers import (
     get_dt_format_pattern,
     calculate_start_datetime,
     calculate_tlid_range,
+    calculate_session_start_datetime,
+    calculate_session_start_datetimes,
+    calculate_session_tlid_range,
     
     # File naming utilities
     mk_fn_range,
@@ -50,6 +53,9 @@ __all__ = [
     'get_dt_format_pattern',
     'calculate_start_datetime',
     'calculate_tlid_range',
+    'calculate_session_start_datetime',
+    'calculate_session_start_datetimes',
+    'calculate_session_tlid_range',
     
     # File naming utilities
     'mk_fn_range',
@@ -10,8 +10,8 @@ Core OS-related functions migrated from jgtutils including:
 import datetime
 import os
 import re
-from datetime import datetime, timedelta
-from typing import Tuple, Optional
+from datetime import datetime
+from typing import Iterable, List, Tuple, Optional
 
 # External dependency - TLID library
 try:
@@ -175,10 +175,16 @@ def t2fn(t: str) -> str:
         t: Timeframe string (e.g., "m1")
         
     Returns:
-        Filename-compatible timeframe (e.g., "mi1")
+        Filename-compatible timeframe (e.g., "mi1"); anything that is not
+        a registered timeframe name (minute counts, unknown codes) is
+        returned unchanged
     """
-    t_fix = t if t != "m1" else t.replace("m1", "mi1")
-    return t_fix
+    # The registry lives in the timeframe package; import on first use so
+    # loading jgtcore.os does not pull in the scheduler and calendars
+    from ..timeframe.registry import find_timeframe
+
+    record = find_timeframe(t)
+    return record.filename if record is not None and record.name == t else t
 
 
 def fn2t(t: str) -> str:
@@ -191,9 +197,9 @@ def fn2t(t: str) -> str:
     Returns:
         Timeframe string (e.g., "m1")
     """
-    t_fix = t if t != "mi1" else t.replace("mi1", "m1")
-    t_fix = t_fix if t_fix != "min1" else t_fix.replace("min1", "m1")
-    return t_fix
+    from ..timeframe.registry import FILENAME_ALIASES
+
+    return FILENAME_ALIASES.get(t, t)
 
 
 def topovfn(i: str, t: str, separator: str = "_") -> str:
@@ -268,12 +274,20 @@ def calculate_start_datetime(end_datetime: str, timeframe: str, periods: int) ->
     
     Args:
         end_datetime: End datetime string
-        timeframe: Timeframe string (e.g., "H1", "D1", "m15")
+        timeframe: Timeframe string (e.g., "H1", "D1", "m15", or minutes)
         periods: Number of periods to go back
         
     Returns:
-        Start datetime object
+        Start datetime object (M frames go back by calendar months)
     """
+    from ..timeframe.registry import get_timeframe
+
+    end_dt = _parse_end_datetime(end_datetime)
+    return get_timeframe(timeframe).shift(end_dt, -periods)
+
+
+def _parse_end_datetime(end_datetime: str) -> datetime:
+    """Parse an end datetime string in one of the get_dt_format_pattern formats."""
     date_format = get_dt_format_pattern(end_datetime)
     
     # Parse end_datetime string into datetime object
@@ -282,36 +296,48 @@ def calculate_start_datetime(end_datetime: str, timeframe: str, periods: int) ->
     # If the year is less than 100, add 2000 to it to get the correct century
     if end_dt.year < 100:
         end_dt = end_dt.replace(year=end_dt.year + 2000)
+    return end_dt
+
+
+def calculate_session_start_datetime(end_datetime: str, timeframe: str, periods: int) -> datetime:
+    """
+    Calculate the start of the last periods tradable bars before end datetime.
     
-    # Check if timeframe is in hours
-    if timeframe.startswith('H'):
-        # Convert timeframe from hours to minutes
-        timeframe_minutes = int(timeframe[1:]) * 60
-    elif timeframe.startswith('D'):
-        # Convert timeframe from days to minutes
-        timeframe_minutes = int(timeframe[1:]) * 24 * 60
-    elif timeframe.startswith('W'):
-        # Convert timeframe from weeks to minutes
-        timeframe_minutes = int(timeframe[1:]) * 7 * 24 * 60
-    elif timeframe.startswith('M'):
-        # Convert timeframe from months to minutes
-        # Assume an average of 30 days per month
-        timeframe_minutes = int(timeframe[1:]) * 30 * 24 * 60
-    elif timeframe.startswith('m'):
-        # Convert timeframe from minutes
-        timeframe_minutes = int(timeframe[1:])
-    else:
-        # Assume timeframe is already in minutes
-        timeframe_minutes = int(timeframe)
+    Unlike calculate_start_datetime, bars falling on weekends, the daily
+    close or holidays are not counted, so [start, end) holds exactly
+    periods bars from the broker (times are in the timeframe engine's wall
+    clock, UTC by default).
     
-    # Convert timeframe from minutes to seconds
-    timeframe_seconds = timeframe_minutes * 60
-    # Calculate total seconds for all periods
-    total_seconds = timeframe_seconds * periods
-    # Calculate start datetime
-    start_datetime = end_dt - timedelta(seconds=total_seconds)
+    Args:
+        end_datetime: End datetime string
+        timeframe: Timeframe string (e.g., "H1", "D1", "m15")
+        periods: Number of tradable bars to go back
+        
+    Returns:
+        Start datetime object (open of the earliest bar)
+    """
+    from ..timeframe.market import get_market_hours
+
+    return get_market_hours().bars_back(_parse_end_datetime(end_datetime), timeframe, periods)
+
+
+def calculate_session_start_datetimes(
+    requests: Iterable[Tuple[str, str, int]]
+) -> List[datetime]:
+    """
+    Calculate session-aware start datetimes for many requests at once.
     
-    return start_datetime
+    Args:
+        requests: (end_datetime, timeframe, periods) tuples
+        
+    Returns:
+        Start datetimes, in request order
+    """
+    from ..timeframe.market import get_market_hours
+
+    return get_market_hours().bars_back_many(
+        (_parse_end_datetime(end), timeframe, periods) for end, timeframe, periods in requests
+    )
 
 
 def calculate_tlid_range(end_datetime: str, timeframe: str, periods: int) -> str:
@@ -346,6 +372,33 @@ def calculate_tlid_range(end_datetime: str, timeframe: str, periods: int) -> str
     return f"{start_tlid}_{end_tlid}"
 
 
+def calculate_session_tlid_range(end_datetime: str, timeframe: str, periods: int) -> str:
+    """
+    Calculate TLID range covering the last periods tradable bars.
+    
+    Args:
+        end_datetime: End datetime string
+        timeframe: Timeframe string
+        periods: Number of tradable bars to go back
+        
+    Returns:
+        TLID range string in format "start_tlid_end_tlid"
+        
+    Raises:
+        ImportError: If tlid library is not available
+    """
+    if not HAS_TLID:
+        raise ImportError("tlid library is required for calculate_session_tlid_range function")
+    
+    start_datetime = calculate_session_start_datetime(end_datetime, timeframe, periods)
+    
+    # Keep the time of day: session starts rarely fall on midnight
+    start_tlid = tlid.fromdtstr(start_datetime.strftime("%Y-%m-%d %H:%M"))
+    end_tlid = tlid.fromdtstr(end_datetime)
+    
+    return f"{start_tlid}_{end_tlid}"
+
+
 # File Naming Utilities
 
 def mk_fn_range(instrument: str, timeframe: str, start: datetime, end: datetime, ext: str = "csv") -> str:
@@ -362,10 +415,8 @@ def mk_fn_range(instrument: str, timeframe: str, start: datetime, end: datetime,
     Returns:
         Filename string with range
     """
-    _tf = timeframe
+    _tf = t2fn(timeframe)  # mi1 differentiates m1 from M1
     _i = instrument.replace("/", "-")
-    if timeframe == "m1":
-        _tf = timeframe.replace("m1", "mi1")  # differentiate with M1
     start_str = tlid_dt_to_string(start)
     end_str = tlid_dt_to_string(end)
     _fn = f"{_i}_{_tf}_{start_str}_{end_str}.{ext}"
@@ -412,7 +463,10 @@ __all__ = [
     # Advanced TLID calculation
     'get_dt_format_pattern',
     'calculate_start_datetime',
+    'calculate_session_start_datetime',
+    'calculate_session_start_datetimes',
     'calculate_tlid_range',
+    'calculate_session_tlid_range',
     
     # File naming utilities
     'mk_fn_range',
@@ -0,0 +1,63 @@
+"""
+Settings module for jgtcore
+
+This module contains the advanced settings infrastructure built on top of
+jgtcore.core.load_settings:
+- Layered, zero-copy view over the settings sources with per-key provenance
+- Compiled on-disk snapshots for short-lived processes (JGT_SETTINGS_SNAPSHOT=1)
+- Opt-in hot-reload watcher with per-key change subscriptions
+- Compiled argument default resolver (settings, alias and JGT_ env lookups)
+- Compiled ${VAR} templates resolved lazily against the environment
+- Concurrent (asyncio or thread pool) settings and config loading
+
+The simple API (load_settings, get_settings, get_setting) stays in jgtcore.core.
+
+Names are resolved lazily (PEP 562) as in the top-level package, so importing
+jgtcore.settings.resolver from the CLI does not load asyncio or the watcher.
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_ATTRIBUTES = {
+    "LayeredSettings": ".layered",
+    "get_layered_settings": ".layered",
+    "DEFAULT_MERGE_KEYS": ".layered",
+    "is_snapshot_enabled": ".compiled",
+    "get_cache_dir": ".compiled",
+    "clear_compiled_snapshots": ".compiled",
+    "SNAPSHOT_ENV_NAME": ".compiled",
+    "CACHE_DIR_ENV_NAME": ".compiled",
+    "SettingsWatcher": ".watcher",
+    "watch_settings": ".watcher",
+    "diff_mappings": ".watcher",
+    "ArgResolver": ".resolver",
+    "get_arg_resolver": ".resolver",
+    "resolve_args": ".resolver",
+    "clear_arg_resolvers": ".resolver",
+    "Template": ".template",
+    "CompiledConfig": ".template",
+    "compile_template": ".template",
+    "compile_config": ".template",
+    "resolve_templates": ".template",
+    "aload_settings": ".aio",
+    "aget_config": ".aio",
+    "load_settings_concurrent": ".aio",
+    "get_config_concurrent": ".aio",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    """Import the submodule providing `name` on first access."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,298 @@
+"""
+Concurrent settings and config loading for jgtcore
+
+load_settings stats and reads its sources one after another; on network
+filesystems every probe is a round-trip. The loaders here issue all source
+stats at once on a thread pool, read the changed sources concurrently, then
+merge through the regular cache in exactly the precedence order
+load_settings uses. They share the caches of jgtcore.core, so a later
+load_settings/readconfig call reuses what was read here.
+
+aload_settings/aget_config are coroutines; load_settings_concurrent and
+get_config_concurrent are the same loaders for synchronous callers.
+"""
+
+import asyncio
+import copy
+import os
+import stat
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from .. import core
+
+MAX_IO_WORKERS = 16
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared I/O thread pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=MAX_IO_WORKERS, thread_name_prefix="jgtcore-io"
+                )
+    return _executor
+
+
+def _stat(path: str) -> Optional[os.stat_result]:
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _fingerprint_from_stats(
+    sources: List[Any], stats: Dict[str, Optional[os.stat_result]]
+) -> Tuple[Any, ...]:
+    """Build the same fingerprint core._settings_fingerprint would."""
+    fingerprint = []
+    for source in sources:
+        if source.kind == "env":
+            fingerprint.append((source, core._env_fingerprint(source.location)))
+            continue
+        st = stats.get(source.location)
+        fingerprint.append(
+            (source, None if st is None else (st.st_ino, st.st_mtime_ns, st.st_size))
+        )
+    return tuple(fingerprint)
+
+
+def _stale_sources(
+    custom_path: Optional[str], fingerprint: Tuple[Any, ...]
+) -> List[Tuple[Any, Any]]:
+    """File sources that exist and are not parsed at their current fingerprint."""
+    cached = core._MERGED_CACHE.get(custom_path)
+    if cached is not None and cached[0] == fingerprint:
+        return []
+    if core._compiled_snapshots() is not None:
+        # The compiled snapshot replaces parsing the sources
+        return []
+    stale = []
+    for source, source_fingerprint in fingerprint:
+        if source.kind == "env" or source_fingerprint is None:
+            continue
+        entry = core._SOURCE_CACHE.get(source)
+        if entry is None or entry[0] != source_fingerprint:
+            stale.append((source, source_fingerprint))
+    return stale
+
+
+def _merge_loaded(
+    custom_path: Optional[str],
+    fingerprint: Tuple[Any, ...],
+    old: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Merge the (now cached) sources like load_settings does."""
+    with core._settings_write_lock:
+        if old is not None:
+            _settings = core._merge_settings_over(custom_path, fingerprint, old)
+        else:
+            _, merged = core._merge_settings_cached(custom_path, fingerprint)
+            _settings = copy.deepcopy(merged)
+    core._settings_loaded(_settings)
+    return _settings
+
+
+def _stat_table(
+    stats: List[Optional[os.stat_result]], paths: List[str]
+) -> Dict[str, Optional[os.stat_result]]:
+    return dict(zip(paths, stats))
+
+
+async def _gather(executor: Executor, func, args: List[Tuple[Any, ...]]) -> List[Any]:
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(
+        *(loop.run_in_executor(executor, func, *arg) for arg in args)
+    )
+
+
+async def aload_settings(
+    custom_path: Optional[str] = None,
+    old: Optional[Dict[str, Any]] = None,
+    executor: Optional[Executor] = None,
+) -> Dict[str, Any]:
+    """
+    Load settings like load_settings, with source I/O done concurrently.
+
+    Args:
+        custom_path: Optional custom path to settings file
+        old: Existing settings to merge with
+        executor: Executor for blocking I/O (defaults to a shared thread pool)
+
+    Returns:
+        Merged settings dictionary
+    """
+    executor = executor or _get_executor()
+    sources = core._settings_sources(custom_path)
+    paths = [source.location for source in sources if source.kind != "env"]
+    stats = _stat_table(await _gather(executor, _stat, [(path,) for path in paths]), paths)
+    fingerprint = _fingerprint_from_stats(sources, stats)
+    stale = _stale_sources(custom_path, fingerprint)
+    if stale:
+        await _gather(executor, core._load_settings_source, stale)
+    return _merge_loaded(custom_path, fingerprint, old)
+
+
+def load_settings_concurrent(
+    custom_path: Optional[str] = None,
+    old: Optional[Dict[str, Any]] = None,
+    executor: Optional[Executor] = None,
+) -> Dict[str, Any]:
+    """
+    Synchronous form of aload_settings (usable inside or outside an event loop).
+
+    Args:
+        custom_path: Optional custom path to settings file
+        old: Existing settings to merge with
+        executor: Executor for blocking I/O (defaults to a shared thread pool)
+
+    Returns:
+        Merged settings dictionary
+    """
+    executor = executor or _get_executor()
+    sources = core._settings_sources(custom_path)
+    paths = [source.location for source in sources if source.kind != "env"]
+    stats = _stat_table(list(executor.map(_stat, paths)), paths)
+    fingerprint = _fingerprint_from_stats(sources, stats)
+    stale = _stale_sources(custom_path, fingerprint)
+    if stale:
+        list(executor.map(lambda item: core._load_settings_source(*item), stale))
+    return _merge_loaded(custom_path, fingerprint, old)
+
+
+def _config_paths_to_probe(
+    config_file: str, config_file_path_env_name: str, config_values_env_name: str
+) -> Tuple[Optional[Tuple[Any, ...]], List[str], str]:
+    """
+    Return (location key, candidate paths, home) when the config location is
+    not known yet; the key is None when nothing needs probing.
+    """
+    home_dir = core._home_dir()
+    if core._JGT_CONFIG_JSON_SECRET is not None:
+        return None, [], home_dir
+    key = core._config_location_key(
+        config_file, home_dir, config_file_path_env_name, config_values_env_name
+    )
+    if key in core._CONFIG_LOCATIONS:
+        return None, [], home_dir
+    return key, core._config_candidates(config_file, home_dir, config_file_path_env_name), home_dir
+
+
+def _seed_config_location(
+    key: Tuple[Any, ...],
+    stats: Dict[str, Optional[os.stat_result]],
+    config_file: str,
+    home_dir: str,
+    config_file_path_env_name: str,
+    config_values_env_name: str,
+) -> None:
+    """Resolve the config location from pre-gathered stats and remember it."""
+
+    def exists(path: str) -> bool:
+        if path in stats:
+            return stats[path] is not None
+        return os.path.exists(path)
+
+    def isfile(path: str) -> bool:
+        if path in stats:
+            st = stats[path]
+            return st is not None and stat.S_ISREG(st.st_mode)
+        return os.path.isfile(path)
+
+    try:
+        location = core._locate_config(
+            config_file,
+            home_dir,
+            config_file_path_env_name,
+            config_values_env_name,
+            exists=exists,
+            isfile=isfile,
+        )
+    except Exception:
+        # readconfig raises the same error with its usual message
+        return
+    core._CONFIG_LOCATIONS[key] = location
+
+
+async def aget_config(
+    config_file: str = "config.json",
+    export_env: bool = False,
+    config_file_path_env_name: str = "JGT_CONFIG_PATH",
+    config_values_env_name: str = "JGT_CONFIG",
+    executor: Optional[Executor] = None,
+) -> Dict[str, Any]:
+    """
+    Read the configuration like readconfig, probing its locations concurrently.
+
+    Args:
+        config_file: Configuration file name
+        export_env: Whether to export config values to environment
+        config_file_path_env_name: Env var name for config file path
+        config_values_env_name: Env var name for config JSON string
+        executor: Executor for blocking I/O (defaults to a shared thread pool)
+
+    Returns:
+        Configuration dictionary
+    """
+    executor = executor or _get_executor()
+    key, paths, home_dir = _config_paths_to_probe(
+        config_file, config_file_path_env_name, config_values_env_name
+    )
+    if key is not None:
+        stats = _stat_table(await _gather(executor, _stat, [(path,) for path in paths]), paths)
+        _seed_config_location(
+            key, stats, config_file, home_dir, config_file_path_env_name, config_values_env_name
+        )
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        lambda: core.readconfig(
+            config_file=config_file,
+            export_env=export_env,
+            config_file_path_env_name=config_file_path_env_name,
+            config_values_env_name=config_values_env_name,
+        ),
+    )
+
+
+def get_config_concurrent(
+    config_file: str = "config.json",
+    export_env: bool = False,
+    config_file_path_env_name: str = "JGT_CONFIG_PATH",
+    config_values_env_name: str = "JGT_CONFIG",
+    executor: Optional[Executor] = None,
+) -> Dict[str, Any]:
+    """
+    Synchronous form of aget_config (usable inside or outside an event loop).
+
+    Args:
+        config_file: Configuration file name
+        export_env: Whether to export config values to environment
+        config_file_path_env_name: Env var name for config file path
+        config_values_env_name: Env var name for config JSON string
+        executor: Executor for blocking I/O (defaults to a shared thread pool)
+
+    Returns:
+        Configuration dictionary
+    """
+    executor = executor or _get_executor()
+    key, paths, home_dir = _config_paths_to_probe(
+        config_file, config_file_path_env_name, config_values_env_name
+    )
+    if key is not None:
+        stats = _stat_table(list(executor.map(_stat, paths)), paths)
+        _seed_config_location(
+            key, stats, config_file, home_dir, config_file_path_env_name, config_values_env_name
+        )
+    return core.readconfig(
+        config_file=config_file,
+        export_env=export_env,
+        config_file_path_env_name=config_file_path_env_name,
+        config_values_env_name=config_values_env_name,
+    )
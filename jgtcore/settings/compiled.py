@@ -0,0 +1,259 @@
+"""
+Compiled settings snapshots for jgtcore
+
+Short-lived processes pay for parsing every JSON/YAML settings layer on each
+start. When enabled (JGT_SETTINGS_SNAPSHOT=1), the merged settings and parsed
+config files are stored under ~/.jgt/cache in marshal form, keyed by the stat
+fingerprint of every source and the hash of the JGT_SETTINGS* variables. A
+snapshot is loaded with a single read and ignored as soon as any source
+differs, in which case the normal parse runs and a fresh snapshot is written.
+
+Only file-backed config is snapshotted; configs passed through environment
+variables are never written to disk. Settings marshal cannot encode (e.g.
+dates parsed from YAML) are not snapshotted. Snapshot files are only read
+when they and their directory belong to the current user and are not
+writable by group or others.
+"""
+
+import hashlib
+import marshal
+import os
+import stat
+from collections.abc import Mapping
+from typing import Any, Dict, Optional, Tuple
+
+from ..core import _SNAPSHOT_ENV_NAME
+
+CACHE_DIR_ENV_NAME = "JGT_CACHE_DIR"
+SNAPSHOT_ENV_NAME = _SNAPSHOT_ENV_NAME
+
+# Bump when the snapshot layout or the merge rules change
+SNAPSHOT_FORMAT_VERSION = 1
+
+_MARSHAL_TAG = b"M"
+
+
+def is_snapshot_enabled() -> bool:
+    """
+    Check whether compiled snapshots are enabled.
+
+    Returns:
+        True if JGT_SETTINGS_SNAPSHOT is set to a true value
+    """
+    return os.environ.get(SNAPSHOT_ENV_NAME, "").lower() in ("1", "true", "yes", "on")
+
+
+def get_cache_dir() -> str:
+    """
+    Get the directory holding compiled snapshots.
+
+    Returns:
+        $JGT_CACHE_DIR if set, otherwise ~/.jgt/cache
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV_NAME)
+    if cache_dir:
+        return cache_dir
+    return os.path.join(os.path.expanduser("~"), ".jgt", "cache")
+
+
+def _snapshot_path(kind: str, scope: Any) -> str:
+    """Path of the snapshot file for a kind ("settings"/"config") and scope."""
+    digest = hashlib.sha1(repr(scope).encode("utf-8", "surrogatepass")).hexdigest()
+    return os.path.join(get_cache_dir(), f"{kind}-{digest[:20]}.bin")
+
+
+def _plain(value: Any) -> Any:
+    """Convert YAML mappings/sequences to plain dicts and lists."""
+    if isinstance(value, Mapping):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    return value
+
+
+def _plain_fingerprint(fingerprint: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Settings fingerprint using only marshal-able builtin types."""
+    return tuple((tuple(source), source_fp) for source, source_fp in fingerprint)
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """True if a file or directory is owned by us and not group/world-writable."""
+    if not hasattr(os, "getuid"):
+        return True
+    return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _read_snapshot(path: str) -> Optional[Tuple[Any, ...]]:
+    """Read a private snapshot file, returning None when missing, unreadable or untrusted."""
+    try:
+        if not _is_private(os.stat(os.path.dirname(path))):
+            return None
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            if not stat.S_ISREG(st.st_mode) or not _is_private(st):
+                return None
+            data = f.read()
+    except OSError:
+        return None
+    if data[:1] != _MARSHAL_TAG:
+        return None
+    try:
+        payload = marshal.loads(data[1:])
+    except Exception:
+        return None
+    if not isinstance(payload, tuple) or not payload or payload[0] != SNAPSHOT_FORMAT_VERSION:
+        return None
+    return payload
+
+
+def _write_snapshot(path: str, payload: Tuple[Any, ...]) -> bool:
+    """Atomically write a snapshot file readable by the owner only."""
+    try:
+        data = _MARSHAL_TAG + marshal.dumps(payload)
+    except ValueError:
+        # e.g. dates parsed from YAML, which marshal cannot encode
+        return False
+    import tempfile  # only needed when writing, keep it off the load path
+
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if not _is_private(os.stat(directory)):
+            # Snapshots written here would never be read back
+            return False
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".snapshot-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        return False
+    return True
+
+
+# Settings snapshots
+
+def _settings_scope(custom_path: Optional[str]) -> Tuple[Any, ...]:
+    return (os.getcwd(), os.path.expanduser("~"), custom_path)
+
+
+def load_compiled_settings(
+    custom_path: Optional[str], fingerprint: Tuple[Any, ...]
+) -> Optional[Dict[str, Any]]:
+    """
+    Load the merged settings snapshot if it matches the current sources.
+
+    Args:
+        custom_path: Custom settings path used for the load
+        fingerprint: Current fingerprint of every settings source
+
+    Returns:
+        Merged settings dictionary or None if there is no valid snapshot
+    """
+    payload = _read_snapshot(_snapshot_path("settings", _settings_scope(custom_path)))
+    if payload is None or len(payload) != 3:
+        return None
+    if payload[1] != _plain_fingerprint(fingerprint):
+        return None
+    return payload[2]
+
+
+def store_compiled_settings(
+    custom_path: Optional[str], fingerprint: Tuple[Any, ...], merged: Dict[str, Any]
+) -> bool:
+    """
+    Store the merged settings for the given source fingerprint.
+
+    Args:
+        custom_path: Custom settings path used for the load
+        fingerprint: Fingerprint of every settings source
+        merged: Merged settings dictionary
+
+    Returns:
+        True if the snapshot was written
+    """
+    payload = (SNAPSHOT_FORMAT_VERSION, _plain_fingerprint(fingerprint), _plain(merged))
+    return _write_snapshot(
+        _snapshot_path("settings", _settings_scope(custom_path)), payload
+    )
+
+
+# Config snapshots
+
+def load_compiled_config(
+    path: str, fingerprint: Tuple[int, int, int]
+) -> Optional[Dict[str, Any]]:
+    """
+    Load the parsed config snapshot of a config file if its stat matches.
+
+    Args:
+        path: Absolute path of the config file
+        fingerprint: Current (inode, mtime_ns, size) of the file
+
+    Returns:
+        Parsed config dictionary or None if there is no valid snapshot
+    """
+    payload = _read_snapshot(_snapshot_path("config", path))
+    if payload is None or len(payload) != 4:
+        return None
+    if payload[1] != path or payload[2] != tuple(fingerprint):
+        return None
+    return payload[3]
+
+
+def store_compiled_config(
+    path: str, fingerprint: Tuple[int, int, int], config: Dict[str, Any]
+) -> bool:
+    """
+    Store the parsed config of a config file.
+
+    Args:
+        path: Absolute path of the config file
+        fingerprint: (inode, mtime_ns, size) of the file
+        config: Parsed config dictionary
+
+    Returns:
+        True if the snapshot was written
+    """
+    payload = (SNAPSHOT_FORMAT_VERSION, path, tuple(fingerprint), _plain(config))
+    return _write_snapshot(_snapshot_path("config", path), payload)
+
+
+def clear_compiled_snapshots() -> int:
+    """
+    Delete every compiled snapshot in the cache directory.
+
+    Returns:
+        Number of files removed
+    """
+    cache_dir = get_cache_dir()
+    removed = 0
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return 0
+    for name in names:
+        if name.endswith(".bin") and name.startswith(("settings-", "config-")):
+            try:
+                os.unlink(os.path.join(cache_dir, name))
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+__all__ = [
+    'is_snapshot_enabled',
+    'get_cache_dir',
+    'load_compiled_settings',
+    'store_compiled_settings',
+    'load_compiled_config',
+    'store_compiled_config',
+    'clear_compiled_snapshots',
+    'SNAPSHOT_ENV_NAME',
+    'CACHE_DIR_ENV_NAME',
+    'SNAPSHOT_FORMAT_VERSION',
+]
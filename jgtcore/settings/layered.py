@@ -0,0 +1,246 @@
+"""
+Layered settings view for jgtcore
+
+Stacks the settings sources used by load_settings without merging them into
+a single dictionary. Lookups walk the layers once and are memoized, the
+special "patterns" key is deep-merged lazily, and every key remembers which
+layer(s) supplied it.
+"""
+
+import copy
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .. import core
+
+# Keys merged across layers instead of overridden (see core.update_settings)
+DEFAULT_MERGE_KEYS = ("patterns",)
+
+_MISSING = object()
+
+
+class LayeredSettings(Mapping):
+    """
+    Read-only, ChainMap-like view over ordered settings layers.
+
+    Layers are given lowest precedence first, as load_settings merges them.
+    Values are shared with the layers (no copy), so they must be treated as
+    read-only; use to_dict() for an independent, mutable copy.
+    """
+
+    def __init__(
+        self,
+        layers: Optional[Sequence[Tuple[str, Mapping]]] = None,
+        merge_keys: Sequence[str] = DEFAULT_MERGE_KEYS,
+    ):
+        """
+        Initialize the layered view.
+
+        Args:
+            layers: (name, mapping) pairs, lowest precedence first
+            merge_keys: Keys whose mapping values are merged across layers
+        """
+        self._names: List[str] = []
+        self._layers: List[Mapping] = []
+        for name, layer in layers or []:
+            self._names.append(name)
+            self._layers.append(layer if layer is not None else {})
+        self.merge_keys = frozenset(merge_keys)
+        self._sources: Dict[str, Any] = {}
+        self._fingerprints: Dict[str, Any] = {}
+        self._resolved: Dict[str, Tuple[Any, Tuple[str, ...]]] = {}
+        self._keys: Optional[List[str]] = None
+
+    @classmethod
+    def from_sources(cls, custom_path: Optional[str] = None) -> "LayeredSettings":
+        """
+        Build a view over the same sources load_settings reads.
+
+        Args:
+            custom_path: Optional custom path to settings file
+
+        Returns:
+            LayeredSettings instance with one layer per source
+        """
+        view = cls()
+        for source, fingerprint in core._settings_fingerprint(
+            core._settings_sources(custom_path)
+        ):
+            view._names.append(source.name)
+            view._layers.append(core._load_settings_source(source, fingerprint))
+            view._sources[source.name] = source
+            view._fingerprints[source.name] = fingerprint
+        return view
+
+    # Mapping interface
+
+    def __getitem__(self, key: str) -> Any:
+        value, _ = self._resolve(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return any(key in layer for layer in self._layers)
+
+    def __iter__(self) -> Iterator[str]:
+        if self._keys is None:
+            seen = {}
+            for layer in self._layers:
+                for key in layer:
+                    seen.setdefault(key, None)
+            self._keys = list(seen)
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        if self._keys is None:
+            iter(self)
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"LayeredSettings(layers={self._names!r})"
+
+    # Resolution
+
+    def _resolve(self, key: str) -> Tuple[Any, Tuple[str, ...]]:
+        """Resolve key once and memoize (value, contributing layer names)."""
+        cached = self._resolved.get(key)
+        if cached is not None:
+            return cached
+
+        if key in self.merge_keys:
+            result = self._resolve_merged(key)
+        else:
+            result = (_MISSING, ())
+            for name, layer in zip(reversed(self._names), reversed(self._layers)):
+                if key in layer:
+                    result = (layer[key], (name,))
+                    break
+
+        self._resolved[key] = result
+        return result
+
+    def _resolve_merged(self, key: str) -> Tuple[Any, Tuple[str, ...]]:
+        """Merge a special key across layers the way update_settings does."""
+        value = _MISSING
+        names: Tuple[str, ...] = ()
+        for name, layer in zip(self._names, self._layers):
+            if key not in layer:
+                continue
+            new_value = layer[key]
+            if value is _MISSING:
+                value, names = new_value, (name,)
+            elif new_value is not None:
+                merged = dict(value) if value is not None else {}
+                merged.update(new_value)
+                value, names = merged, names + (name,)
+        return value, names
+
+    def source_of(self, key: str) -> Optional[str]:
+        """
+        Get the name of the layer that supplied the effective value of key.
+
+        Args:
+            key: Setting key
+
+        Returns:
+            Layer name or None if the key is not set
+        """
+        _, names = self._resolve(key)
+        return names[-1] if names else None
+
+    def provenance(self, key: str) -> List[str]:
+        """
+        Get every layer that contributed to key, lowest precedence first.
+
+        Only merge keys (e.g. "patterns") can have more than one contributor.
+
+        Args:
+            key: Setting key
+
+        Returns:
+            List of layer names (empty if the key is not set)
+        """
+        _, names = self._resolve(key)
+        return list(names)
+
+    # Layer management
+
+    @property
+    def layer_names(self) -> List[str]:
+        """Names of the layers, lowest precedence first."""
+        return list(self._names)
+
+    def layer(self, name: str) -> Mapping:
+        """Get the raw mapping of a layer by name."""
+        return self._layers[self._names.index(name)]
+
+    def replace_layer(self, name: str, layer: Optional[Mapping]) -> None:
+        """
+        Swap the content of a single layer and invalidate the affected keys.
+
+        Args:
+            name: Layer name
+            layer: New mapping for the layer
+        """
+        index = self._names.index(name)
+        old_layer = self._layers[index]
+        new_layer = layer if layer is not None else {}
+        self._layers[index] = new_layer
+        for key in set(old_layer) | set(new_layer):
+            self._resolved.pop(key, None)
+        if set(old_layer) != set(new_layer):
+            self._keys = None
+
+    def reload_layer(self, name: str) -> bool:
+        """
+        Re-read a single source layer if its file or env var changed.
+
+        Args:
+            name: Layer name (e.g. "user", "current", "env:JGT_SETTINGS")
+
+        Returns:
+            True if the layer changed
+        """
+        source = self._sources.get(name)
+        if source is None:
+            raise KeyError(f"Layer {name!r} is not backed by a settings source")
+        fingerprint = core._source_fingerprint(source)
+        if fingerprint == self._fingerprints.get(name):
+            return False
+        self._fingerprints[name] = fingerprint
+        self.replace_layer(name, core._load_settings_source(source, fingerprint))
+        return True
+
+    def reload(self) -> List[str]:
+        """
+        Re-read every source layer that changed.
+
+        Returns:
+            Names of the layers that were reloaded
+        """
+        return [name for name in list(self._sources) if self.reload_layer(name)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the merged settings as an independent dictionary."""
+        return {key: copy.deepcopy(self[key]) for key in self}
+
+
+def get_layered_settings(custom_path: Optional[str] = None) -> LayeredSettings:
+    """
+    Get a layered view over the current settings sources.
+
+    Args:
+        custom_path: Optional custom path to settings file
+
+    Returns:
+        LayeredSettings instance
+    """
+    return LayeredSettings.from_sources(custom_path)
+
+
+__all__ = [
+    'LayeredSettings',
+    'get_layered_settings',
+    'DEFAULT_MERGE_KEYS',
+]
@@ -0,0 +1,211 @@
+"""
+Argument default resolver for jgtcore
+
+CLIs resolve dozens of argument defaults from settings (argname, then alias)
+and optionally from JGT environment variables (NAME, JGT_NAME, ALIAS,
+JGT_ALIAS). For a published SettingsSnapshot, ArgResolver compiles each
+argument's settings and environment lookups into a table on first use, so
+resolving a whole parser's defaults is one dictionary lookup per argument.
+Plain dicts can change in place and are read on every call.
+"""
+
+import threading
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from .. import core
+
+_MISSING = object()
+
+ArgSpec = Union[str, Tuple[Any, ...], Dict[str, Any]]
+
+# (settings value, alias settings value, JGT environment value)
+_Entry = Tuple[Any, Any, Optional[str]]
+
+
+def _load_arg_from_jgt_env(argname: str, alias: Optional[str]) -> Optional[str]:
+    from ..env.loaders import load_arg_from_jgt_env
+
+    return load_arg_from_jgt_env(argname, alias)
+
+
+class ArgResolver:
+    """
+    Resolves argument defaults against one settings mapping.
+
+    Only a SettingsSnapshot is compiled: its values cannot change, and the
+    JGT environment variables of an argument are read once, when its entry
+    is compiled. Any other mapping is looked up on every call, so changes
+    made to it in place are seen.
+    """
+
+    def __init__(self, settings: Optional[Mapping] = None):
+        """
+        Initialize the resolver.
+
+        Args:
+            settings: Settings mapping to resolve against
+        """
+        self.settings = settings if settings is not None else {}
+        self.compiled = isinstance(self.settings, core.SettingsSnapshot)
+        self._table: Dict[Tuple[str, Optional[str], Any], _Entry] = {}
+
+    def _lookup(self, argname: str, alias: Optional[str], env_alias: Any) -> _Entry:
+        settings = self.settings
+        return (
+            settings.get(argname, _MISSING),
+            settings.get(alias, _MISSING) if alias is not None else _MISSING,
+            _load_arg_from_jgt_env(argname, env_alias) if env_alias is not _MISSING else None,
+        )
+
+    def _entry(self, argname: str, alias: Optional[str], env_alias: Any = _MISSING) -> _Entry:
+        """
+        Return the (value, alias value, env value) entry of an argument.
+
+        env_alias is the alias passed to the environment lookup, or _MISSING
+        to skip the environment.
+        """
+        if not self.compiled:
+            return self._lookup(argname, alias, env_alias)
+        key = (argname, alias, env_alias)
+        entry = self._table.get(key)
+        if entry is None:
+            entry = self._table[key] = self._lookup(argname, alias, env_alias)
+        return entry
+
+    @staticmethod
+    def _settings_value(entry: _Entry, default_value: Any, alias: Optional[str]) -> Any:
+        value, alias_value, _ = entry
+        if value is _MISSING:
+            value = default_value
+        if alias is not None and value == default_value:
+            value = default_value if alias_value is _MISSING else alias_value
+        return value
+
+    def settings_value(
+        self, argname: str, default_value: Any = None, alias: Optional[str] = None
+    ) -> Any:
+        """
+        Get the settings value of an argument (argname first, then alias).
+
+        The alias is tried when the argname value equals default_value, as
+        load_arg_default_from_settings always did.
+        """
+        return self._settings_value(self._entry(argname, alias), default_value, alias)
+
+    def resolve(
+        self,
+        argname: str,
+        default_value: Any = None,
+        alias: Optional[str] = None,
+        from_jgt_env: bool = False,
+        exclude_env_alias: bool = False,
+    ) -> Any:
+        """
+        Resolve the final default of an argument.
+
+        Args:
+            argname: Argument name to look up
+            default_value: Default value if not found
+            alias: Alternative argument name to try
+            from_jgt_env: Whether a JGT environment variable overrides settings
+            exclude_env_alias: Whether to exclude alias from env lookup
+
+        Returns:
+            Value from the environment, settings or default
+        """
+        env_alias = _MISSING
+        if from_jgt_env:
+            env_alias = None if exclude_env_alias else alias
+        entry = self._entry(argname, alias, env_alias)
+        if entry[2] is not None:
+            return entry[2]
+        return self._settings_value(entry, default_value, alias)
+
+    def resolve_args(self, specs: Iterable[ArgSpec]) -> Dict[str, Any]:
+        """
+        Resolve many argument defaults at once.
+
+        Args:
+            specs: Argument names, tuples of resolve() positional arguments
+                (argname, default_value, alias, from_jgt_env, exclude_env_alias)
+                or dicts of resolve() keyword arguments
+
+        Returns:
+            Dictionary of argname to resolved value
+        """
+        resolved = {}
+        for spec in specs:
+            if isinstance(spec, str):
+                resolved[spec] = self.resolve(spec)
+            elif isinstance(spec, Mapping):
+                resolved[spec["argname"]] = self.resolve(**spec)
+            else:
+                resolved[spec[0]] = self.resolve(*spec)
+        return resolved
+
+
+# A few resolvers are kept so core and CLI settings objects do not evict
+# each other
+_RESOLVER_SLOTS = 4
+_resolver_lock = threading.Lock()
+_resolvers: Tuple[ArgResolver, ...] = ()
+
+
+def get_arg_resolver(settings: Optional[Mapping] = None) -> ArgResolver:
+    """
+    Get the resolver for a settings mapping.
+
+    Args:
+        settings: Settings mapping (defaults to jgtcore.core.settings_snapshot())
+
+    Returns:
+        The compiled ArgResolver of a SettingsSnapshot (reused for as long as
+        that snapshot is passed), or an uncompiled one for any other mapping
+    """
+    global _resolvers
+    if settings is None:
+        settings = core.settings_snapshot()
+    if not isinstance(settings, core.SettingsSnapshot):
+        return ArgResolver(settings)
+    for resolver in _resolvers:
+        if resolver.settings is settings:
+            return resolver
+    with _resolver_lock:
+        for resolver in _resolvers:
+            if resolver.settings is settings:
+                return resolver
+        resolver = ArgResolver(settings)
+        _resolvers = (resolver,) + _resolvers[: _RESOLVER_SLOTS - 1]
+        return resolver
+
+
+def clear_arg_resolvers() -> None:
+    """Drop the compiled resolvers (e.g. after changing JGT_* environment variables)."""
+    global _resolvers
+    with _resolver_lock:
+        _resolvers = ()
+
+
+def resolve_args(
+    specs: Iterable[ArgSpec], settings: Optional[Mapping] = None
+) -> Dict[str, Any]:
+    """
+    Resolve the defaults of many arguments against the current settings.
+
+    Args:
+        specs: See ArgResolver.resolve_args
+        settings: Settings mapping (defaults to jgtcore.core.settings_snapshot())
+
+    Returns:
+        Dictionary of argname to resolved value
+    """
+    return get_arg_resolver(settings).resolve_args(specs)
+
+
+__all__ = [
+    'ArgResolver',
+    'get_arg_resolver',
+    'resolve_args',
+    'clear_arg_resolvers',
+]
@@ -0,0 +1,234 @@
+"""
+Compiled ${VAR} templates for jgtcore configuration
+
+Configuration sections such as "tracing" reference environment variables as
+${VAR_NAME}. Each string is split once into literal and variable segments,
+and nested dicts/lists are compiled once into a tree that knows which
+variables it depends on. Resolution is lazy (per key on access) and cached
+against the current values of those variables, so repeated lookups with an
+unchanged environment return the previous result without rebuilding it.
+
+Resolved structures are shared between callers: treat them as read-only and
+copy before mutating.
+"""
+
+import functools
+import os
+import re
+from collections.abc import Mapping
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+_VARIABLE_PATTERN = re.compile(r"\$\{([^}]+)\}")
+
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+class Template:
+    """A string compiled into literal and ${VAR} segments."""
+
+    __slots__ = ("source", "variables", "_segments", "_cache")
+
+    def __init__(self, source: str):
+        segments: List[Tuple[str, bool]] = []
+        position = 0
+        for match in _VARIABLE_PATTERN.finditer(source):
+            if match.start() > position:
+                segments.append((source[position:match.start()], False))
+            segments.append((match.group(1), True))
+            position = match.end()
+        if position < len(source):
+            segments.append((source[position:], False))
+
+        self.source = source
+        self.variables: Tuple[str, ...] = tuple(
+            dict.fromkeys(text for text, is_variable in segments if is_variable)
+        )
+        self._segments = tuple(segments)
+        self._cache: Optional[Tuple[Tuple[Optional[str], ...], str]] = None
+
+    def render(self, environ: Optional[Mapping] = None) -> str:
+        """
+        Substitute the variables from the environment.
+
+        Unset variables are left as their ${VAR_NAME} placeholder.
+
+        Args:
+            environ: Variable mapping (defaults to os.environ)
+
+        Returns:
+            Rendered string
+        """
+        if not self.variables:
+            return self.source
+        if environ is None:
+            environ = os.environ
+        key = tuple(environ.get(name) for name in self.variables)
+        cached = self._cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        parts = []
+        for text, is_variable in self._segments:
+            if is_variable:
+                value = environ.get(text)
+                parts.append("${%s}" % text if value is None else value)
+            else:
+                parts.append(text)
+        rendered = "".join(parts)
+        self._cache = (key, rendered)
+        return rendered
+
+    def __repr__(self):
+        return f"Template({self.source!r})"
+
+
+@functools.lru_cache(maxsize=4096)
+def compile_template(source: str) -> Template:
+    """
+    Compile a string into a (shared) Template.
+
+    Args:
+        source: String possibly containing ${VAR_NAME} placeholders
+
+    Returns:
+        Compiled template
+    """
+    return Template(source)
+
+
+def _compile_node(value: Any) -> Any:
+    if isinstance(value, str):
+        template = compile_template(value)
+        return template if template.variables else value
+    if isinstance(value, dict):
+        return CompiledConfig(value)
+    if isinstance(value, list):
+        return _CompiledList(value)
+    return value
+
+
+def _node_variables(node: Any) -> FrozenSet[str]:
+    if isinstance(node, (Template, CompiledConfig, _CompiledList)):
+        return frozenset(node.variables)
+    return _EMPTY
+
+
+def _resolve_node(node: Any, environ: Optional[Mapping]) -> Any:
+    if isinstance(node, Template):
+        return node.render(environ)
+    if isinstance(node, (CompiledConfig, _CompiledList)):
+        return node.resolve(environ)
+    return node
+
+
+class _CompiledBranch:
+    """Shared caching for compiled dicts and lists."""
+
+    __slots__ = ()
+
+    def _environment_key(self, environ: Optional[Mapping]) -> Tuple[Optional[str], ...]:
+        if environ is None:
+            environ = os.environ
+        return tuple(environ.get(name) for name in self.variables)
+
+    def resolve(self, environ: Optional[Mapping] = None) -> Any:
+        """
+        Resolve the whole branch, reusing the previous result when the
+        variables it depends on are unchanged.
+
+        Args:
+            environ: Variable mapping (defaults to os.environ)
+
+        Returns:
+            Resolved dict or list (shared, read-only)
+        """
+        if not self.variables:
+            return self._constant
+        key = self._environment_key(environ)
+        cached = self._cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        resolved = self._build(environ)
+        self._cache = (key, resolved)
+        return resolved
+
+
+class _CompiledList(_CompiledBranch):
+    __slots__ = ("_nodes", "variables", "_constant", "_cache")
+
+    def __init__(self, items: List[Any]):
+        self._nodes = tuple(_compile_node(item) for item in items)
+        self.variables = tuple(sorted(set().union(*map(_node_variables, self._nodes))))
+        self._cache = None
+        self._constant = None if self.variables else self._build(None)
+
+    def _build(self, environ: Optional[Mapping]) -> List[Any]:
+        return [_resolve_node(node, environ) for node in self._nodes]
+
+
+class CompiledConfig(_CompiledBranch, Mapping):
+    """
+    A configuration dict compiled once for ${VAR} resolution.
+
+    Item access resolves only the requested key; resolve() materializes the
+    whole tree. Both are cached against the values of the variables involved.
+    """
+
+    __slots__ = ("_nodes", "variables", "_constant", "_cache")
+
+    def __init__(self, config: Dict[str, Any]):
+        self._nodes = {key: _compile_node(value) for key, value in config.items()}
+        self.variables = tuple(sorted(set().union(*map(_node_variables, self._nodes.values()))))
+        self._cache = None
+        self._constant = None if self.variables else self._build(None)
+
+    def __getitem__(self, key: str) -> Any:
+        return _resolve_node(self._nodes[key], None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._nodes
+
+    def _build(self, environ: Optional[Mapping]) -> Dict[str, Any]:
+        return {key: _resolve_node(node, environ) for key, node in self._nodes.items()}
+
+    def __repr__(self):
+        return f"CompiledConfig(keys={list(self._nodes)!r}, variables={list(self.variables)!r})"
+
+
+def compile_config(config: Dict[str, Any]) -> CompiledConfig:
+    """
+    Compile a configuration dict for repeated ${VAR} resolution.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        CompiledConfig view
+    """
+    return CompiledConfig(config)
+
+
+def resolve_templates(value: Any, environ: Optional[Mapping] = None) -> Any:
+    """
+    Resolve ${VAR_NAME} placeholders in a string, dict or list.
+
+    Strings use the shared compiled template cache; containers are compiled
+    for this call and returned as new objects.
+
+    Args:
+        value: Value to resolve
+        environ: Variable mapping (defaults to os.environ)
+
+    Returns:
+        Resolved value
+    """
+    node = _compile_node(value)
+    if isinstance(node, (CompiledConfig, _CompiledList)) and not node.variables:
+        return node._constant.copy()
+    return _resolve_node(node, environ)
@@ -0,0 +1,231 @@
+"""
+Settings hot-reload watcher for jgtcore
+
+Long-running daemons can opt into a background thread that polls the stat of
+every source consulted by load_settings and readconfig. When one changes, the
+new settings are swapped in as jgtcore.core.settings (a single reference
+assignment) and subscribers are notified with only the keys that changed.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .. import core
+
+# Subscription sources
+SETTINGS = "settings"
+CONFIG = "config"
+
+_MISSING = object()
+
+ChangeCallback = Callable[[Dict[str, Any]], None]
+
+
+def diff_mappings(old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Compute the keys whose value differs between two mappings.
+
+    Args:
+        old: Previous mapping
+        new: Current mapping
+
+    Returns:
+        Dictionary of changed keys to their new value (None if removed)
+    """
+    old = old or {}
+    new = new or {}
+    changed = {}
+    for key in list(old) + [k for k in new if k not in old]:
+        new_value = new.get(key, _MISSING)
+        if old.get(key, _MISSING) != new_value:
+            changed[key] = None if new_value is _MISSING else new_value
+    return changed
+
+
+class SettingsWatcher:
+    """
+    Background poller that reloads settings and config when a source changes.
+
+    Usage:
+        watcher = SettingsWatcher(interval=2.0)
+        watcher.subscribe("quotes_count", on_change)
+        watcher.start()
+    """
+
+    def __init__(
+        self,
+        interval: float = 2.0,
+        custom_path: Optional[str] = None,
+        watch_config: bool = True,
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            interval: Seconds between two polls
+            custom_path: Optional custom path to settings file
+            watch_config: Whether to also watch the readconfig source
+        """
+        self.interval = interval
+        self.custom_path = custom_path
+        self.watch_config = watch_config
+        self._subscribers: List[Tuple[str, Optional[frozenset], ChangeCallback]] = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._settings = core.get_settings(custom_path)
+        self._config = self._current_config()
+
+    def _current_config(self) -> Optional[Dict[str, Any]]:
+        """Return the shared parsed config, or None if no config is available."""
+        if not self.watch_config:
+            return None
+        try:
+            return core._readconfig_shared()
+        except Exception:
+            return None
+
+    # Subscriptions
+
+    def subscribe(
+        self,
+        keys: Union[str, Iterable[str], None],
+        callback: ChangeCallback,
+        source: str = SETTINGS,
+    ) -> ChangeCallback:
+        """
+        Register a callback for changes of some keys.
+
+        Args:
+            keys: Key, iterable of keys, or None for every key
+            callback: Called with {key: new_value} for the changed keys only
+                (removed keys map to None)
+            source: SETTINGS or CONFIG
+
+        Returns:
+            The callback, so it can be passed to unsubscribe()
+        """
+        if source not in (SETTINGS, CONFIG):
+            raise ValueError(f"source must be {SETTINGS!r} or {CONFIG!r}")
+        if isinstance(keys, str):
+            keys = [keys]
+        key_filter = frozenset(keys) if keys is not None else None
+        with self._lock:
+            self._subscribers.append((source, key_filter, callback))
+        return callback
+
+    def unsubscribe(self, callback: ChangeCallback) -> None:
+        """Remove every subscription of callback."""
+        with self._lock:
+            self._subscribers = [s for s in self._subscribers if s[2] is not callback]
+
+    def _notify(self, source: str, changed: Dict[str, Any]) -> None:
+        """Dispatch changed keys to the matching subscribers."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for sub_source, key_filter, callback in subscribers:
+            if sub_source != source:
+                continue
+            if key_filter is None:
+                relevant = changed
+            else:
+                relevant = {k: v for k, v in changed.items() if k in key_filter}
+            if not relevant:
+                continue
+            try:
+                callback(relevant)
+            except Exception as e:
+                print(f"Warning: settings watcher callback failed: {e}")
+
+    # Polling
+
+    def poll_once(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Check every source once and swap in new settings/config if needed.
+
+        Returns:
+            {"settings": changed_keys, "config": changed_keys} (empty if unchanged)
+        """
+        changes: Dict[str, Dict[str, Any]] = {}
+
+        new_settings = core.get_settings(self.custom_path)
+        if new_settings is not self._settings:
+            changed = diff_mappings(self._settings, new_settings)
+            self._settings = new_settings
+            if changed:
+                changes[SETTINGS] = changed
+                self._notify(SETTINGS, changed)
+
+        if self.watch_config:
+            new_config = self._current_config()
+            if new_config is not self._config:
+                changed = diff_mappings(self._config, new_config)
+                self._config = new_config
+                if changed:
+                    changes[CONFIG] = changed
+                    self._notify(CONFIG, changed)
+
+        return changes
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.poll_once()
+            except Exception as e:
+                print(f"Warning: settings watcher poll failed: {e}")
+
+    def start(self) -> "SettingsWatcher":
+        """Start the background polling thread (no-op if already running)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="jgtcore-settings-watcher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background polling thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        """True while the polling thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def __enter__(self) -> "SettingsWatcher":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+def watch_settings(
+    interval: float = 2.0,
+    custom_path: Optional[str] = None,
+    watch_config: bool = True,
+) -> SettingsWatcher:
+    """
+    Create and start a settings watcher.
+
+    Args:
+        interval: Seconds between two polls
+        custom_path: Optional custom path to settings file
+        watch_config: Whether to also watch the readconfig source
+
+    Returns:
+        The running SettingsWatcher
+    """
+    return SettingsWatcher(interval, custom_path, watch_config).start()
+
+
+__all__ = [
+    'SettingsWatcher',
+    'watch_settings',
+    'diff_mappings',
+    'SETTINGS',
+    'CONFIG',
+]
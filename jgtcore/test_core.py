@@ -12,10 +12,13 @@ import sys
 import tempfile
 from datetime import datetime
 
-# Add jgtcore to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Import jgtcore as a package: run as a script, this directory is first on
+# the path and its modules (e.g. logging) would shadow the standard library
+_HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:] = [p for p in sys.path if os.path.abspath(p or os.curdir) != _HERE]
+sys.path.insert(0, os.path.dirname(_HERE))
 
-import core
+from jgtcore import core
 
 
 def test_str_to_datetime():
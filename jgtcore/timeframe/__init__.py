@@ -0,0 +1,136 @@
+"""
+Timeframe module for jgtcore
+
+This module contains the timeframe scheduling logic extracted from
+jgtutils.timeframe_scheduler, without CLI dependencies:
+- Trigger checks and waiting (get_times_by_timeframe_str, is_timeframe_reached,
+  wait_for_timeframe, TimeframeChecker)
+- Arithmetic boundary engine (is_boundary, next_boundary, bar_open) working
+  on wall-clock minute ordinals instead of lists of time strings
+- TimeframeScheduler: one thread dispatching callbacks at exact boundaries
+- asyncio API (aiter_timeframes, wait_for_timeframe_async)
+- Vectorized bar bucketing of NumPy/pandas timestamp arrays (bucket)
+- Session calendar: daily close instants (17:00 New York) tabled per year
+- Market hours: interval table with holidays, vectorized is_market_open,
+  bars_back (start of the last N tradable bars)
+- Pluggable clock (SystemClock, ReplayClock) for fast-forward replay
+- Timeframe registry: interned records (minutes, filename code, poll interval)
+"""
+
+from .triggers import (
+    get_current_time,
+    get_times_by_timeframe_str,
+    get_timeframes_times_by_minutes,
+    get_timeframe_daily_ending_time,
+    is_timeframe_reached,
+    wait_for_timeframe,
+    TimeframeChecker,
+    simulate_timeframe_reached,
+    get_sleep_duration_for_timeframe,
+)
+
+from .sessions import (
+    SessionCalendar,
+    get_session_calendar,
+    set_session_calendar,
+    HAS_ZONEINFO,
+)
+
+from .clock import (
+    Clock,
+    SystemClock,
+    ReplayClock,
+    get_clock,
+    set_clock,
+    wall_now,
+)
+
+from .boundaries import (
+    TimeframeSpec,
+    parse_timeframe,
+    timeframe_minutes,
+    daily_close_minute,
+    is_boundary,
+    previous_boundary,
+    next_boundary,
+    bar_open,
+)
+
+from .registry import (
+    Timeframe,
+    get_timeframe,
+    find_timeframe,
+    registered_timeframes,
+)
+
+from .scheduler import (
+    TimeframeScheduler,
+)
+
+from .aio import (
+    TimeframeEvent,
+    aiter_timeframes,
+    wait_for_timeframe_async,
+)
+
+from .bucket import (
+    bucket,
+    HAS_NUMPY,
+)
+
+from .market import (
+    MarketHours,
+    get_market_hours,
+    is_market_open,
+    next_market_open,
+    next_market_close,
+    bars_back,
+    bars_back_many,
+)
+
+__all__ = [
+    'get_current_time',
+    'get_times_by_timeframe_str',
+    'get_timeframes_times_by_minutes',
+    'get_timeframe_daily_ending_time',
+    'is_timeframe_reached',
+    'wait_for_timeframe',
+    'TimeframeChecker',
+    'simulate_timeframe_reached',
+    'get_sleep_duration_for_timeframe',
+    'SessionCalendar',
+    'get_session_calendar',
+    'set_session_calendar',
+    'HAS_ZONEINFO',
+    'Clock',
+    'SystemClock',
+    'ReplayClock',
+    'get_clock',
+    'set_clock',
+    'wall_now',
+    'TimeframeSpec',
+    'parse_timeframe',
+    'timeframe_minutes',
+    'daily_close_minute',
+    'is_boundary',
+    'previous_boundary',
+    'next_boundary',
+    'bar_open',
+    'Timeframe',
+    'get_timeframe',
+    'find_timeframe',
+    'registered_timeframes',
+    'TimeframeScheduler',
+    'TimeframeEvent',
+    'aiter_timeframes',
+    'wait_for_timeframe_async',
+    'bucket',
+    'HAS_NUMPY',
+    'MarketHours',
+    'get_market_hours',
+    'is_market_open',
+    'next_market_open',
+    'next_market_close',
+    'bars_back',
+    'bars_back_many',
+]
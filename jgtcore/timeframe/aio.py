@@ -0,0 +1,92 @@
+"""
+asyncio API for timeframe boundaries
+
+Non-blocking counterparts of wait_for_timeframe and the scheduler loop:
+
+    async for event in aiter_timeframes(["m5", "H1", "D1"]):
+        refresh(event.timeframe, event.boundary)
+
+Boundaries come from the same engine (and daily close rule) as the
+synchronous API; waiting is done with asyncio.sleep only, or by advancing
+the active clock when it is not real-time (ReplayClock).
+"""
+
+import asyncio
+import datetime
+from typing import AsyncIterator, Iterable, NamedTuple, Optional
+
+from .scheduler import TimeframeScheduler
+from .clock import get_clock, wall_now
+from .triggers import is_timeframe_reached, next_boundary
+
+
+async def _sleep(seconds: float) -> None:
+    """Sleep on the active clock, yielding to the event loop."""
+    clock = get_clock()
+    if clock.realtime:
+        await asyncio.sleep(seconds)
+    else:
+        clock.sleep(seconds)
+        await asyncio.sleep(0)
+
+
+class TimeframeEvent(NamedTuple):
+    """A timeframe boundary that was reached."""
+
+    timeframe: str
+    boundary: datetime.datetime
+
+
+async def aiter_timeframes(timeframes: Iterable[str]) -> AsyncIterator[TimeframeEvent]:
+    """
+    Yield an event at every boundary of the given timeframes.
+
+    Timeframes due at the same instant are yielded back to back, shortest
+    timeframe first. The iterator never ends on its own.
+
+    Args:
+        timeframes: Timeframe strings (e.g. ["m5", "H1", "D1"])
+
+    Yields:
+        TimeframeEvent for each boundary reached
+    """
+    scheduler = TimeframeScheduler(timeframes)
+    while True:
+        delay = scheduler.seconds_until_next()
+        if delay is None:
+            return
+        if delay > 0:
+            await _sleep(delay)
+        for timeframe, boundary in scheduler.run_pending():
+            yield TimeframeEvent(timeframe, boundary)
+
+
+async def wait_for_timeframe_async(
+    timeframe: str, max_wait_seconds: Optional[float] = None
+) -> bool:
+    """
+    Wait until the timeframe is reached without blocking the event loop.
+
+    Args:
+        timeframe: Timeframe to wait for
+        max_wait_seconds: Maximum seconds to wait (None = wait indefinitely)
+
+    Returns:
+        True if timeframe was reached, False if max_wait_seconds exceeded
+    """
+    if is_timeframe_reached(timeframe):
+        return True
+
+    clock = get_clock()
+    deadline = None if max_wait_seconds is None else clock.monotonic() + max_wait_seconds
+    target = next_boundary(wall_now(), timeframe)
+    while True:
+        remaining = (target - wall_now()).total_seconds()
+        if remaining <= 0:
+            return True
+        if deadline is not None:
+            left = deadline - clock.monotonic()
+            if left <= 0:
+                return False
+            remaining = min(remaining, left)
+        await _sleep(remaining)
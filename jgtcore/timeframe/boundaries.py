@@ -0,0 +1,277 @@
+"""
+Arithmetic timeframe boundary engine
+
+Times are reduced to wall-clock minute ordinals (date.toordinal() * 1440 +
+minute of day) and every boundary question is answered with integer
+arithmetic against a cached (unit, multiple, minutes) table:
+
+- m frames reset every hour (m15 -> :00, :15, :30, :45)
+- H frames (and m frames of an hour or more) reset every day at 01:00
+  (H4 -> 01:00, 05:00, 09:00, 13:00, 17:00, 21:00)
+- D, W and M frames trigger at the daily close; their bars open at the
+  daily close of the previous day, the Sunday close and the close of the
+  last day of the previous month respectively
+
+Daily closes come from the session calendar (jgtcore.timeframe.sessions),
+expressed in its wall-clock time zone (local time by default). Naive
+datetimes are wall-clock readings; aware datetimes are converted to the wall
+clock and results are converted back to their time zone.
+"""
+
+import datetime
+import functools
+from typing import NamedTuple
+
+from .sessions import get_session_calendar
+
+MINUTES_PER_HOUR = 60
+MINUTES_PER_DAY = 24 * 60
+
+# Hour at which H frames (and m frames of an hour or more) reset each day
+H_FRAME_ANCHOR_MINUTE = 60
+
+_UNIT_MINUTES = {
+    "m": 1,
+    "H": MINUTES_PER_HOUR,
+    "D": MINUTES_PER_DAY,
+    "W": 7 * MINUTES_PER_DAY,
+    "M": 30 * MINUTES_PER_DAY,  # nominal, months are handled by calendar
+}
+
+
+class TimeframeSpec(NamedTuple):
+    """Parsed timeframe: unit letter, multiple and nominal length in minutes."""
+
+    unit: str
+    multiple: int
+    minutes: int
+
+
+@functools.lru_cache(maxsize=None)
+def parse_timeframe(timeframe: str) -> TimeframeSpec:
+    """
+    Parse a timeframe string such as "m5", "H4" or "D1".
+
+    Args:
+        timeframe: Timeframe string
+
+    Returns:
+        TimeframeSpec for the timeframe
+
+    Raises:
+        ValueError: If the timeframe is not recognised
+    """
+    unit, digits = timeframe[:1], timeframe[1:]
+    if unit not in _UNIT_MINUTES or not digits.isdigit() or int(digits) <= 0:
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+    multiple = int(digits)
+    return TimeframeSpec(unit, multiple, multiple * _UNIT_MINUTES[unit])
+
+
+def timeframe_minutes(timeframe: str) -> int:
+    """
+    Get the nominal length of a timeframe in minutes.
+
+    Args:
+        timeframe: Timeframe string
+
+    Returns:
+        Minutes per bar (months count as 30 days)
+    """
+    return parse_timeframe(timeframe).minutes
+
+
+def minute_ordinal(dt: datetime.datetime) -> int:
+    """Wall-clock minute ordinal of a datetime (seconds are dropped)."""
+    return dt.toordinal() * MINUTES_PER_DAY + dt.hour * MINUTES_PER_HOUR + dt.minute
+
+
+def from_minute_ordinal(ordinal: int, tzinfo=None) -> datetime.datetime:
+    """Datetime for a wall-clock minute ordinal."""
+    day, minute = divmod(ordinal, MINUTES_PER_DAY)
+    return datetime.datetime.fromordinal(day).replace(
+        hour=minute // MINUTES_PER_HOUR, minute=minute % MINUTES_PER_HOUR, tzinfo=tzinfo
+    )
+
+
+def _wall_ordinal(dt: datetime.datetime) -> int:
+    """Minute ordinal of dt on the calendar's wall clock (aware dt is converted)."""
+    if dt.tzinfo is not None:
+        dt = get_session_calendar().to_wall(dt)
+    return minute_ordinal(dt)
+
+
+def _from_wall_ordinal(ordinal: int, tzinfo=None) -> datetime.datetime:
+    """Datetime for a wall-clock minute ordinal, converted to tzinfo if given."""
+    wall = from_minute_ordinal(ordinal)
+    if tzinfo is None:
+        return wall
+    return get_session_calendar().from_wall(wall).astimezone(tzinfo)
+
+
+# Daily close
+
+
+def daily_close_minute(day: int) -> int:
+    """
+    Wall-clock minute of the daily close for a day ordinal.
+
+    Looked up in the session calendar: 17:00 New York, i.e. 21:00 UTC during
+    US daylight saving time and 22:00 UTC otherwise.
+
+    Args:
+        day: Day ordinal (date.toordinal())
+
+    Returns:
+        Minutes after that day's midnight
+    """
+    return get_session_calendar().close_offset(day)
+
+
+def _close_on(day: int) -> int:
+    return day * MINUTES_PER_DAY + daily_close_minute(day)
+
+
+def _floor_close(ordinal: int) -> int:
+    """Latest daily close at or before ordinal."""
+    day = ordinal // MINUTES_PER_DAY + 1
+    close = _close_on(day)
+    while close > ordinal:
+        day -= 1
+        close = _close_on(day)
+    return close
+
+
+# Trigger boundaries
+
+
+def _floor_trigger(ordinal: int, spec: TimeframeSpec) -> int:
+    """Latest trigger boundary at or before ordinal."""
+    minutes = spec.minutes
+    if minutes < MINUTES_PER_HOUR:
+        return ordinal - (ordinal % MINUTES_PER_HOUR) % minutes
+    if minutes < MINUTES_PER_DAY:
+        offset = (ordinal - H_FRAME_ANCHOR_MINUTE) % MINUTES_PER_DAY
+        return ordinal - offset % minutes
+    close = _floor_close(ordinal)
+    if spec.unit == "D" and spec.multiple > 1:
+        while (close // MINUTES_PER_DAY) % spec.multiple:
+            close = _floor_close(close - 1)
+    return close
+
+
+def _next_trigger(ordinal: int, spec: TimeframeSpec) -> int:
+    """First trigger boundary strictly after ordinal."""
+    minutes = spec.minutes
+    floor = _floor_trigger(ordinal, spec)
+    if minutes < MINUTES_PER_HOUR:
+        hour_end = ordinal - ordinal % MINUTES_PER_HOUR + MINUTES_PER_HOUR
+        return min(floor + minutes, hour_end)
+    if minutes < MINUTES_PER_DAY:
+        offset = (ordinal - H_FRAME_ANCHOR_MINUTE) % MINUTES_PER_DAY
+        day_end = ordinal - offset + MINUTES_PER_DAY
+        return min(floor + minutes, day_end)
+    day = floor // MINUTES_PER_DAY + 1
+    while spec.unit == "D" and day % spec.multiple:
+        day += 1
+    return _close_on(day)
+
+
+# Bar opens
+
+
+def _floor_bar_open(ordinal: int, spec: TimeframeSpec) -> int:
+    """Open of the bar containing ordinal."""
+    if spec.unit in ("m", "H", "D"):
+        return _floor_trigger(ordinal, spec)
+    if spec.unit == "W":
+        # Weeks open at the Sunday close (Sunday: ordinal % 7 == 0)
+        close = _floor_close(ordinal)
+        day = close // MINUTES_PER_DAY
+        sunday = day - day % 7
+        open_ = _close_on(sunday)
+        if open_ > ordinal:
+            sunday -= 7
+            open_ = _close_on(sunday)
+        week = sunday // 7
+        return _close_on(sunday - 7 * (week % spec.multiple))
+    # Months open at the close of the last day of the previous month
+    date = datetime.date.fromordinal(ordinal // MINUTES_PER_DAY)
+    month_index = date.year * 12 + date.month - 1
+    open_ = _month_open(month_index)
+    if open_ > ordinal:
+        month_index -= 1
+        open_ = _month_open(month_index)
+    return _month_open(month_index - month_index % spec.multiple)
+
+
+def _month_open(month_index: int) -> int:
+    year, month = divmod(month_index, 12)
+    return _close_on(datetime.date(year, month + 1, 1).toordinal() - 1)
+
+
+# Public datetime API
+
+
+def is_boundary(dt: datetime.datetime, timeframe: str) -> bool:
+    """
+    Check if dt falls in the minute of a trigger boundary of the timeframe.
+
+    Args:
+        dt: Wall-clock datetime (aware datetimes are converted to the
+            wall clock; the result is in their time zone)
+        timeframe: Timeframe string
+
+    Returns:
+        True if dt's minute is a trigger boundary
+    """
+    ordinal = _wall_ordinal(dt)
+    return _floor_trigger(ordinal, parse_timeframe(timeframe)) == ordinal
+
+
+def previous_boundary(dt: datetime.datetime, timeframe: str) -> datetime.datetime:
+    """
+    Get the latest trigger boundary at or before dt.
+
+    Args:
+        dt: Wall-clock datetime (aware datetimes are converted to the
+            wall clock; the result is in their time zone)
+        timeframe: Timeframe string
+
+    Returns:
+        Boundary datetime
+    """
+    ordinal = _floor_trigger(_wall_ordinal(dt), parse_timeframe(timeframe))
+    return _from_wall_ordinal(ordinal, dt.tzinfo)
+
+
+def next_boundary(dt: datetime.datetime, timeframe: str) -> datetime.datetime:
+    """
+    Get the first trigger boundary strictly after dt.
+
+    Args:
+        dt: Wall-clock datetime (aware datetimes are converted to the
+            wall clock; the result is in their time zone)
+        timeframe: Timeframe string
+
+    Returns:
+        Boundary datetime
+    """
+    ordinal = _next_trigger(_wall_ordinal(dt), parse_timeframe(timeframe))
+    return _from_wall_ordinal(ordinal, dt.tzinfo)
+
+
+def bar_open(dt: datetime.datetime, timeframe: str) -> datetime.datetime:
+    """
+    Get the open time of the bar of the timeframe that contains dt.
+
+    Args:
+        dt: Wall-clock datetime (aware datetimes are converted to the
+            wall clock; the result is in their time zone)
+        timeframe: Timeframe string
+
+    Returns:
+        Bar open datetime
+    """
+    ordinal = _floor_bar_open(_wall_ordinal(dt), parse_timeframe(timeframe))
+    return _from_wall_ordinal(ordinal, dt.tzinfo)
@@ -0,0 +1,173 @@
+"""
+Vectorized bar bucketing
+
+bucket(timestamps, timeframe) maps every timestamp to the open time of its
+bar with the same semantics as jgtcore.timeframe.bar_open (m frames per
+hour, H frames from 01:00, D/W/M frames from the daily close), computed on
+whole NumPy datetime64 arrays (or pandas DatetimeIndex/Series) at once.
+Naive values are wall-clock times; time zone aware pandas values are
+converted to the session calendar's wall clock and back.
+
+Without NumPy, sequences of datetimes are bucketed one by one.
+"""
+
+import datetime
+import importlib.util
+from typing import Any
+
+# Optional NumPy support; numpy is only imported when an array is bucketed.
+try:
+    HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+except ImportError:
+    HAS_NUMPY = False
+np = None
+
+from .boundaries import (
+    H_FRAME_ANCHOR_MINUTE,
+    MINUTES_PER_DAY,
+    MINUTES_PER_HOUR,
+    bar_open,
+    daily_close_minute,
+    parse_timeframe,
+)
+from .sessions import get_session_calendar
+
+# date.toordinal() of 1970-01-01: converts epoch days to day ordinals
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+# Days of margin kept before the first timestamp when tabling daily closes
+_CLOSE_TABLE_MARGIN_DAYS = 40
+
+
+def _get_numpy():
+    """Return the numpy module, importing it on first use."""
+    global np
+    if np is None:
+        import numpy
+
+        np = numpy
+    return np
+
+
+def _close_table(first_day: int, last_day: int) -> "np.ndarray":
+    """Daily close (epoch minute) for each epoch day in [first_day, last_day]."""
+    days = range(first_day, last_day + 1)
+    minutes = [daily_close_minute(day + EPOCH_ORDINAL) for day in days]
+    return np.arange(first_day, last_day + 1, dtype=np.int64) * MINUTES_PER_DAY + np.asarray(
+        minutes, dtype=np.int64
+    )
+
+
+def bucket_minutes(minutes: "np.ndarray", timeframe: str) -> "np.ndarray":
+    """
+    Bucket epoch minutes (int64, wall clock) into bar-open epoch minutes.
+
+    Args:
+        minutes: Minutes since 1970-01-01 00:00 (wall clock)
+        timeframe: Timeframe string
+
+    Returns:
+        Bar-open epoch minutes (int64 array)
+    """
+    np = _get_numpy()
+    spec = parse_timeframe(timeframe)
+    minutes = np.asarray(minutes, dtype=np.int64)
+    if spec.minutes < MINUTES_PER_HOUR:
+        return minutes - (minutes % MINUTES_PER_HOUR) % spec.minutes
+    if spec.minutes < MINUTES_PER_DAY:
+        offset = (minutes - H_FRAME_ANCHOR_MINUTE) % MINUTES_PER_DAY
+        return minutes - offset % spec.minutes
+    if minutes.size == 0:
+        return minutes.copy()
+
+    days = minutes // MINUTES_PER_DAY
+    margin = _CLOSE_TABLE_MARGIN_DAYS + 31 * spec.multiple
+    first_day = int(days.min()) - margin
+    closes = _close_table(first_day, int(days.max()) + 2)
+
+    def close_on(day):
+        return closes[day - first_day]
+
+    # The close can fall on the previous/next wall-clock day for far-off zones
+    floor_day = days + 1
+    for _ in range(3):
+        floor_day = np.where(close_on(floor_day) > minutes, floor_day - 1, floor_day)
+
+    if spec.unit == "D":
+        if spec.multiple > 1:
+            floor_day = floor_day - (floor_day + EPOCH_ORDINAL) % spec.multiple
+        return close_on(floor_day)
+
+    if spec.unit == "W":
+        # Weeks open at the Sunday close (Sunday: day ordinal % 7 == 0)
+        sunday = floor_day - (floor_day + EPOCH_ORDINAL) % 7
+        sunday = np.where(close_on(sunday) > minutes, sunday - 7, sunday)
+        week = (sunday + EPOCH_ORDINAL) // 7
+        return close_on(sunday - 7 * (week % spec.multiple))
+
+    # Months open at the close of the last day of the previous month
+    month = days.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+    month = np.where(_month_open(month, close_on) > minutes, month - 1, month)
+    month_index = month + 1970 * 12
+    return _month_open(month - month_index % spec.multiple, close_on)
+
+
+def _month_open(month: "np.ndarray", close_on) -> "np.ndarray":
+    first_day = month.astype("datetime64[M]").astype("datetime64[D]").astype(np.int64)
+    return close_on(first_day - 1)
+
+
+def _bucket_datetime64(values: "np.ndarray", timeframe: str) -> "np.ndarray":
+    np = _get_numpy()
+    values = np.asarray(values)
+    if not np.issubdtype(values.dtype, np.datetime64):
+        values = values.astype("datetime64[ns]")
+    missing = np.isnat(values)
+    minutes = values.astype("datetime64[m]").astype(np.int64)
+    if missing.any():
+        minutes = np.where(missing, 0, minutes)
+    opened = bucket_minutes(minutes, timeframe).astype("datetime64[m]").astype(values.dtype)
+    if missing.any():
+        opened[missing] = np.datetime64("NaT")
+    return opened
+
+
+def _bucket_pandas(timestamps: Any, timeframe: str) -> Any:
+    import pandas as pd
+
+    index = pd.DatetimeIndex(timestamps)
+    tz = index.tz
+    if tz is not None:
+        # Bars are cut on the calendar's wall clock: convert, bucket, convert back
+        zone = get_session_calendar().wall_tzinfo()
+        wall = index.tz_convert(zone).tz_localize(None)
+    else:
+        wall = index
+    opened = pd.DatetimeIndex(_bucket_datetime64(wall.values, timeframe), name=index.name)
+    if tz is not None:
+        opened = opened.tz_localize(zone, ambiguous=True, nonexistent="shift_forward").tz_convert(tz)
+    if isinstance(timestamps, pd.Series):
+        return pd.Series(opened, index=timestamps.index, name=timestamps.name)
+    return opened
+
+
+def bucket(timestamps: Any, timeframe: str) -> Any:
+    """
+    Map timestamps to the open time of their bar.
+
+    Args:
+        timestamps: NumPy datetime64 array, pandas DatetimeIndex/Series,
+            a datetime, or a sequence of datetimes
+        timeframe: Timeframe string (m5, m15, H1, H4, D1, W1, M1, ...)
+
+    Returns:
+        Bar-open times in the same container type (a NumPy array for other
+        sequences, or a list of datetimes when NumPy is unavailable)
+    """
+    if isinstance(timestamps, datetime.datetime):
+        return bar_open(timestamps, timeframe)
+    if type(timestamps).__module__.startswith("pandas"):
+        return _bucket_pandas(timestamps, timeframe)
+    if not HAS_NUMPY:
+        return [bar_open(ts, timeframe) for ts in timestamps]
+    return _bucket_datetime64(timestamps, timeframe)
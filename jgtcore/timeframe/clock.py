@@ -0,0 +1,194 @@
+"""
+Pluggable clock for timeframe logic
+
+Every "now", sleep and timeout in jgtcore.timeframe goes through the active
+Clock. SystemClock (the default) reads the session calendar's wall clock and
+sleeps in real time; ReplayClock keeps a virtual time that sleep() advances
+instantly, so waits, checkers and the scheduler can be driven from one
+boundary to the next without mocking datetime:
+
+    with ReplayClock(datetime.datetime(2024, 1, 1)) as clock:
+        scheduler = TimeframeScheduler(["m5", "H1"], on_boundary)
+        scheduler.run_until(datetime.datetime(2025, 1, 1))
+"""
+
+import abc
+import datetime
+import time
+from typing import Iterable, List, Optional, Tuple, Union
+
+from .boundaries import next_boundary
+from .sessions import get_session_calendar
+
+Duration = Union[float, datetime.timedelta]
+
+
+def _seconds(duration: Duration) -> float:
+    if isinstance(duration, datetime.timedelta):
+        return duration.total_seconds()
+    return float(duration)
+
+
+class Clock(abc.ABC):
+    """
+    Time source of the timeframe engine.
+
+    Subclasses must provide now() (naive wall-clock datetime), sleep(seconds)
+    and monotonic() (seconds for timeouts). realtime is False for clocks
+    whose sleep() does not wait.
+    """
+
+    realtime = True
+
+    @abc.abstractmethod
+    def now(self) -> datetime.datetime:
+        """Current naive wall-clock time."""
+
+    @abc.abstractmethod
+    def sleep(self, seconds: float) -> None:
+        """Wait seconds (instantly on virtual clocks)."""
+
+    @abc.abstractmethod
+    def monotonic(self) -> float:
+        """Seconds from an arbitrary origin, for timeouts."""
+
+
+class SystemClock(Clock):
+    """Wall clock of the session calendar, real-time sleeps."""
+
+    def now(self) -> datetime.datetime:
+        return get_session_calendar().now()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def __repr__(self):
+        return "SystemClock()"
+
+
+class ReplayClock(Clock):
+    """
+    Virtual clock that sleeps instantly and jumps between boundaries.
+
+    Used as a context manager it installs itself as the active clock and
+    restores the previous one on exit.
+
+    Usage:
+        with ReplayClock(datetime.datetime(2024, 7, 10, 8, 59)) as clock:
+            clock.jump(["m5", "H1"])  # 09:00, ["m5", "H1"]
+    """
+
+    realtime = False
+
+    def __init__(self, start: Optional[datetime.datetime] = None):
+        """
+        Initialize the clock.
+
+        Args:
+            start: Initial wall-clock time (defaults to the current time)
+        """
+        self._now = start if start is not None else get_session_calendar().now()
+        self._elapsed = 0.0
+        self._previous: List[Clock] = []
+
+    def now(self) -> datetime.datetime:
+        return self._now
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self.advance(seconds)
+
+    def monotonic(self) -> float:
+        return self._elapsed
+
+    def advance(self, duration: Duration) -> datetime.datetime:
+        """
+        Move the clock forward.
+
+        Args:
+            duration: Seconds or timedelta (negative values are ignored)
+
+        Returns:
+            The new time
+        """
+        seconds = _seconds(duration)
+        if seconds > 0:
+            self._now += datetime.timedelta(seconds=seconds)
+            self._elapsed += seconds
+        return self._now
+
+    def set(self, when: datetime.datetime) -> datetime.datetime:
+        """
+        Move the clock to a time (forward or backward).
+
+        monotonic() only ever moves forward.
+
+        Args:
+            when: New wall-clock time
+
+        Returns:
+            The new time
+        """
+        self._elapsed += max((when - self._now).total_seconds(), 0.0)
+        self._now = when
+        return self._now
+
+    def jump(self, timeframes: Iterable[str]) -> Tuple[datetime.datetime, List[str]]:
+        """
+        Advance to the next boundary of any of the timeframes.
+
+        Args:
+            timeframes: Timeframe strings
+
+        Returns:
+            (boundary, timeframes due at it)
+        """
+        upcoming = [(next_boundary(self._now, tf), tf) for tf in timeframes]
+        if not upcoming:
+            raise ValueError("jump() needs at least one timeframe")
+        boundary = min(when for when, _ in upcoming)
+        self.set(boundary)
+        return boundary, [tf for when, tf in upcoming if when == boundary]
+
+    def __enter__(self) -> "ReplayClock":
+        self._previous.append(set_clock(self))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        set_clock(self._previous.pop())
+
+    def __repr__(self):
+        return f"ReplayClock({self._now!r})"
+
+
+_clock: Clock = SystemClock()
+
+
+def get_clock() -> Clock:
+    """Get the clock used by the timeframe engine."""
+    return _clock
+
+
+def set_clock(clock: Optional[Clock] = None) -> Clock:
+    """
+    Replace the clock used by the timeframe engine.
+
+    Args:
+        clock: New clock (None restores the system clock)
+
+    Returns:
+        The previous clock
+    """
+    global _clock
+    previous = _clock
+    _clock = clock if clock is not None else SystemClock()
+    return previous
+
+
+def wall_now() -> datetime.datetime:
+    """Current naive wall-clock time of the active clock."""
+    return _clock.now()
@@ -0,0 +1,395 @@
+"""
+Calendar-aware market hours
+
+The FX market opens at the Sunday session close (17:00 New York) and closes
+at the Friday close, minus holiday sessions (Dec 25 and Jan 1 by default).
+MarketHours keeps those sessions as sorted open/close interval arrays in
+wall-clock minutes, so "is the market open" is a bisect for one time or a
+single numpy.searchsorted for a whole timestamp array, and the next open or
+close instant is a lookup in the same table. bars_back() walks the same
+table to find where the last N tradable bars of a timeframe begin, jumping
+over weekends and holidays instead of stepping through them.
+"""
+
+import bisect
+import datetime
+import threading
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from .boundaries import MINUTES_PER_DAY, _floor_bar_open, from_minute_ordinal, minute_ordinal
+from .bucket import EPOCH_ORDINAL, HAS_NUMPY, _get_numpy
+from .clock import wall_now
+from .registry import get_timeframe
+from .sessions import SessionCalendar, get_session_calendar
+
+# (month, day) of the sessions during which the market is closed
+DEFAULT_HOLIDAYS: Tuple[Tuple[int, int], ...] = ((12, 25), (1, 1))
+
+# Weekdays (date.weekday()) of the weekly open and close sessions
+SUNDAY = 6
+FRIDAY = 4
+
+# Years tabled around the first lookup; the table grows on demand
+_INITIAL_YEAR_SPAN = 2
+
+
+class MarketHours:
+    """
+    Market open/close intervals with holiday closures.
+
+    Usage:
+        hours = MarketHours()
+        hours.is_open(datetime.datetime(2024, 7, 12, 20, 59))  # True
+        hours.next_open(datetime.datetime(2024, 7, 13))       # Sunday close
+    """
+
+    def __init__(
+        self,
+        calendar: Optional[SessionCalendar] = None,
+        holidays: Iterable[Tuple[int, int]] = DEFAULT_HOLIDAYS,
+    ):
+        """
+        Initialize market hours.
+
+        Args:
+            calendar: Session calendar for the daily close (defaults to the
+                engine's calendar at lookup time)
+            holidays: (month, day) sessions during which the market is closed
+        """
+        self._calendar = calendar
+        self.holidays = tuple(holidays)
+        self._lock = threading.Lock()
+        self._years: Optional[Tuple[int, int]] = None
+        self._built_for: Optional[SessionCalendar] = None
+        # (opens, closes) swapped as one reference so readers see a consistent pair
+        self._table: Tuple[List[int], List[int]] = ([], [])
+        self._arrays = None
+
+    @property
+    def calendar(self) -> SessionCalendar:
+        return self._calendar or get_session_calendar()
+
+    # Table
+
+    def _close_on(self, day: int) -> int:
+        return day * MINUTES_PER_DAY + self.calendar.close_offset(day)
+
+    def _build(self, first_year: int, last_year: int) -> None:
+        """Table every trading interval between first_year and last_year."""
+        self._built_for = self.calendar
+        first_day = datetime.date(first_year, 1, 1).toordinal()
+        last_day = datetime.date(last_year, 12, 31).toordinal()
+        sunday = first_day - first_day % 7 - 7
+        weeks = []
+        while sunday <= last_day:
+            weeks.append([self._close_on(sunday), self._close_on(sunday + 5)])
+            sunday += 7
+
+        closed = []
+        for year in range(first_year - 1, last_year + 2):
+            for month, day in self.holidays:
+                holiday = datetime.date(year, month, day).toordinal()
+                closed.append((self._close_on(holiday - 1), self._close_on(holiday)))
+        closed.sort()
+
+        opens: List[int] = []
+        closes: List[int] = []
+        for open_, close in weeks:
+            for closed_start, closed_end in closed:
+                if closed_end <= open_ or closed_start >= close:
+                    continue
+                if closed_start > open_:
+                    opens.append(open_)
+                    closes.append(closed_start)
+                open_ = max(open_, closed_end)
+            if open_ < close:
+                opens.append(open_)
+                closes.append(close)
+
+        self._table = (opens, closes)
+        self._arrays = None
+        self._years = (first_year, last_year)
+
+    def _ensure(self, first_day: int, last_day: int) -> None:
+        first = datetime.date.fromordinal(max(first_day, 1)).year
+        last = datetime.date.fromordinal(last_day).year
+        years = self._years
+        stale = self._built_for is not self.calendar
+        if not stale and years is not None and years[0] <= first and last <= years[1]:
+            return
+        with self._lock:
+            years = self._years
+            if years is None or stale:
+                self._build(first - _INITIAL_YEAR_SPAN, last + _INITIAL_YEAR_SPAN)
+            elif not (years[0] <= first and last <= years[1]):
+                self._build(min(years[0], first), max(years[1], last))
+
+    def _ordinal(self, when: datetime.datetime) -> int:
+        """Wall-clock minute ordinal of when (aware datetimes are converted)."""
+        if when.tzinfo is not None:
+            when = self.calendar.to_wall(when)
+        return minute_ordinal(when)
+
+    def _datetime(self, ordinal: int, tzinfo=None) -> datetime.datetime:
+        """Datetime for a wall-clock minute ordinal, converted to tzinfo if given."""
+        wall = from_minute_ordinal(ordinal)
+        if tzinfo is None:
+            return wall
+        return self.calendar.from_wall(wall).astimezone(tzinfo)
+
+    def intervals(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> List[Tuple[datetime.datetime, datetime.datetime]]:
+        """
+        List the trading intervals overlapping [start, end).
+
+        Args:
+            start: Wall-clock start (aware datetimes are converted, and the
+                intervals are then returned in start's time zone)
+            end: Wall-clock end
+
+        Returns:
+            List of (open, close) datetimes
+        """
+        first, last = self._ordinal(start), self._ordinal(end)
+        self._ensure(first // MINUTES_PER_DAY, last // MINUTES_PER_DAY)
+        opens, closes = self._table
+        index = max(bisect.bisect_right(opens, first) - 1, 0)
+        result = []
+        while index < len(opens) and opens[index] < last:
+            if closes[index] > first:
+                result.append(
+                    (self._datetime(opens[index], start.tzinfo), self._datetime(closes[index], start.tzinfo))
+                )
+            index += 1
+        return result
+
+    # Scalar lookups
+
+    def _locate(
+        self, when: datetime.datetime, days_ahead: int = 14
+    ) -> Tuple[int, int, List[int], List[int]]:
+        """Return (ordinal, index of the last open at or before it, opens, closes)."""
+        ordinal = self._ordinal(when)
+        day = ordinal // MINUTES_PER_DAY
+        self._ensure(day - 14, day + days_ahead)
+        opens, closes = self._table
+        return ordinal, bisect.bisect_right(opens, ordinal) - 1, opens, closes
+
+    def is_open(self, when: Any = None) -> Any:
+        """
+        Check if the market is open.
+
+        Args:
+            when: Wall-clock datetime (aware datetimes are converted to
+                the calendar's wall clock), NumPy datetime64 array or
+                pandas DatetimeIndex/Series (defaults to now)
+
+        Returns:
+            bool for a datetime, boolean NumPy array otherwise
+        """
+        if when is None:
+            when = wall_now()
+        if not isinstance(when, datetime.datetime):
+            return self._is_open_array(when)
+        ordinal, index, opens, closes = self._locate(when)
+        return index >= 0 and ordinal < closes[index]
+
+    def next_open(self, when: Optional[datetime.datetime] = None) -> datetime.datetime:
+        """
+        Get the first market open strictly after when.
+
+        Args:
+            when: Wall-clock datetime (aware datetimes are converted, and
+                the result is in their time zone; defaults to now)
+
+        Returns:
+            Next open datetime
+        """
+        when = when or wall_now()
+        ordinal, index, opens, closes = self._locate(when)
+        if index + 1 >= len(opens):
+            ordinal, index, opens, closes = self._locate(when, days_ahead=366)
+        return self._datetime(opens[index + 1], when.tzinfo)
+
+    def next_close(self, when: Optional[datetime.datetime] = None) -> datetime.datetime:
+        """
+        Get the first market close strictly after when.
+
+        Args:
+            when: Wall-clock datetime (aware datetimes are converted, and
+                the result is in their time zone; defaults to now)
+
+        Returns:
+            Next close datetime
+        """
+        when = when or wall_now()
+        ordinal, index, opens, closes = self._locate(when)
+        if index >= 0 and ordinal < closes[index]:
+            return self._datetime(closes[index], when.tzinfo)
+        if index + 1 >= len(opens):
+            ordinal, index, opens, closes = self._locate(when, days_ahead=366)
+        return self._datetime(closes[index + 1], when.tzinfo)
+
+    # Bar counting
+
+    def _bars_back(self, end: int, spec, periods: int) -> int:
+        """Minute ordinal of the periods-th tradable bar opening before end."""
+        # Table the span the bars would cover without closures, with margin
+        span_days = periods * spec.minutes // MINUTES_PER_DAY * 2 + 31 * spec.multiple + 14
+        self._ensure(end // MINUTES_PER_DAY - span_days, end // MINUTES_PER_DAY + 1)
+        opens, closes = self._table
+        count = 0
+        bar_end = end
+        bar = _floor_bar_open(end - 1, spec)
+        while True:
+            # Last interval opening before the end of the bar
+            index = bisect.bisect_left(opens, bar_end) - 1
+            if index < 0:
+                years = self._years
+                self._ensure(bar // MINUTES_PER_DAY - 366, datetime.date(years[1], 12, 31).toordinal())
+                opens, closes = self._table
+                continue
+            if closes[index] > bar:
+                # [bar, bar_end) overlaps a trading interval
+                count += 1
+                if count == periods:
+                    return bar
+                bar_end = bar
+                bar = _floor_bar_open(bar - 1, spec)
+            else:
+                # Closed for the whole bar: jump to the bar holding the last close
+                bar_end = closes[index]
+                bar = _floor_bar_open(bar_end - 1, spec)
+
+    def bars_back(
+        self, end: datetime.datetime, timeframe: str, periods: int
+    ) -> datetime.datetime:
+        """
+        Get the open of the periods-th tradable bar opening before end.
+
+        A bar is tradable when it overlaps a trading interval, so bars
+        falling entirely on weekends or holidays are skipped. The range
+        [result, end) holds exactly periods tradable bars.
+
+        Args:
+            end: Wall-clock end of the range (aware datetimes are
+                converted, and the result is in their time zone)
+            timeframe: Timeframe string
+            periods: Number of tradable bars (at least 1)
+
+        Returns:
+            Open datetime of the earliest bar
+        """
+        if periods < 1:
+            raise ValueError(f"periods must be at least 1, got {periods}")
+        spec = get_timeframe(timeframe).spec
+        return self._datetime(self._bars_back(self._ordinal(end), spec, periods), end.tzinfo)
+
+    def bars_back_many(
+        self, requests: Iterable[Tuple[datetime.datetime, str, int]]
+    ) -> List[datetime.datetime]:
+        """
+        Run bars_back() over many (end, timeframe, periods) requests.
+
+        The interval table is extended once for the whole batch.
+
+        Args:
+            requests: (end, timeframe, periods) tuples
+
+        Returns:
+            Start datetimes, in request order
+        """
+        requests = list(requests)
+        if not requests:
+            return []
+        days = [self._ordinal(end) // MINUTES_PER_DAY for end, _, _ in requests]
+        span_days = max(
+            periods * get_timeframe(tf).minutes // MINUTES_PER_DAY * 2 + 31 * get_timeframe(tf).multiple
+            for _, tf, periods in requests
+        )
+        self._ensure(min(days) - span_days - 14, max(days) + 1)
+        return [self.bars_back(end, tf, periods) for end, tf, periods in requests]
+
+    # Vectorized lookups
+
+    def _is_open_array(self, timestamps: Any) -> Any:
+        if type(timestamps).__module__.startswith("pandas"):
+            import pandas as pd
+
+            index = pd.DatetimeIndex(timestamps)
+            if index.tz is not None:
+                index = index.tz_convert(self.calendar.wall_tzinfo()).tz_localize(None)
+            return self._is_open_array(index.values)
+        if not HAS_NUMPY:
+            return [self.is_open(ts) for ts in timestamps]
+
+        np = _get_numpy()
+        values = np.asarray(timestamps)
+        if not np.issubdtype(values.dtype, np.datetime64):
+            values = values.astype("datetime64[ns]")
+        missing = np.isnat(values)
+        minutes = values.astype("datetime64[m]").astype(np.int64) + EPOCH_ORDINAL * MINUTES_PER_DAY
+        if values.size == 0:
+            return np.zeros(values.shape, dtype=bool)
+        valid = minutes[~missing]
+        if valid.size:
+            self._ensure(
+                int(valid.min()) // MINUTES_PER_DAY - 14, int(valid.max()) // MINUTES_PER_DAY + 14
+            )
+        table = self._table
+        arrays = self._arrays
+        if arrays is None or arrays[0] is not table:
+            arrays = self._arrays = (
+                table,
+                np.asarray(table[0], dtype=np.int64),
+                np.asarray(table[1], dtype=np.int64),
+            )
+        _, opens, closes = arrays
+        index = np.searchsorted(opens, minutes, side="right") - 1
+        result = (index >= 0) & (minutes < closes[np.maximum(index, 0)])
+        return result & ~missing
+
+
+_market_hours = MarketHours()
+
+
+def get_market_hours() -> MarketHours:
+    """Get the default MarketHours (engine calendar, default holidays)."""
+    return _market_hours
+
+
+def is_market_open(when: Any = None) -> Any:
+    """
+    Check if the market is open at a time or over a timestamp array.
+
+    Args:
+        when: Wall-clock datetime, NumPy datetime64 array or pandas
+            DatetimeIndex/Series (defaults to now)
+
+    Returns:
+        bool for a datetime, boolean NumPy array otherwise
+    """
+    return _market_hours.is_open(when)
+
+
+def bars_back(end: datetime.datetime, timeframe: str, periods: int) -> datetime.datetime:
+    """Get the open of the periods-th tradable bar opening before end."""
+    return _market_hours.bars_back(end, timeframe, periods)
+
+
+def bars_back_many(
+    requests: Sequence[Tuple[datetime.datetime, str, int]]
+) -> List[datetime.datetime]:
+    """Run bars_back() over many (end, timeframe, periods) requests."""
+    return _market_hours.bars_back_many(requests)
+
+
+def next_market_open(when: Optional[datetime.datetime] = None) -> datetime.datetime:
+    """Get the first market open strictly after when (defaults to now)."""
+    return _market_hours.next_open(when)
+
+
+def next_market_close(when: Optional[datetime.datetime] = None) -> datetime.datetime:
+    """Get the first market close strictly after when (defaults to now)."""
+    return _market_hours.next_close(when)
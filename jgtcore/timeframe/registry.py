@@ -0,0 +1,198 @@
+"""
+Timeframe registry
+
+One interned Timeframe record per timeframe name, holding everything the
+timeframe-aware helpers used to derive from if/elif chains: nominal minutes,
+filename code ("mi1" for m1, to differ from M1 on case-insensitive file
+systems), poll interval, boundary functions and ordering. Any multiple of
+m/H/D/W/M (m3, H6, D2, ...) is created on first lookup and cached.
+
+    tf = get_timeframe("H4")
+    tf.minutes, tf.filename, tf.poll_seconds  # 240, "H4", 60
+    tf.shift(end, -1000)                       # 1000 bars back
+"""
+
+import calendar
+import datetime
+import functools
+import threading
+from typing import Dict, List, Optional, Union
+
+from .boundaries import (
+    MINUTES_PER_HOUR,
+    TimeframeSpec,
+    _floor_bar_open,
+    _floor_trigger,
+    _from_wall_ordinal,
+    _next_trigger,
+    _wall_ordinal,
+    parse_timeframe,
+)
+
+# Timeframes registered up front (the common broker timeframes)
+STANDARD_TIMEFRAMES = (
+    "m1", "m5", "m15", "m30", "H1", "H2", "H3", "H4", "H6", "H8", "D1", "W1", "M1",
+)
+
+# Filename codes that are not the timeframe name
+FILENAME_ALIASES = {"mi1": "m1", "min1": "m1"}
+
+# Unit order for timeframes of equal nominal length (e.g. m60 before H1)
+_UNIT_RANK = {"m": 0, "H": 1, "D": 2, "W": 3, "M": 4}
+
+
+@functools.total_ordering
+class Timeframe:
+    """
+    Interned timeframe record.
+
+    Records are shared: get_timeframe("m5") always returns the same object,
+    so identity comparison is valid. Ordering is by nominal length.
+    """
+
+    __slots__ = ("name", "spec", "unit", "multiple", "minutes", "filename", "poll_seconds", "_key")
+
+    def __init__(self, name: str, spec: TimeframeSpec):
+        self.name = name
+        self.spec = spec
+        self.unit = spec.unit
+        self.multiple = spec.multiple
+        self.minutes = spec.minutes
+        self.filename = "mi1" if name == "m1" else name
+        self.poll_seconds = _poll_seconds(spec)
+        self._key = (spec.minutes, _UNIT_RANK[spec.unit], spec.multiple)
+
+    # Boundaries
+
+    def is_boundary(self, dt: datetime.datetime) -> bool:
+        """True if dt's minute is a trigger boundary of this timeframe."""
+        ordinal = _wall_ordinal(dt)
+        return _floor_trigger(ordinal, self.spec) == ordinal
+
+    def previous_boundary(self, dt: datetime.datetime) -> datetime.datetime:
+        """Latest trigger boundary at or before dt."""
+        return _from_wall_ordinal(_floor_trigger(_wall_ordinal(dt), self.spec), dt.tzinfo)
+
+    def next_boundary(self, dt: datetime.datetime) -> datetime.datetime:
+        """First trigger boundary strictly after dt."""
+        return _from_wall_ordinal(_next_trigger(_wall_ordinal(dt), self.spec), dt.tzinfo)
+
+    def bar_open(self, dt: datetime.datetime) -> datetime.datetime:
+        """Open time of the bar containing dt."""
+        return _from_wall_ordinal(_floor_bar_open(_wall_ordinal(dt), self.spec), dt.tzinfo)
+
+    def shift(self, dt: datetime.datetime, periods: int) -> datetime.datetime:
+        """
+        Move dt by a number of nominal bar lengths.
+
+        M frames move by calendar months (clamping the day to the month
+        length); other frames move by their length in minutes. Market
+        closures are not skipped.
+
+        Args:
+            dt: Datetime to shift
+            periods: Number of bars (negative to go back)
+
+        Returns:
+            Shifted datetime
+        """
+        if self.unit == "M":
+            return _add_months(dt, self.multiple * periods)
+        return dt + datetime.timedelta(minutes=self.minutes * periods)
+
+    # Ordering
+
+    def __eq__(self, other):
+        if isinstance(other, Timeframe):
+            return self._key == other._key
+        return NotImplemented
+
+    def __lt__(self, other):
+        if isinstance(other, Timeframe):
+            return self._key < other._key
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __str__(self):
+        return self.name
+
+    def __repr__(self):
+        return f"Timeframe({self.name!r})"
+
+
+def _poll_seconds(spec: TimeframeSpec) -> int:
+    """Seconds between checks when polling for the timeframe's boundaries."""
+    if spec.minutes == 1:
+        return 2
+    if spec.minutes < MINUTES_PER_HOUR:
+        return 30
+    return 60
+
+
+def _add_months(dt: datetime.datetime, months: int) -> datetime.datetime:
+    month_index = dt.year * 12 + dt.month - 1 + months
+    year, month = divmod(month_index, 12)
+    day = min(dt.day, calendar.monthrange(year, month + 1)[1])
+    return dt.replace(year=year, month=month + 1, day=day)
+
+
+_REGISTRY: Dict[str, Timeframe] = {}
+_LOCK = threading.Lock()
+
+
+def _normalize(name: str) -> str:
+    """Map filename codes and bare minute counts to timeframe names."""
+    name = FILENAME_ALIASES.get(name, name)
+    if name.isdigit():
+        return f"m{name}"
+    return name
+
+
+def get_timeframe(timeframe: Union[str, Timeframe]) -> Timeframe:
+    """
+    Get the interned record of a timeframe.
+
+    Args:
+        timeframe: Timeframe name ("m5", "H4", "D2", ...), filename code
+            ("mi1"), minute count ("15") or a Timeframe
+
+    Returns:
+        Timeframe record
+
+    Raises:
+        ValueError: If the timeframe is not recognised
+    """
+    record = _REGISTRY.get(timeframe)
+    if record is not None:
+        return record
+    if isinstance(timeframe, Timeframe):
+        return timeframe
+    name = _normalize(timeframe)
+    spec = parse_timeframe(name)
+    with _LOCK:
+        record = _REGISTRY.get(name)
+        if record is None:
+            record = _REGISTRY[name] = Timeframe(name, spec)
+        _REGISTRY[timeframe] = record
+    return record
+
+
+def find_timeframe(timeframe: str) -> Optional[Timeframe]:
+    """Get the record of a timeframe, or None if it is not recognised."""
+    try:
+        return get_timeframe(timeframe)
+    except ValueError:
+        return None
+
+
+def registered_timeframes() -> List[Timeframe]:
+    """Distinct registered timeframes, shortest first."""
+    return sorted(set(_REGISTRY.values()))
+
+
+for _name in STANDARD_TIMEFRAMES:
+    get_timeframe(_name)
+for _alias in FILENAME_ALIASES:
+    get_timeframe(_alias)
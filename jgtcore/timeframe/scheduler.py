@@ -0,0 +1,243 @@
+"""
+Heap-based timeframe scheduler
+
+One TimeframeScheduler replaces a polling loop per timeframe: it keeps a
+min-heap of the next boundary of every registered timeframe, sleeps exactly
+until the earliest one (converted to a monotonic deadline when waiting) and
+dispatches the callbacks of every timeframe due at that instant, e.g. m5,
+m15 and H1 together on the hour.
+
+Time is read from the active clock, so under a ReplayClock the scheduler
+(run_until or its thread) jumps from boundary to boundary without waiting.
+"""
+
+import datetime
+import heapq
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .boundaries import _next_trigger, from_minute_ordinal, minute_ordinal, parse_timeframe
+from .clock import get_clock, wall_now
+
+BoundaryCallback = Callable[[str, datetime.datetime], None]
+
+
+class TimeframeScheduler:
+    """
+    Dispatch callbacks at the exact boundaries of a set of timeframes.
+
+    Usage:
+        scheduler = TimeframeScheduler(["m5", "m15", "H1"], on_boundary)
+        scheduler.start()
+    """
+
+    def __init__(
+        self,
+        timeframes: Iterable[str] = (),
+        callback: Optional[BoundaryCallback] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            timeframes: Timeframes to schedule
+            callback: Called as callback(timeframe, boundary) for timeframes
+                added without their own callback
+        """
+        self.callback = callback
+        self._heap: List[Tuple[int, int, str]] = []
+        self._callbacks: Dict[str, List[Optional[BoundaryCallback]]] = {}
+        self._condition = threading.Condition()
+        self._stopped = True
+        self._thread: Optional[threading.Thread] = None
+        for timeframe in timeframes:
+            self.add(timeframe)
+
+    def _now(self) -> datetime.datetime:
+        return wall_now()
+
+    # Registration
+
+    def add(
+        self, timeframe: str, callback: Optional[BoundaryCallback] = None
+    ) -> Optional[BoundaryCallback]:
+        """
+        Schedule a timeframe (or add another callback to it).
+
+        Args:
+            timeframe: Timeframe string
+            callback: Called as callback(timeframe, boundary); defaults to
+                the scheduler callback
+
+        Returns:
+            The callback, so it can be passed to remove()
+        """
+        spec = parse_timeframe(timeframe)
+        with self._condition:
+            if timeframe not in self._callbacks:
+                self._callbacks[timeframe] = []
+                boundary = _next_trigger(minute_ordinal(self._now()), spec)
+                heapq.heappush(self._heap, (boundary, spec.minutes, timeframe))
+                self._condition.notify_all()
+            self._callbacks[timeframe].append(callback)
+        return callback
+
+    def remove(self, timeframe: str, callback: Optional[BoundaryCallback] = None) -> None:
+        """
+        Remove a callback of a timeframe, or the timeframe itself.
+
+        Args:
+            timeframe: Timeframe string
+            callback: Callback to remove (None removes the timeframe)
+        """
+        with self._condition:
+            callbacks = self._callbacks.get(timeframe)
+            if callbacks is None:
+                return
+            if callback is not None:
+                callbacks[:] = [c for c in callbacks if c is not callback]
+            if callback is None or not callbacks:
+                del self._callbacks[timeframe]
+                self._heap = [entry for entry in self._heap if entry[2] != timeframe]
+                heapq.heapify(self._heap)
+            self._condition.notify_all()
+
+    @property
+    def timeframes(self) -> List[str]:
+        """Scheduled timeframes."""
+        with self._condition:
+            return list(self._callbacks)
+
+    # Dispatch
+
+    def next_due(self) -> Optional[Tuple[datetime.datetime, List[str]]]:
+        """
+        Get the next boundary and the timeframes due at it.
+
+        Returns:
+            (boundary, timeframes) or None if nothing is scheduled
+        """
+        with self._condition:
+            if not self._heap:
+                return None
+            boundary = self._heap[0][0]
+            due = sorted(entry for entry in self._heap if entry[0] == boundary)
+        return from_minute_ordinal(boundary), [entry[2] for entry in due]
+
+    def seconds_until_next(self) -> Optional[float]:
+        """Seconds until the next boundary (negative if overdue), None if idle."""
+        with self._condition:
+            if not self._heap:
+                return None
+            boundary = self._heap[0][0]
+        return (from_minute_ordinal(boundary) - self._now()).total_seconds()
+
+    def _pop_due(self, now: datetime.datetime) -> List[Tuple[str, datetime.datetime]]:
+        """Pop every due entry and reschedule it; hold the condition."""
+        now_ordinal = minute_ordinal(now)
+        due = []
+        while self._heap and self._heap[0][0] <= now_ordinal:
+            boundary, minutes, timeframe = heapq.heappop(self._heap)
+            due.append((timeframe, from_minute_ordinal(boundary)))
+            # Missed boundaries (e.g. after a suspend) are not replayed
+            next_boundary = _next_trigger(max(boundary, now_ordinal), parse_timeframe(timeframe))
+            heapq.heappush(self._heap, (next_boundary, minutes, timeframe))
+        return due
+
+    def run_pending(self) -> List[Tuple[str, datetime.datetime]]:
+        """
+        Dispatch the callbacks of every timeframe whose boundary has passed.
+
+        Returns:
+            List of (timeframe, boundary) dispatched, shortest timeframe first
+        """
+        with self._condition:
+            due = self._pop_due(self._now())
+            callbacks = {timeframe: list(self._callbacks[timeframe]) for timeframe, _ in due}
+        for timeframe, boundary in due:
+            for callback in callbacks[timeframe]:
+                callback = callback or self.callback
+                if callback is None:
+                    continue
+                try:
+                    callback(timeframe, boundary)
+                except Exception as e:
+                    print(f"Warning: timeframe scheduler callback failed for {timeframe}: {e}")
+        return due
+
+    def run_until(self, until: datetime.datetime) -> int:
+        """
+        Dispatch every boundary up to and including until, in the foreground.
+
+        Sleeps on the active clock between boundaries, so with a ReplayClock
+        a year of m1 boundaries is replayed without waiting.
+
+        Args:
+            until: Last wall-clock boundary to dispatch
+
+        Returns:
+            Number of (timeframe, boundary) pairs dispatched
+        """
+        clock = get_clock()
+        dispatched = 0
+        while True:
+            with self._condition:
+                if not self._heap:
+                    return dispatched
+                boundary = from_minute_ordinal(self._heap[0][0])
+            if boundary > until:
+                return dispatched
+            clock.sleep((boundary - self._now()).total_seconds())
+            dispatched += len(self.run_pending())
+
+    # Thread
+
+    def _run(self) -> None:
+        while True:
+            clock = get_clock()
+            with self._condition:
+                if self._stopped:
+                    return
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                delay = (from_minute_ordinal(self._heap[0][0]) - self._now()).total_seconds()
+                if delay > 0 and clock.realtime:
+                    # Condition.wait times out on the monotonic clock
+                    self._condition.wait(delay)
+                    continue
+            if delay > 0:
+                clock.sleep(delay)
+            self.run_pending()
+
+    def start(self) -> "TimeframeScheduler":
+        """Start the scheduler thread (no-op if already running)."""
+        with self._condition:
+            if self._thread is not None and self._thread.is_alive():
+                return self
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run, name="jgtcore-timeframe-scheduler", daemon=True
+            )
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the scheduler thread."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        """True while the scheduler thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def __enter__(self) -> "TimeframeScheduler":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
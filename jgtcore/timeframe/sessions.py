@@ -0,0 +1,256 @@
+"""
+Broker session calendar
+
+The FX daily session closes at 17:00 New York time, which is 21:00 UTC while
+US daylight saving time is in effect and 22:00 UTC otherwise. SessionCalendar
+converts that close once per day of a year range with zoneinfo and stores
+the result as a short sorted table of constant-offset segments; lookups for
+any date (live or historical) are a bisect into that table.
+
+Timeframe code works on naive wall-clock datetimes in the calendar's
+wall_timezone (the machine's local time by default, as the trigger helpers
+always used; pass wall_timezone="UTC" to run the engine in UTC), read
+through the active clock (jgtcore.timeframe.clock).
+
+Without a time zone database (no tzdata on the host), the New York close
+falls back to the US daylight saving rule.
+"""
+
+import bisect
+import datetime
+import functools
+import threading
+from typing import List, Optional, Tuple
+
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+    HAS_ZONEINFO = True
+except ImportError:
+    try:
+        from backports.zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+        HAS_ZONEINFO = True
+    except ImportError:
+        ZoneInfo = None
+        ZoneInfoNotFoundError = KeyError
+        HAS_ZONEINFO = False
+
+MINUTES_PER_DAY = 24 * 60
+
+MARKET_TIMEZONE = "America/New_York"
+DAILY_CLOSE_TIME = datetime.time(17, 0)
+
+# Years tabled around the first lookup; the table grows on demand
+_INITIAL_YEAR_SPAN = 5
+
+
+@functools.lru_cache(maxsize=256)
+def _us_dst_days(year: int) -> Tuple[int, int]:
+    """Day ordinals of the second Sunday of March and first Sunday of November."""
+    march = datetime.date(year, 3, 8)
+    november = datetime.date(year, 11, 1)
+    start = march.toordinal() + (6 - march.weekday())
+    end = november.toordinal() + (6 - november.weekday())
+    return start, end
+
+
+def _market_zone(timezone: str):
+    """ZoneInfo of the market time zone, or None to use the US DST rule."""
+    if HAS_ZONEINFO:
+        try:
+            return ZoneInfo(timezone)
+        except ZoneInfoNotFoundError:
+            pass
+    if timezone != MARKET_TIMEZONE:
+        raise ValueError(f"timezone {timezone!r} requires zoneinfo and a time zone database")
+    return None
+
+
+class SessionCalendar:
+    """
+    Daily session close instants, tabled per year and looked up by bisect.
+
+    Usage:
+        calendar = SessionCalendar()
+        calendar.close_utc(datetime.date(2024, 7, 10))  # 21:00 UTC
+    """
+
+    def __init__(
+        self,
+        timezone: str = MARKET_TIMEZONE,
+        close_time: datetime.time = DAILY_CLOSE_TIME,
+        wall_timezone: Optional[str] = None,
+        first_year: Optional[int] = None,
+        last_year: Optional[int] = None,
+    ):
+        """
+        Initialize the calendar.
+
+        Args:
+            timezone: Time zone of the session close
+            close_time: Local time of the daily close
+            wall_timezone: Time zone of the naive datetimes used by the
+                timeframe engine (None, the default, for the machine's
+                local time; "UTC" needs no time zone database)
+            first_year: First year to table up front (optional)
+            last_year: Last year to table up front (optional)
+        """
+        self.timezone = timezone
+        self.close_time = close_time
+        self.wall_timezone = wall_timezone
+        self._zone = _market_zone(timezone)
+        if wall_timezone is None:
+            self._wall_zone = None
+        elif wall_timezone == "UTC":
+            self._wall_zone = datetime.timezone.utc
+        elif HAS_ZONEINFO:
+            self._wall_zone = ZoneInfo(wall_timezone)
+        else:
+            raise ValueError(f"wall_timezone {wall_timezone!r} requires zoneinfo")
+        self._lock = threading.Lock()
+        # (first_year, last_year, starts, offsets) swapped as one reference
+        # so readers see a consistent table
+        self._table: Optional[Tuple[int, int, List[int], List[int]]] = None
+        if first_year is not None or last_year is not None:
+            year = datetime.date.today().year
+            self._build(first_year or year, last_year or year)
+
+    # Table
+
+    def _close_utc(self, date: datetime.date) -> datetime.datetime:
+        if self._zone is None:
+            # No time zone database: US DST rule for New York
+            start, end = _us_dst_days(date.year)
+            hours = 4 if start <= date.toordinal() < end else 5
+            close = datetime.datetime.combine(date, self.close_time, tzinfo=datetime.timezone.utc)
+            return close + datetime.timedelta(hours=hours)
+        close = datetime.datetime.combine(date, self.close_time, tzinfo=self._zone)
+        return close.astimezone(datetime.timezone.utc)
+
+    def _close_offset(self, day: int) -> int:
+        """Minutes from the wall-clock midnight of a day to its session close."""
+        date = datetime.date.fromordinal(day)
+        wall = self.to_wall(self._close_utc(date))
+        delta = wall - datetime.datetime.combine(date, datetime.time())
+        return delta.days * MINUTES_PER_DAY + delta.seconds // 60
+
+    def _build(self, first_year: int, last_year: int) -> None:
+        """Table the close offsets of every day in [first_year, last_year]."""
+        starts: List[int] = []
+        offsets: List[int] = []
+        first_day = datetime.date(first_year, 1, 1).toordinal()
+        last_day = datetime.date(last_year, 12, 31).toordinal()
+        for day in range(first_day, last_day + 1):
+            offset = self._close_offset(day)
+            if not offsets or offsets[-1] != offset:
+                starts.append(day)
+                offsets.append(offset)
+        self._table = (first_year, last_year, starts, offsets)
+
+    def _ensure(self, day: int) -> Tuple[int, int, List[int], List[int]]:
+        year = datetime.date.fromordinal(day).year
+        table = self._table
+        if table is not None and table[0] <= year <= table[1]:
+            return table
+        with self._lock:
+            table = self._table
+            if table is None:
+                self._build(year - _INITIAL_YEAR_SPAN, year + _INITIAL_YEAR_SPAN)
+            elif not table[0] <= year <= table[1]:
+                self._build(min(table[0], year), max(table[1], year))
+            return self._table
+
+    @property
+    def years(self) -> Optional[Tuple[int, int]]:
+        """(first, last) year currently tabled, or None before the first lookup."""
+        table = self._table
+        if table is None:
+            return None
+        return table[0], table[1]
+
+    # Lookups
+
+    def close_offset(self, day: int) -> int:
+        """
+        Get the wall-clock minute of a day's session close.
+
+        Args:
+            day: Day ordinal (date.toordinal()) of the session close date
+
+        Returns:
+            Minutes after that day's wall-clock midnight (may fall outside
+            0..1439 when the wall time zone is far from the market's)
+        """
+        _, _, starts, offsets = self._ensure(day)
+        return offsets[bisect.bisect_right(starts, day) - 1]
+
+    def close_wall(self, date: datetime.date) -> datetime.datetime:
+        """Session close of a date as a naive wall-clock datetime."""
+        day = date.toordinal()
+        return datetime.datetime.fromordinal(day) + datetime.timedelta(
+            minutes=self.close_offset(day)
+        )
+
+    def close_utc(self, date: datetime.date) -> datetime.datetime:
+        """Session close of a date as an aware UTC datetime."""
+        return self._close_utc(date)
+
+    def to_wall(self, when: datetime.datetime) -> datetime.datetime:
+        """Convert an aware datetime to a naive wall-clock datetime."""
+        if self._wall_zone is None:
+            return when.astimezone().replace(tzinfo=None)
+        return when.astimezone(self._wall_zone).replace(tzinfo=None)
+
+    def from_wall(self, wall: datetime.datetime) -> datetime.datetime:
+        """Convert a naive wall-clock datetime to an aware datetime (inverse of to_wall)."""
+        if self._wall_zone is None:
+            return wall.astimezone()
+        return wall.replace(tzinfo=self._wall_zone)
+
+    def wall_tzinfo(self) -> datetime.tzinfo:
+        """
+        tzinfo of the wall clock, for libraries that need one (pandas).
+
+        The local zone is dateutil's tzlocal(), as passing None to pandas
+        tz_convert would mean UTC.
+        """
+        if self._wall_zone is None:
+            from dateutil.tz import tzlocal
+
+            return tzlocal()
+        return self._wall_zone
+
+    def now(self) -> datetime.datetime:
+        """Current naive wall-clock time in the calendar's wall time zone."""
+        if self._wall_zone is None:
+            return datetime.datetime.now()
+        return datetime.datetime.now(self._wall_zone).replace(tzinfo=None)
+
+    def __repr__(self):
+        return (
+            f"SessionCalendar(timezone={self.timezone!r}, close_time={self.close_time}, "
+            f"wall_timezone={self.wall_timezone!r}, years={self.years})"
+        )
+
+
+_session_calendar = SessionCalendar()
+
+
+def get_session_calendar() -> SessionCalendar:
+    """Get the session calendar used by the timeframe engine."""
+    return _session_calendar
+
+
+def set_session_calendar(calendar: SessionCalendar) -> SessionCalendar:
+    """
+    Replace the session calendar used by the timeframe engine.
+
+    Args:
+        calendar: New calendar
+
+    Returns:
+        The previous calendar
+    """
+    global _session_calendar
+    previous = _session_calendar
+    _session_calendar = calendar
+    return previous
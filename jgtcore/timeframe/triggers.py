@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+
+"""
+jgtcore.timeframe - Core timeframe scheduling library
+
+This module provides the core timeframe logic extracted from jgtutils.timeframe_scheduler
+without CLI dependencies, making it suitable for use in other libraries and applications.
+
+Main Functions:
+- get_times_by_timeframe_str(): Get timeframe trigger times
+- get_current_time(): Get current time in appropriate format
+- is_timeframe_reached(): Check if current time matches timeframe
+- wait_for_timeframe(): Wait until timeframe is reached (for library use)
+- TimeframeChecker: Class-based interface for timeframe monitoring
+
+Trigger checks are answered by the arithmetic engine in
+jgtcore.timeframe.boundaries; the string lists are only built on request.
+"""
+
+import datetime
+import functools
+from typing import List, Optional, Tuple, Union, Callable
+
+from .clock import get_clock, wall_now
+from .boundaries import (
+    MINUTES_PER_DAY,
+    MINUTES_PER_HOUR,
+    _floor_trigger,
+    _next_trigger,
+    daily_close_minute,
+    from_minute_ordinal,
+    minute_ordinal,
+    next_boundary,
+)
+from .registry import find_timeframe, get_timeframe
+
+# Default TimeframeChecker.poll() catch-up window (seconds)
+DEFAULT_MAX_CATCH_UP = 24 * 60 * 60
+
+
+def get_current_time(timeframe: str) -> str:
+    """
+    Get current time formatted appropriately for the timeframe.
+    
+    Args:
+        timeframe: Timeframe string (m1, m5, m15, H1, H4, D1, etc.)
+        
+    Returns:
+        Current time as formatted string
+    """
+    if timeframe == "m1":
+        return wall_now().strftime("%H:%M:%S")
+    else:
+        return wall_now().strftime("%H:%M")
+
+
+def get_times_by_timeframe_str(timeframe: str) -> List[str]:
+    """
+    Get list of time strings when the timeframe should trigger.
+    
+    Args:
+        timeframe: Timeframe string (m1, m5, m15, H1, H4, D1, W1, M1)
+        
+    Returns:
+        List of time strings when timeframe should trigger
+    """
+    spec = get_timeframe(timeframe).spec
+    if spec.minutes >= MINUTES_PER_DAY:
+        return get_timeframe_daily_ending_time()
+    return list(_intraday_trigger_times(timeframe))
+
+
+@functools.lru_cache(maxsize=64)
+def _intraday_trigger_times(timeframe: str) -> Tuple[str, ...]:
+    """Trigger times of an intraday timeframe over one day, from the engine."""
+    spec = get_timeframe(timeframe).spec
+    day = 1 * MINUTES_PER_DAY  # any day: intraday boundaries repeat daily
+    boundaries = [
+        minute for minute in range(MINUTES_PER_DAY)
+        if _floor_trigger(day + minute, spec) == day + minute
+    ]
+    if spec.minutes == 1:
+        # For m1, include both :00 and :01 seconds to ensure we catch the timeframe
+        return tuple(
+            f"{minute // 60:02d}:{minute % 60:02d}:{second}"
+            for minute in boundaries
+            for second in ("00", "01")
+        )
+    return tuple(f"{minute // 60:02d}:{minute % 60:02d}" for minute in boundaries)
+
+
+def get_timeframes_times_by_minutes(minutes: int) -> List[str]:
+    """
+    Generate list of times based on minute intervals.
+    
+    Args:
+        minutes: Interval in minutes
+        
+    Returns:
+        List of time strings
+    """
+    start_range = 1 if minutes >= 60 else 0
+    
+    if minutes > 1:
+        return [f"{str(h).zfill(2)}:{str(m).zfill(2)}" 
+                for h in range(start_range, 24) 
+                for m in range(0, 60, minutes)]
+    elif minutes == 1:
+        # For m1, include both :00 and :01 seconds to ensure we catch the timeframe
+        times = []
+        for h in range(start_range, 24):
+            for m in range(0, 60):
+                times.append(f"{str(h).zfill(2)}:{str(m).zfill(2)}:00")
+                times.append(f"{str(h).zfill(2)}:{str(m).zfill(2)}:01")
+        return times
+    else:
+        raise ValueError(f"Invalid minutes value: {minutes}")
+
+
+def get_timeframe_daily_ending_time() -> List[str]:
+    """
+    Get daily timeframe ending time (considering DST).
+    
+    Returns:
+        List containing the daily ending time
+    """
+    close = daily_close_minute(wall_now().toordinal()) % MINUTES_PER_DAY
+    return [f"{close // MINUTES_PER_HOUR:02d}:{close % MINUTES_PER_HOUR:02d}:00"]
+
+
+def _parse_clock(current_time: str) -> Optional[Tuple[int, Optional[int]]]:
+    """Parse "HH:MM" or "HH:MM:SS" into (minute of day, second or None)."""
+    if len(current_time) not in (5, 8) or current_time[2] != ":":
+        return None
+    try:
+        minute = int(current_time[:2]) * MINUTES_PER_HOUR + int(current_time[3:5])
+        second = int(current_time[6:8]) if len(current_time) == 8 else None
+    except ValueError:
+        return None
+    if len(current_time) == 8 and current_time[5] != ":":
+        return None
+    return minute, second
+
+
+def _clock_matches(timeframe: str, current_time: str) -> bool:
+    """Match a clock string the way membership in the trigger list did."""
+    parsed = _parse_clock(current_time)
+    if parsed is None:
+        return False
+    minute, second = parsed
+    spec = get_timeframe(timeframe).spec
+    if spec.minutes >= MINUTES_PER_DAY:
+        close = daily_close_minute(wall_now().toordinal()) % MINUTES_PER_DAY
+        return minute == close and second in (None, 0)
+    if spec.minutes == 1:
+        return second in (0, 1)
+    if second is not None:
+        return False
+    ordinal = MINUTES_PER_DAY + minute
+    return _floor_trigger(ordinal, spec) == ordinal
+
+
+def is_timeframe_reached(timeframe: str, current_time: Optional[str] = None) -> bool:
+    """
+    Check if the current time matches the timeframe trigger times.
+    
+    Args:
+        timeframe: Timeframe string
+        current_time: Optional current time string (defaults to now)
+        
+    Returns:
+        True if timeframe should trigger now
+    """
+    if current_time is not None:
+        return _clock_matches(timeframe, current_time)
+    record = get_timeframe(timeframe)
+    now = wall_now()
+    if not record.is_boundary(now):
+        return False
+    # m1 is checked to the second: only the first two seconds of the minute count
+    return record.minutes != 1 or now.second <= 1
+
+
+def wait_for_timeframe(
+    timeframe: str, 
+    callback: Optional[Callable[[str], None]] = None,
+    max_wait_seconds: Optional[int] = None,
+    check_interval: int = 1
+) -> bool:
+    """
+    Wait until the specified timeframe is reached.
+    
+    Sleeps exactly until the next boundary instead of polling, on the
+    active clock (a ReplayClock returns without waiting).
+    
+    Args:
+        timeframe: Timeframe to wait for
+        callback: Optional callback function to call when timeframe is reached
+        max_wait_seconds: Maximum seconds to wait (None = wait indefinitely)
+        check_interval: Kept for compatibility; no longer used
+        
+    Returns:
+        True if timeframe was reached, False if max_wait_seconds exceeded
+    """
+    clock = get_clock()
+    deadline = None if max_wait_seconds is None else clock.monotonic() + max_wait_seconds
+    
+    if is_timeframe_reached(timeframe):
+        if callback:
+            callback(timeframe)
+        return True
+    
+    target = next_boundary(wall_now(), timeframe)
+    while True:
+        remaining = (target - wall_now()).total_seconds()
+        if remaining <= 0:
+            if callback:
+                callback(timeframe)
+            return True
+        
+        # Check if we've exceeded max wait time
+        if deadline is not None:
+            left = deadline - clock.monotonic()
+            if left <= 0:
+                return False
+            remaining = min(remaining, left)
+        
+        clock.sleep(remaining)
+
+
+class TimeframeChecker:
+    """
+    Class-based interface for timeframe monitoring.
+    
+    This provides a more object-oriented way to work with timeframes,
+    useful for integration into larger applications.
+    
+    check_now() must be called during the boundary minute; poll() reports
+    every boundary crossed since the last call, so it can run infrequently.
+    """
+    
+    def __init__(
+        self,
+        timeframe: str,
+        max_catch_up: Optional[Union[float, datetime.timedelta]] = DEFAULT_MAX_CATCH_UP,
+    ):
+        """
+        Initialize timeframe checker.
+        
+        Args:
+            timeframe: Timeframe to monitor
+            max_catch_up: Oldest boundary poll() reports, as seconds or a
+                timedelta before now (one day by default, None = every
+                boundary since last poll)
+        """
+        self.timeframe = timeframe
+        self.trigger_times = get_times_by_timeframe_str(timeframe)
+        self.last_trigger_time = None
+        if isinstance(max_catch_up, datetime.timedelta):
+            max_catch_up = max_catch_up.total_seconds()
+        self.max_catch_up = max_catch_up
+        self._last_boundary: Optional[int] = None
+        
+    def check_now(self) -> bool:
+        """
+        Check if timeframe should trigger now.
+        
+        Returns:
+            True if timeframe should trigger (once per boundary)
+        """
+        if not is_timeframe_reached(self.timeframe):
+            return False
+        boundary = minute_ordinal(wall_now())
+        if boundary == self._last_boundary:
+            return False
+        self._last_boundary = boundary
+        self.last_trigger_time = get_current_time(self.timeframe)
+        return True
+    
+    def poll(self) -> List[datetime.datetime]:
+        """
+        Get the boundaries crossed since the last poll or trigger.
+        
+        The first call only reports a boundary whose minute is now. Boundaries
+        older than max_catch_up are skipped, except the latest one. If the
+        wall clock steps back (DST fall-back, clock correction), nothing is
+        reported until it passes the last processed boundary again.
+        
+        Returns:
+            Boundary datetimes in order (empty if none was crossed)
+        """
+        spec = get_timeframe(self.timeframe).spec
+        now = wall_now()
+        now_ordinal = minute_ordinal(now)
+        latest = _floor_trigger(now_ordinal, spec)
+        last = self._last_boundary
+        if last is not None and latest <= last:
+            # Never move the processed boundary backwards
+            return []
+        if last is None:
+            last = latest - 1 if latest == now_ordinal else latest
+        if self.max_catch_up is not None:
+            cutoff = now - datetime.timedelta(seconds=self.max_catch_up)
+            # First minute starting at or after the cutoff
+            oldest = minute_ordinal(cutoff) + (cutoff.second > 0 or cutoff.microsecond > 0)
+            last = max(last, min(oldest, latest) - 1)
+        self._last_boundary = latest
+        if latest <= last:
+            return []
+        
+        crossed = []
+        boundary = _next_trigger(last, spec)
+        while boundary <= latest:
+            crossed.append(from_minute_ordinal(boundary))
+            boundary = _next_trigger(boundary, spec)
+        self.last_trigger_time = self._format_trigger(crossed[-1])
+        return crossed
+    
+    def _format_trigger(self, dt: datetime.datetime) -> str:
+        if self.timeframe == "m1" or get_timeframe(self.timeframe).minutes >= MINUTES_PER_DAY:
+            return dt.strftime("%H:%M:00")
+        return dt.strftime("%H:%M")
+    
+    def get_next_trigger_time(self) -> Optional[str]:
+        """
+        Get the next time this timeframe will trigger.
+        
+        Returns:
+            Next trigger time string or None if can't determine
+        """
+        return self._format_trigger(next_boundary(wall_now(), self.timeframe))
+    
+    def seconds_until_next_trigger(self) -> Optional[int]:
+        """
+        Calculate seconds until next timeframe trigger.
+        
+        Returns:
+            Seconds until next trigger or None if can't calculate
+        """
+        now = wall_now()
+        delta = next_boundary(now, self.timeframe) - now
+        return int(delta.total_seconds())
+
+
+# Convenience functions for quick testing
+def simulate_timeframe_reached(timeframe: str) -> bool:
+    """
+    Simulate timeframe reached for testing purposes.
+    Always returns True with a small delay (instant on a ReplayClock).
+    
+    Args:
+        timeframe: Timeframe being simulated
+        
+    Returns:
+        Always True (for testing)
+    """
+    print(f"🔄 SIMULATION: {timeframe} timeframe reached")
+    get_clock().sleep(1)  # Small delay for realism
+    return True
+
+
+def get_sleep_duration_for_timeframe(timeframe: str) -> int:
+    """
+    Get appropriate sleep duration for timeframe monitoring.
+    
+    Args:
+        timeframe: Timeframe string
+        
+    Returns:
+        Sleep duration in seconds
+    """
+    record = find_timeframe(timeframe)
+    return record.poll_seconds if record is not None else 60 
\ No newline at end of file
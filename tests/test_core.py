@@ -53,6 +53,12 @@ def test_market_open():
     test_time = datetime(2024, 1, 15, 10, 0)  # Monday 10:00 UTC
     result = core.is_market_open(test_time)
     print(f"   Monday 10:00 UTC: {'Open' if result else 'Closed'}")
+    assert result is True, "Expected market open on Monday 10:00 UTC"
+
+    closed = []
+    saturday = datetime(2024, 1, 13, 12, 0)
+    assert core.is_market_open(saturday, market_closed_callback=lambda: closed.append(1)) is False
+    assert closed == [1], "Expected callback when market is closed"
 
 
 def test_datetime_helpers():
@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+
+"""
+Tests for jgtcore FX transaction records and collections
+"""
+
+import copy
+import json
+import pickle
+
+import pytest
+
+from jgtcore import fx
+
+
+def _trade(trade_id, instrument="EUR/USD", amount=1000, buy_sell="B", pl=0.0, **kwargs):
+    return fx.FXTrade(trade_id, instrument, amount, buy_sell, 1.1, 1.2, None, None, pl, **kwargs)
+
+
+def test_records_use_slots_and_lazy_extras():
+    """Core fields live in slots; extra keywords go to one extras slot."""
+    print("Testing compact FX records...")
+    trade = _trade("T1")
+    assert not hasattr(trade, "__dict__")
+    assert trade._extras is None
+    assert trade.extras == {}
+
+    tagged = _trade("T2", account_id="ACC-1", strategy="fdb")
+    assert tagged.account_id == "ACC-1" and tagged.strategy == "fdb"
+    assert tagged.extras == {"account_id": "ACC-1", "strategy": "fdb"}
+    assert _trade("T3", account_id="x", strategy="y")._extras[0] is tagged._extras[0], "extras keys are interned"
+
+    tagged.note = "late"
+    tagged.strategy = "alligator"
+    del tagged.account_id
+    assert tagged.extras == {"strategy": "alligator", "note": "late"}
+    with pytest.raises(AttributeError):
+        tagged.account_id
+
+    order = fx.FXOrder("O1", "EUR/USD", 1000, "S", 1.1, status="waiting", parent="T1")
+    assert order.status == "waiting" and order.parent == "T1"
+    assert "parent" not in order.to_dict()
+
+
+def test_extras_key_interning_is_bounded(monkeypatch):
+    """Past the cap, new extras key tuples are used without being interned."""
+    monkeypatch.setattr(fx.transact, "_EXTRA_KEYS", {})
+    monkeypatch.setattr(fx.transact, "_MAX_EXTRA_KEYS", 3)
+    trades = [_trade(f"T{i}", **{f"field_{i}": i}) for i in range(10)]
+    assert len(fx.transact._EXTRA_KEYS) == 3
+    assert [getattr(t, f"field_{i}") for i, t in enumerate(trades)] == list(range(10))
+    assert _trade("X", field_0=1)._extras[0] is trades[0]._extras[0]
+
+
+def test_records_round_trip():
+    """to_dict/from_dict, JSON, pickle and copy keep their behaviour."""
+    trade = _trade("T1", pl=12.5, account_id="ACC-1")
+    assert fx.FXTrade.from_dict(trade.to_dict()).to_dict() == trade.to_dict()
+    assert fx.FXTrade.from_json_string(trade.to_json()).pl == 12.5
+    assert set(trade.to_dict()) == set(fx.FXTrade._FIELDS)
+
+    for clone in (pickle.loads(pickle.dumps(trade)), copy.copy(trade), copy.deepcopy(trade)):
+        assert clone.to_dict() == trade.to_dict()
+        assert clone.account_id == "ACC-1"
+
+    trades = fx.FXTrades.from_json_string(fx.FXTrades([trade]).to_json())
+    assert trades.trades[0].to_dict() == trade.to_dict()
+
+
+def test_columnar_trades_aggregates_match_list():
+    """Columnar aggregates agree with the list-backed Python loops."""
+    pytest.importorskip("numpy")
+    print("Testing columnar FX trades...")
+    rows = [
+        {"trade_id": "1", "instrument": "EUR/USD", "amount": 1000, "buy_sell": "B", "open_rate": 1.10, "pl": 12.5},
+        {"trade_id": "2", "instrument": "EUR/USD", "amount": 3000, "buy_sell": "S", "open_rate": 1.20, "pl": -2.5},
+        {"trade_id": "3", "instrument": "USD/JPY", "amount": 2000, "buy_sell": "B", "open_rate": 150.0, "pl": None},
+        {"trade_id": "4", "instrument": "GBP/USD", "amount": 500, "buy_sell": "S", "open_rate": None, "pl": 4.0, "account_id": "A"},
+    ]
+    listed = fx.FXTrades.from_dict({"trades": rows})
+    columnar = fx.FXTrades.from_dict({"trades": rows}, columnar=True)
+    assert columnar.columnar and not listed.columnar
+
+    assert columnar.pl_by_instrument() == listed.pl_by_instrument() == {
+        "EUR/USD": 10.0, "USD/JPY": 0.0, "GBP/USD": 4.0,
+    }
+    assert columnar.net_exposure() == listed.net_exposure() == {
+        "EUR/USD": -2000.0, "USD/JPY": 2000.0, "GBP/USD": -500.0,
+    }
+    store = columnar.trades
+    assert store.exposure_by_side() == {"B": 3000.0, "S": 3500.0}
+    assert store.average_open_rate()["EUR/USD"] == pytest.approx((1000 * 1.10 + 3000 * 1.20) / 4000)
+    assert store.total_pl() == 14.0
+    assert list(store.column("instrument")) == ["EUR/USD", "EUR/USD", "USD/JPY", "GBP/USD"]
+
+
+def test_columnar_rows_are_fxtrade_views():
+    """Rows read and write the columns and serialize like FXTrade."""
+    pytest.importorskip("numpy")
+    trades = fx.FXTrades(columnar=True)
+    for i in range(100):
+        trades.add_trade({"trade_id": str(i), "instrument": "EUR/USD", "amount": 1000, "buy_sell": "B", "pl": 1.0})
+    trades.add_trade(_trade("X", instrument="AUD/USD", pl=None, account_id="ACC-9"))
+    assert len(trades.trades) == 101
+
+    view = trades.trades[-1]
+    assert isinstance(view, fx.FXTrade)
+    assert view.to_dict()["pl"] is None and view.account_id == "ACC-9"
+    view.pl = 7.5
+    view.instrument = "NZD/USD"
+    assert trades.pl_by_instrument()["NZD/USD"] == 7.5
+
+    detached = trades.trades.pop(0)
+    assert type(detached) is fx.FXTrade and detached.trade_id == "0"
+    assert len(trades.trades) == 100 and trades.trades[0].trade_id == "1"
+    assert pickle.loads(pickle.dumps(trades.trades[-1])).account_id == "ACC-9"
+
+    restored = fx.FXTrades.from_json_string(trades.to_json())
+    assert [t.to_dict() for t in restored.trades] == [t.to_dict() for t in trades.trades]
+
+    # Float columns hold numbers only; bad values name the field and change nothing
+    before = [t.to_dict() for t in trades.trades]
+    with pytest.raises(ValueError, match="amount"):
+        trades.add_trade({"trade_id": "S", "instrument": "EUR/USD", "amount": "1000"})
+    with pytest.raises(ValueError, match="pl"):
+        trades.trades[-1].pl = "n/a"
+    with pytest.raises(ValueError, match="open_rate"):
+        trades.trades[0] = fx.FXTrade("1", "EUR/USD", 1000, "B", "1.1")
+    assert [t.to_dict() for t in trades.trades] == before
+
+
+def test_trade_indexes_stay_in_sync():
+    """get/remove/upsert/by_instrument are served from the indexes."""
+    print("Testing FX trade indexes...")
+    trades = fx.FXTrades()
+    for i, instrument in enumerate(["EUR/USD", "USD/JPY", "EUR/USD"]):
+        trades.add_trade(_trade(f"T{i}", instrument=instrument))
+    assert trades.get("T1").instrument == "USD/JPY"
+    assert "T2" in trades and "T9" not in trades and trades.get("T9") is None
+    assert [t.trade_id for t in trades.by_instrument("EUR/USD")] == ["T0", "T2"]
+
+    with pytest.raises(ValueError):
+        trades.add_trade({"trade_id": "T0", "instrument": "GBP/USD"})
+
+    replaced = trades.upsert({"trade_id": "T0", "instrument": "GBP/USD", "pl": 3.0})
+    assert replaced.instrument == "EUR/USD"
+    assert [t.trade_id for t in trades.trades] == ["T0", "T1", "T2"], "upsert keeps the position"
+    assert [t.trade_id for t in trades.by_instrument("EUR/USD")] == ["T2"]
+    assert trades.upsert(_trade("T3")) is None
+
+    assert trades.remove("T1").trade_id == "T1"
+    assert [t.trade_id for t in trades.trades] == ["T0", "T2", "T3"], "later trades keep their order"
+    assert trades.by_instrument("USD/JPY") == []
+    with pytest.raises(KeyError):
+        trades.remove("T1")
+    assert trades.upsert(_trade("T3", pl=5.0)).pl == 0.0
+    assert trades.trades[2].pl == 5.0
+
+    # Renaming onto an existing id is rejected like a duplicate add
+    with pytest.raises(ValueError):
+        trades.update("T0", trade_id="T2")
+    assert [t.trade_id for t in trades.trades] == ["T0", "T2", "T3"]
+    trades.update("T0", trade_id="T9")
+    assert trades.get("T9") is trades.trades[0] and "T0" not in trades
+    assert trades.remove("T9").trade_id == "T9"
+    assert [t.trade_id for t in trades.trades] == ["T2", "T3"]
+
+    # Direct list changes are picked up on the next lookup
+    trades.trades.append(_trade("T4", instrument="AUD/USD"))
+    assert trades.get("T4").instrument == "AUD/USD"
+
+
+def test_remove_keeps_insertion_order():
+    """Removals anywhere keep the saved order; later positions stay findable."""
+    trades = fx.FXTrades([_trade(f"T{i}") for i in range(8)])
+    for trade_id in ("T1", "T4", "T0", "T7"):
+        trades.remove(trade_id)
+    assert [t["trade_id"] for t in trades.to_dict()["trades"]] == ["T2", "T3", "T5", "T6"]
+    trades.upsert(_trade("T6", pl=6.0))
+    trades.update("T5", trade_id="T9")
+    trades.remove("T3")
+    assert [(t.trade_id, t.pl) for t in trades.trades] == [("T2", 0.0), ("T9", 0.0), ("T6", 6.0)]
+
+
+def test_from_dict_rejects_duplicate_ids():
+    """A file listing an id twice is rejected, like a duplicate add."""
+    rows = [_trade("X").to_dict(), _trade("Y").to_dict(), _trade("X", pl=1.0).to_dict()]
+    with pytest.raises(ValueError, match="Duplicate trade_id: X"):
+        fx.FXTrades.from_dict({"trades": rows})
+    with pytest.raises(ValueError, match="Duplicate order_id: O1"):
+        fx.FXTransactWrapper.from_dict({"orders": [{"order_id": "O1"}, {"order_id": "O1"}]})
+    # Trades without an id are not duplicates of each other
+    assert len(fx.FXTrades.from_dict({"trades": [_trade(None).to_dict()] * 2}).trades) == 2
+
+
+def test_order_indexes_by_status():
+    """Orders are indexed by status, and update() moves them between buckets."""
+    orders = fx.FXOrders()
+    for i in range(5):
+        orders.add_order(fx.FXOrder(f"O{i}", "EUR/USD" if i % 2 else "USD/JPY", 1000, "B", 1.1, status="waiting"))
+    assert len(orders.by_status("waiting")) == 5
+
+    orders.update("O1", status="executed")
+    orders.upsert({"order_id": "O2", "instrument": "USD/JPY", "status": "cancelled"})
+    assert [o.order_id for o in orders.by_status("waiting")] == ["O0", "O3", "O4"]
+    assert [o.order_id for o in orders.by_status("executed")] == ["O1"]
+    assert [o.order_id for o in orders.by_instrument("EUR/USD")] == ["O1", "O3"]
+
+    orders.remove("O3")
+    assert [o.order_id for o in orders.by_status("waiting")] == ["O0", "O4"]
+    assert orders.get("O3") is None
+
+
+def test_columnar_trade_indexes():
+    """Indexes work on the columnar backing, including removal and upsert."""
+    pytest.importorskip("numpy")
+    trades = fx.FXTrades(columnar=True)
+    for i in range(6):
+        trades.add_trade({"trade_id": f"T{i}", "instrument": "EUR/USD" if i % 2 else "USD/JPY", "pl": float(i)})
+    assert trades.get("T3").pl == 3.0
+    assert trades.remove("T1").trade_id == "T1"
+    assert [t.trade_id for t in trades.trades] == ["T0", "T2", "T3", "T4", "T5"]
+    assert trades.get("T5").pl == 5.0 and trades.get("T5")._row == 4, "later views follow their rows"
+    assert trades.get("T3").pl == 3.0
+    trades.upsert({"trade_id": "T4", "instrument": "GBP/USD", "pl": 40.0})
+    assert trades.pl_by_instrument() == {"USD/JPY": 2.0, "EUR/USD": 8.0, "GBP/USD": 40.0}
+    assert [t.trade_id for t in trades.by_instrument("EUR/USD")] == ["T3", "T5"]
+
+
+def test_journal_appends_and_replays(tmp_path):
+    """Each change is one JSONL line; reopening replays snapshot + journal."""
+    print("Testing FX journal...")
+    path = str(tmp_path / "fxtransact.jsonl")
+    with fx.FXTransactDataHelper.open_journal(path, compact_every=None) as journal:
+        journal.add_trade(_trade("T1", pl=1.0))
+        journal.add_trade({"trade_id": "T2", "instrument": "USD/JPY"})
+        journal.add_order(fx.FXOrder("O1", "EUR/USD", 1000, "B", 1.1, status="waiting"))
+        journal.update_order("O1", status="executed")
+        journal.remove_trade("T1")
+        with pytest.raises(ValueError):
+            journal.add_trade({"trade_id": "T2"})
+
+    with open(path) as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 5
+    assert all(": " not in line for line in lines), "entries are compact"
+
+    reopened = fx.FXTransactJournal(path)
+    assert [t.trade_id for t in reopened.trades.trades] == ["T2"]
+    assert reopened.orders.get("O1").status == "executed"
+    assert reopened.entries == 5
+    reopened.close()
+
+
+def test_journal_compaction_and_crash_recovery(tmp_path):
+    """Compaction writes a snapshot; a torn last line is dropped on load."""
+    path = str(tmp_path / "fxtransact.jsonl")
+    journal = fx.FXTransactJournal(path, compact_every=3)
+    for i in range(4):
+        journal.add_trade(_trade(f"T{i}", pl=float(i)))
+    journal.close()
+
+    assert journal.entries == 1
+    snapshot = fx.FXTransactDataHelper.load_wrapper_json(journal.snapshot_path)
+    assert [t.trade_id for t in snapshot.trades.trades] == ["T0", "T1", "T2"]
+
+    with open(path, "a") as f:
+        f.write('{"op":"remove","kind":"trade","id":"T0"}\n{"op":"remove","ki')
+    recovered = fx.FXTransactJournal(path, compact_every=None)
+    assert [t.trade_id for t in recovered.trades.trades] == ["T1", "T2", "T3"]
+    recovered.update_trade("T3", pl=30.0)
+    recovered.close()
+    with open(path) as f:
+        assert f.read().endswith('"fields":{"pl":30.0}}\n')
+
+    # Replaying entries already in the snapshot is harmless
+    again = fx.FXTransactJournal(path)
+    again.compact()
+    with open(path, "a") as f:
+        f.write('{"op":"add","kind":"trade","data":{"trade_id":"T1","pl":1.0}}\n')
+    assert [t.trade_id for t in fx.FXTransactJournal(path).trades.trades] == ["T1", "T2", "T3"]
+    again.close()
+
+
+def test_streaming_loaders_read_both_layouts(tmp_path):
+    """iter_trades/iter_orders stream the save_*_json layout and JSONL."""
+    print("Testing FX streaming loaders...")
+    wrapper = fx.FXTransactWrapper()
+    for i in range(50):
+        wrapper.add_trade(_trade(f"T{i}", instrument=("EUR/USD", "USD/JPY")[i % 2], pl=float(i)))
+    wrapper.add_order(fx.FXOrder("O1", "EUR/USD", 1000, "B", 1.1, status="waiting"))
+    wrapper.add_order(fx.FXOrder("O2", "EUR/USD", 1000, "S", 1.2, status="executed"))
+
+    wrapper_path = str(tmp_path / "fxtransact.json")
+    assert fx.FXTransactDataHelper.save_wrapper_json(wrapper, wrapper_path)
+    trades_path = str(tmp_path / "trades.json")
+    assert fx.FXTransactDataHelper.save_trades_json(wrapper.trades, trades_path, indent=None)
+    jsonl_path = str(tmp_path / "trades.jsonl")
+    with open(jsonl_path, "w") as f:
+        for trade in wrapper.trades.trades:
+            f.write(json.dumps(trade.to_dict()) + "\n")
+
+    expected = [t.to_dict() for t in wrapper.trades.trades]
+    for path in (wrapper_path, trades_path, jsonl_path):
+        # A tiny chunk size forces records to straddle chunk boundaries
+        streamed = fx.iter_trades(path, chunk_size=7)
+        assert [t.to_dict() for t in streamed] == expected
+
+    # Collection keys need not come first in the top-level object
+    meta_path = str(tmp_path / "meta.json")
+    with open(meta_path, "w") as f:
+        json.dump({"meta": {"trades": 1, "list": [1, 2]}, "count": 50, "trades": expected}, f)
+    assert [t.to_dict() for t in fx.iter_trades(meta_path, chunk_size=7)] == expected
+
+    orders = list(fx.FXTransactDataHelper.iter_orders(wrapper_path, status="executed"))
+    assert [o.order_id for o in orders] == ["O2"]
+    assert list(fx.iter_orders(trades_path)) == []
+
+
+def test_streaming_filters_are_applied_before_building_records(tmp_path):
+    """Field filters and predicates select records during the scan."""
+    path = str(tmp_path / "trades.json")
+    trades = fx.FXTrades([_trade(f"T{i}", instrument=("EUR/USD", "GBP/USD", "USD/JPY")[i % 3], pl=float(i)) for i in range(30)])
+    fx.FXTransactDataHelper.save_trades_json(trades, path)
+
+    eur = list(fx.FXTransactDataHelper.iter_trades(path, instrument="EUR/USD"))
+    assert len(eur) == 10 and all(t.instrument == "EUR/USD" for t in eur)
+
+    pairs = fx.iter_trades(path, instrument={"EUR/USD", "GBP/USD"}, predicate=lambda r: r["pl"] >= 20)
+    assert [t.trade_id for t in pairs] == ["T21", "T22", "T24", "T25", "T27", "T28"]
+
+    with open(path) as f:
+        truncated = f.read()[:-40]
+    with open(path, "w") as f:
+        f.write(truncated)
+    with pytest.raises(ValueError):
+        list(fx.iter_records(path, "trades", chunk_size=16))
+
+
+def test_journal_writes_before_changing_memory(tmp_path):
+    """Entries that cannot be serialized change nothing; renames replay cleanly."""
+    import datetime
+
+    path = str(tmp_path / "fxtransact.jsonl")
+    journal = fx.FXTransactJournal(path, compact_every=None)
+    journal.add_trade(_trade("T1"))
+    journal.add_trade(_trade("T2"))
+    with pytest.raises(TypeError):
+        journal.add_trade(_trade("T3", open_time=datetime.datetime(2024, 1, 1)))
+    with pytest.raises(TypeError):
+        journal.update_trade("T1", close_time=datetime.datetime(2024, 1, 1))
+    assert "T3" not in journal.trades and journal.trades.get("T1").close_time is None
+
+    with pytest.raises(ValueError):
+        journal.update_trade("T1", trade_id="T2")
+    renamed = journal.update_trade("T1", trade_id="T9", pl=4.0)
+    assert renamed.trade_id == "T9" and "T1" not in journal.trades
+    journal.close()
+
+    expected = [t.to_dict() for t in journal.trades.trades]
+    reopened = fx.FXTransactJournal(path, compact_every=None)
+    assert [t.to_dict() for t in reopened.trades.trades] == expected
+
+    # Crash after the snapshot but before the journal was truncated:
+    # the journal is replayed on top of a snapshot that already holds it
+    with open(path) as f:
+        entries = f.read()
+    reopened.compact()
+    reopened.close()
+    with open(path, "w") as f:
+        f.write(entries)
+    replayed = fx.FXTransactJournal(path, compact_every=None)
+    assert [t.to_dict() for t in replayed.trades.trades] == expected
+    replayed.close()
+
+
+def test_journal_snapshot_skips_entries_it_holds(tmp_path):
+    """A crash between snapshot and truncation does not duplicate id-less trades."""
+    path = str(tmp_path / "fxtransact.jsonl")
+    journal = fx.FXTransactJournal(path, compact_every=None)
+    journal.add_trade(_trade(None, pl=1.0))
+    journal.add_trade(_trade("T1"))
+    with open(path) as f:
+        entries = f.read()
+    journal.compact()
+    journal.add_trade(_trade(None, pl=2.0))
+    journal.close()
+
+    # Put the pre-snapshot entries back, as if truncation never happened
+    with open(path) as f:
+        newer = f.read()
+    with open(path, "w") as f:
+        f.write(entries + newer)
+    replayed = fx.FXTransactJournal(path, compact_every=None)
+    assert [t.pl for t in replayed.trades.trades] == [1.0, 0.0, 2.0]
+    assert replayed.seq == 3
+    replayed.close()
+
+
+def test_journal_rejects_entries_the_store_cannot_hold(tmp_path):
+    """A record the columnar store rejects is never written to the journal."""
+    pytest.importorskip("numpy")
+    path = str(tmp_path / "fxtransact.jsonl")
+    journal = fx.FXTransactJournal(path, compact_every=None)
+    journal.wrapper.trades = fx.FXTrades(columnar=True)
+    journal.add_trade(_trade("T1"))
+    with pytest.raises(ValueError):
+        journal.add_trade(_trade("T2", pl="lots"))
+    with pytest.raises(ValueError):
+        journal.update_trade("T1", amount="many")
+    with pytest.raises(ValueError):
+        journal.update_trade("T1", trade_id="T9", pl="lots")
+    assert [t.trade_id for t in journal.trades.trades] == ["T1"]
+    journal.close()
+
+    with open(path) as f:
+        assert len(f.read().splitlines()) == 1
+    reopened = fx.FXTransactJournal(path, compact_every=None)
+    assert [t.to_dict() for t in reopened.trades.trades] == [_trade("T1").to_dict()]
+    reopened.close()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+"""
+Tests for jgtcore lazy package imports
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _loaded_modules(statement):
+    """Run statement in a fresh interpreter and list the modules it loaded."""
+    code = f"{statement}\nimport sys, json\nprint(json.dumps(sorted(sys.modules)))"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+    )
+    return set(json.loads(out.stdout.strip().splitlines()[-1]))
+
+
+def test_import_jgtcore_is_lazy():
+    """`import jgtcore` must not pull in any submodule or heavy dependency."""
+    print("Testing lazy import...")
+    modules = _loaded_modules("import jgtcore")
+    assert {m for m in modules if m.startswith("jgtcore.")} == set()
+    for heavy in ("argparse", "ruamel", "ruamel.yaml", "dotenv", "coaiapy"):
+        assert heavy not in modules, f"{heavy} imported eagerly"
+
+
+def test_only_used_submodule_is_imported():
+    """Accessing a name only imports the submodule that defines it."""
+    modules = _loaded_modules("from jgtcore import get_config_value")
+    assert "jgtcore.core" in modules
+    for other in ("jgtcore.cli", "jgtcore.fx", "jgtcore.tracing", "jgtcore.env"):
+        assert other not in modules, f"{other} imported eagerly"
+
+
+def test_public_names_resolve():
+    """Every name in __all__ is still reachable."""
+    import jgtcore
+
+    for name in jgtcore.__all__:
+        assert getattr(jgtcore, name) is not None, name
+    assert jgtcore.jgt_logging.__name__ == "jgtcore.logging"
+    assert "readconfig" in dir(jgtcore)
+
+
+def test_cli_and_env_imports_stay_light():
+    """The CLI and env helpers load neither YAML nor the async settings stack."""
+    modules = _loaded_modules("import jgtcore.cli, jgtcore.env, jgtcore.os")
+    for heavy in ("ruamel.yaml", "asyncio", "jgtcore.settings.aio", "jgtcore.settings.watcher", "jgtcore.timeframe"):
+        assert heavy not in modules, f"{heavy} imported eagerly"
+
+    import jgtcore.settings as settings
+
+    for name in settings.__all__:
+        assert getattr(settings, name) is not None, name
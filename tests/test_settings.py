@@ -0,0 +1,728 @@
+#!/usr/bin/env python3
+
+"""
+Tests for jgtcore settings and configuration caching
+"""
+
+import json
+import os
+import threading
+
+import pytest
+
+import jgtcore.core as core
+
+
+def _write_json(path, data):
+    """Write data as JSON and make sure the mtime moves forward."""
+    with open(path, "w") as f:
+        json.dump(data, f)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def _isolate(monkeypatch, tmp_path):
+    """Run against an empty HOME/cwd so only test sources are seen."""
+    home = tmp_path / "home"
+    work = tmp_path / "work"
+    home.mkdir()
+    work.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.chdir(work)
+    for name in (
+        "JGT_SETTINGS_SYSTEM",
+        "JGT_SETTINGS",
+        "JGT_SETTINGS_USER",
+        "JGT_SETTINGS_PROCESS",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(core, "settings", {})
+    core.clear_settings_cache()
+    return home, work
+
+
+def test_load_settings_reuses_unchanged_sources(monkeypatch, tmp_path):
+    """Unchanged sources are not reparsed."""
+    print("Testing settings source cache...")
+    home, work = _isolate(monkeypatch, tmp_path)
+    (work / ".jgt").mkdir()
+    current = work / ".jgt" / "settings.json"
+    _write_json(current, {"instrument": "EUR/USD", "patterns": {"a": 1}})
+
+    calls = []
+    original = core._parse_settings_source
+
+    def counting(source):
+        calls.append(source.name)
+        return original(source)
+
+    monkeypatch.setattr(core, "_parse_settings_source", counting)
+
+    first = core.load_settings()
+    second = core.load_settings()
+    assert first == second == {"instrument": "EUR/USD", "patterns": {"a": 1}}
+    assert first is not second, "Callers must get independent copies"
+    assert calls == ["current"], f"Expected a single parse, got {calls}"
+
+    first["patterns"]["b"] = 2
+    assert core.load_settings()["patterns"] == {"a": 1}
+
+
+def test_load_settings_reparses_changed_sources_only(monkeypatch, tmp_path):
+    """A changed file or env var is reparsed, the other layers are not."""
+    home, work = _isolate(monkeypatch, tmp_path)
+    (home / ".jgt").mkdir()
+    (work / ".jgt").mkdir()
+    _write_json(home / ".jgt" / "settings.json", {"a": "home", "b": "home"})
+    _write_json(work / ".jgt" / "settings.json", {"b": "cwd"})
+
+    calls = []
+    original = core._parse_settings_source
+    monkeypatch.setattr(
+        core,
+        "_parse_settings_source",
+        lambda source: calls.append(source.name) or original(source),
+    )
+
+    assert core.load_settings() == {"a": "home", "b": "cwd"}
+    calls.clear()
+
+    _write_json(work / ".jgt" / "settings.json", {"b": "cwd2"})
+    assert core.load_settings() == {"a": "home", "b": "cwd2"}
+    assert calls == ["current"]
+
+    calls.clear()
+    monkeypatch.setenv("JGT_SETTINGS_PROCESS", json.dumps({"a": "process"}))
+    assert core.load_settings() == {"a": "process", "b": "cwd2"}
+    assert calls == ["env:JGT_SETTINGS_PROCESS"]
+
+
+def test_get_settings_revalidates(monkeypatch, tmp_path):
+    """get_settings returns the same object until a source changes."""
+    home, work = _isolate(monkeypatch, tmp_path)
+    (work / ".jgt").mkdir()
+    path = work / ".jgt" / "settings.json"
+    _write_json(path, {"quotes_count": 300})
+
+    first = core.get_settings()
+    assert first["quotes_count"] == 300
+    assert core.get_settings() is first
+
+    _write_json(path, {"quotes_count": 500})
+    assert core.get_settings()["quotes_count"] == 500
+    assert core.get_setting("quotes_count") == 500
+
+
+def test_load_settings_merges_patterns_with_old(monkeypatch, tmp_path):
+    """Merging into an existing dict keeps the patterns special-case."""
+    home, work = _isolate(monkeypatch, tmp_path)
+    (work / ".jgt").mkdir()
+    _write_json(work / ".jgt" / "settings.json", {"patterns": {"new": [1]}})
+
+    old = {"patterns": {"old": [0]}, "keep": True}
+    merged = core.load_settings(old=old)
+    assert merged is not old and old == {"patterns": {"old": [0]}, "keep": True}
+    assert merged["patterns"] == {"old": [0], "new": [1]}
+    assert merged["keep"] is True
+
+    # Merging over the global settings publishes a new dict and snapshot
+    published = core.get_settings()
+    snapshot = core.settings_snapshot()
+    merged = core.load_settings(old=published)
+    assert core.settings is merged and published == {"patterns": {"new": [1]}}
+    assert core.settings_snapshot() is not snapshot
+    assert core.get_settings() is merged
+
+
+def test_merge_over_global_settings_keeps_reloading(monkeypatch, tmp_path):
+    """load_settings(old=core.settings) does not stop get_settings/watchers from reloading."""
+    from jgtcore.settings import SettingsWatcher
+
+    home, work = _isolate(monkeypatch, tmp_path)
+    (work / ".jgt").mkdir()
+    path = work / ".jgt" / "settings.json"
+    _write_json(path, {"a": 1})
+
+    watcher = SettingsWatcher()
+    assert core.get_settings() == {"a": 1}
+    merged = core.load_settings(old=core.settings)
+    assert core.get_settings() is merged
+
+    _write_json(path, {"a": 2})
+    assert core.get_settings() == {"a": 2}
+    _write_json(path, {"a": 3})
+    assert watcher.poll_once() == {"settings": {"a": 3}}
+
+    # Settings assigned by the application stay assigned
+    monkeypatch.setattr(core, "settings", {"app": True})
+    merged = core.load_settings(old=core.settings)
+    _write_json(path, {"a": 4})
+    assert core.get_settings() is merged and merged["app"] is True
+
+
+def _isolate_config(monkeypatch, tmp_path):
+    """Point readconfig at a temporary HOME with no cached config."""
+    home, work = _isolate(monkeypatch, tmp_path)
+    for name in ("JGT_CONFIG", "JGT_CONFIG_PATH", "JGT_CONFIG_JSON_SECRET"):
+        monkeypatch.delenv(name, raising=False)
+    core.clear_config_cache()
+    return home, work
+
+
+def test_readconfig_parses_file_once(monkeypatch, tmp_path):
+    """The config file is parsed once and reparsed when it changes."""
+    print("Testing config cache...")
+    home, work = _isolate_config(monkeypatch, tmp_path)
+    path = home / "config.json"
+    _write_json(
+        path,
+        {
+            "user_id": "real",
+            "password": "pw",
+            "account": "acc",
+            "connection": "Real",
+            "url": "https://example.com",
+            "user_id_demo": "demo",
+            "password_demo": "dpw",
+            "account_demo": "dacc",
+        },
+    )
+
+    loads = []
+    original = core.json.load
+    monkeypatch.setattr(
+        core.json, "load", lambda f, **kw: loads.append(f.name) or original(f, **kw)
+    )
+
+    assert core.get_config_value("user_id") == "real"
+    assert core.get_config_value("account") == "acc"
+    assert core.is_demo_mode() is False
+    assert loads == [str(path)]
+
+    demo = core.readconfig(demo=True)
+    assert demo["user_id"] == "demo" and demo["connection"] == "Demo"
+    # The demo overlay must not leak into the cached config
+    assert core.get_config_value("user_id") == "real"
+    assert core.read_fx_str_from_config(demo=True)[0] == "demo"
+    assert len(loads) == 1
+
+    _write_json(path, {"user_id": "changed", "connection": "Demo"})
+    assert core.get_config_value("user_id") == "changed"
+    assert core.is_demo_mode() is True
+    assert len(loads) == 2
+
+
+def test_readconfig_parses_json_secret_once(monkeypatch, tmp_path):
+    """A cached JSON config string is decoded a single time."""
+    _isolate_config(monkeypatch, tmp_path)
+    config_str = json.dumps({"connection": "Demo", "key": "value", "nested": {"list": [1]}})
+
+    config = core.readconfig(json_config_str=config_str)
+    config["key"] = "mutated"
+    config["nested"]["list"].append(2)
+    assert core.readconfig()["nested"] == {"list": [1]}
+    assert core.get_config_value("nested") == {"list": [1]}
+    assert core.get_config_value("key") == "value"
+    assert core.readconfig()["key"] == "value"
+    assert core._parse_config_json.cache_info().misses == 1
+    core.clear_config_cache()
+
+
+def test_layered_settings_matches_load_settings(monkeypatch, tmp_path):
+    """The layered view resolves the same values as load_settings."""
+    print("Testing layered settings...")
+    from jgtcore.settings import LayeredSettings
+
+    home, work = _isolate(monkeypatch, tmp_path)
+    (home / ".jgt").mkdir()
+    (work / ".jgt").mkdir()
+    _write_json(
+        home / ".jgt" / "settings.json",
+        {"a": "home", "b": "home", "patterns": {"p1": [1], "p2": [2]}},
+    )
+    _write_json(
+        work / ".jgt" / "settings.json",
+        {"b": "cwd", "patterns": {"p2": [22], "p3": [3]}},
+    )
+    monkeypatch.setenv("JGT_SETTINGS_PROCESS", json.dumps({"c": "process"}))
+
+    view = LayeredSettings.from_sources()
+    assert dict(view) == core.load_settings()
+    assert view["patterns"] == {"p1": [1], "p2": [22], "p3": [3]}
+    assert view.source_of("a") == "user"
+    assert view.source_of("b") == "current"
+    assert view.source_of("c") == "env:JGT_SETTINGS_PROCESS"
+    assert view.source_of("missing") is None
+    assert view.provenance("patterns") == ["user", "current"]
+    assert view.get("missing", 1) == 1
+
+
+def test_layered_settings_reload_single_layer(monkeypatch, tmp_path):
+    """Reloading one layer only invalidates what that layer touches."""
+    from jgtcore.settings import LayeredSettings
+
+    home, work = _isolate(monkeypatch, tmp_path)
+    (work / ".jgt").mkdir()
+    path = work / ".jgt" / "settings.json"
+    _write_json(path, {"b": 1})
+
+    view = LayeredSettings.from_sources()
+    assert view["b"] == 1
+    assert view.reload_layer("current") is False
+
+    _write_json(path, {"b": 2, "d": 4})
+    assert view.reload() == ["current"]
+    assert view["b"] == 2 and view["d"] == 4
+    assert "d" in list(view)
+
+    view.replace_layer("jgt_yaml", {"b": "yaml"})
+    assert view["b"] == "yaml" and view.source_of("b") == "jgt_yaml"
+    copied = view.to_dict()
+    copied["b"] = "changed"
+    assert view["b"] == "yaml"
+
+
+def test_compiled_snapshot_skips_parsing(monkeypatch, tmp_path):
+    """A fresh process state loads settings and config from the snapshot."""
+    print("Testing compiled settings snapshot...")
+    home, work = _isolate_config(monkeypatch, tmp_path)
+    monkeypatch.setenv("JGT_SETTINGS_SNAPSHOT", "1")
+    monkeypatch.setenv("JGT_CACHE_DIR", str(tmp_path / "cache"))
+    (work / ".jgt").mkdir()
+    settings_path = work / ".jgt" / "settings.json"
+    _write_json(settings_path, {"quotes_count": 300, "patterns": {"a": [1]}})
+    _write_json(home / "config.json", {"connection": "Demo", "user_id": "u"})
+
+    assert core.load_settings()["quotes_count"] == 300
+    assert core.get_config_value("user_id") == "u"
+    assert len(os.listdir(tmp_path / "cache")) == 2
+
+    # Simulate a new process: empty in-memory caches, parsing forbidden
+    core.clear_settings_cache()
+    core.clear_config_cache()
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError("source parsed despite a valid snapshot")
+
+    monkeypatch.setattr(core, "_parse_settings_source", no_parse)
+    monkeypatch.setattr(core.json, "load", no_parse)
+    assert core.load_settings() == {"quotes_count": 300, "patterns": {"a": [1]}}
+    assert core.get_config_value("user_id") == "u"
+
+
+def test_compiled_snapshot_invalidated_by_source_change(monkeypatch, tmp_path):
+    """A changed source or env var makes the snapshot stale."""
+    from jgtcore.settings import compiled
+
+    home, work = _isolate(monkeypatch, tmp_path)
+    monkeypatch.setenv("JGT_SETTINGS_SNAPSHOT", "1")
+    monkeypatch.setenv("JGT_CACHE_DIR", str(tmp_path / "cache"))
+    (work / ".jgt").mkdir()
+    path = work / ".jgt" / "settings.json"
+    _write_json(path, {"a": 1})
+    assert core.load_settings() == {"a": 1}
+
+    core.clear_settings_cache()
+    _write_json(path, {"a": 2})
+    assert core.load_settings() == {"a": 2}
+
+    core.clear_settings_cache()
+    monkeypatch.setenv("JGT_SETTINGS", json.dumps({"b": 3}))
+    assert core.load_settings() == {"a": 2, "b": 3}
+
+    assert compiled.clear_compiled_snapshots() == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_compiled_snapshot_ignores_untrusted_files(monkeypatch, tmp_path):
+    """Snapshots in a group/world-writable directory are never loaded."""
+    from jgtcore.settings import compiled
+
+    cache = tmp_path / "cache"
+    monkeypatch.setenv("JGT_CACHE_DIR", str(cache))
+    fingerprint = ((("settings", "json", "/x", None), (1, 2, 3)),)
+    assert compiled.store_compiled_settings(None, fingerprint, {"a": 1})
+    assert compiled.load_compiled_settings(None, fingerprint) == {"a": 1}
+
+    os.chmod(cache, 0o777)
+    assert compiled.load_compiled_settings(None, fingerprint) is None
+    os.chmod(cache, 0o700)
+    path = cache / os.listdir(cache)[0]
+    os.chmod(path, 0o666)
+    assert compiled.load_compiled_settings(None, fingerprint) is None
+
+    # Values marshal cannot encode are not snapshotted (no pickle fallback)
+    import datetime
+
+    assert not compiled.store_compiled_settings(None, fingerprint, {"d": datetime.date(2024, 1, 1)})
+
+
+def test_settings_watcher_notifies_changed_keys(monkeypatch, tmp_path):
+    """Subscribers only receive the keys they asked for, and only on change."""
+    print("Testing settings watcher...")
+    from jgtcore.settings import SettingsWatcher
+
+    home, work = _isolate_config(monkeypatch, tmp_path)
+    (work / ".jgt").mkdir()
+    path = work / ".jgt" / "settings.json"
+    _write_json(path, {"quotes_count": 300, "_timeframes": "H1", "other": 1})
+    config_path = home / "config.json"
+    _write_json(config_path, {"connection": "Demo"})
+
+    watcher = SettingsWatcher(interval=0.01)
+    quotes, everything, config = [], [], []
+    watcher.subscribe("quotes_count", quotes.append)
+    watcher.subscribe(None, everything.append)
+    watcher.subscribe("connection", config.append, source="config")
+
+    assert watcher.poll_once() == {}
+
+    _write_json(path, {"quotes_count": 500, "_timeframes": "H1"})
+    changes = watcher.poll_once()
+    assert changes == {"settings": {"quotes_count": 500, "other": None}}
+    assert quotes == [{"quotes_count": 500}]
+    assert everything == [{"quotes_count": 500, "other": None}]
+    assert core.settings["quotes_count"] == 500
+
+    _write_json(config_path, {"connection": "Real"})
+    assert watcher.poll_once() == {"config": {"connection": "Real"}}
+    assert config == [{"connection": "Real"}]
+
+
+def test_settings_watcher_thread(monkeypatch, tmp_path):
+    """The background thread picks up changes without explicit polling."""
+    from jgtcore.settings import watch_settings
+
+    home, work = _isolate_config(monkeypatch, tmp_path)
+    (work / ".jgt").mkdir()
+    path = work / ".jgt" / "settings.json"
+    _write_json(path, {"quotes_count": 1})
+
+    seen = threading.Event()
+    with watch_settings(interval=0.01, watch_config=False) as watcher:
+        watcher.subscribe("quotes_count", lambda changed: seen.set())
+        _write_json(path, {"quotes_count": 2})
+        assert seen.wait(5), "watcher did not report the change"
+    assert not watcher.running
+
+
+def test_settings_snapshot_is_immutable(monkeypatch, tmp_path):
+    """Published snapshots cannot be mutated, nested values included."""
+    print("Testing settings snapshots...")
+    home, work = _isolate(monkeypatch, tmp_path)
+    (work / ".jgt").mkdir()
+    path = work / ".jgt" / "settings.json"
+    _write_json(path, {"a": 1, "patterns": {"p": [1, 2]}})
+
+    snapshot = core.settings_snapshot()
+    assert snapshot["a"] == 1 and snapshot.version >= 1
+    assert core.settings_snapshot() is snapshot
+    with pytest.raises(TypeError):
+        snapshot["a"] = 2
+    with pytest.raises(TypeError):
+        snapshot["patterns"]["q"] = 3
+    assert snapshot["patterns"]["p"] == (1, 2)
+    assert snapshot.to_dict() == {"a": 1, "patterns": {"p": [1, 2]}}
+
+    _write_json(path, {"a": 2})
+    core.get_settings()
+    newer = core.settings_snapshot()
+    assert newer.version > snapshot.version
+    assert newer["a"] == 2 and snapshot["a"] == 1
+
+
+def test_settings_snapshot_concurrent_readers(monkeypatch, tmp_path):
+    """Readers only ever observe complete snapshots while a writer reloads."""
+    home, work = _isolate(monkeypatch, tmp_path)
+    (work / ".jgt").mkdir()
+    path = work / ".jgt" / "settings.json"
+    _write_json(path, {"a": 0, "b": 0})
+    core.get_settings()
+
+    errors = []
+    stop = threading.Event()
+
+    def reader():
+        while not stop.is_set():
+            snapshot = core.settings_snapshot()
+            if snapshot["a"] != snapshot["b"]:
+                errors.append(dict(snapshot))
+
+    readers = [threading.Thread(target=reader) for _ in range(4)]
+    for thread in readers:
+        thread.start()
+    for i in range(1, 30):
+        _write_json(path, {"a": i, "b": i})
+        core.get_settings()
+    stop.set()
+    for thread in readers:
+        thread.join()
+
+    assert errors == []
+    assert core.settings_snapshot()["a"] == 29
+
+
+def test_arg_resolver_precedence(monkeypatch, tmp_path):
+    """Settings, alias and JGT_ env precedence match the historical helpers."""
+    print("Testing argument resolver...")
+    from jgtcore.cli import common
+    from jgtcore.settings import (
+        ArgResolver,
+        clear_arg_resolvers,
+        get_arg_resolver,
+        resolve_args,
+    )
+
+    home, work = _isolate(monkeypatch, tmp_path)
+    for name in ("INSTRUMENT", "JGT_INSTRUMENT", "I", "JGT_I", "TIMEFRAME", "JGT_T"):
+        monkeypatch.delenv(name, raising=False)
+    settings = {"instrument": "EUR/USD", "t": "H4", "quotes_count": 0}
+    resolver = ArgResolver(settings)
+
+    assert resolver.resolve("instrument", "X") == "EUR/USD"
+    assert resolver.resolve("timeframe", "D1", alias="t") == "H4"
+    assert resolver.resolve("quotes_count", 0, alias="qc") == 0
+    assert resolver.resolve("missing", "dflt") == "dflt"
+
+    monkeypatch.setenv("JGT_T", "m5")
+    assert resolver.resolve("timeframe", "D1", "t", from_jgt_env=True) == "m5"
+    assert (
+        resolver.resolve("timeframe", "D1", "t", True, exclude_env_alias=True) == "H4"
+    )
+    monkeypatch.setenv("INSTRUMENT", "GBP/USD")
+    assert resolver.resolve("instrument", None, "i", from_jgt_env=True) == "GBP/USD"
+
+    assert resolver.resolve_args(
+        [
+            "instrument",
+            ("timeframe", "D1", "t"),
+            {"argname": "quotes_count", "default_value": 5},
+        ]
+    ) == {"instrument": "EUR/USD", "timeframe": "H4", "quotes_count": 0}
+
+    assert resolve_args(["t"], settings) == {"t": "H4"}
+
+    # Plain dicts are read live, so in-place changes are seen
+    assert not get_arg_resolver(settings).compiled
+    settings["t"] = "H1"
+    assert get_arg_resolver(settings).resolve("timeframe", "D1", "t") == "H1"
+    settings["t"] = "H4"
+
+    # Snapshots are compiled once, environment included
+    snapshot = core.SettingsSnapshot(settings)
+    compiled = get_arg_resolver(snapshot)
+    assert compiled.compiled and get_arg_resolver(snapshot) is compiled
+    assert compiled.resolve("timeframe", "D1", "t", from_jgt_env=True) == "m5"
+    monkeypatch.setenv("JGT_T", "m15")
+    assert compiled.resolve("timeframe", "D1", "t", from_jgt_env=True) == "m5"
+    clear_arg_resolvers()
+    assert get_arg_resolver(snapshot).resolve("timeframe", "D1", "t", from_jgt_env=True) == "m15"
+
+    monkeypatch.setattr(common, "settings", settings)
+    assert common.load_arg_default_from_settings("timeframe", "D1", "t") == "H4"
+    assert common.resolve_arg_defaults([("instrument", None)]) == {
+        "instrument": "EUR/USD"
+    }
+
+
+def test_core_arg_defaults_use_current_settings(monkeypatch, tmp_path):
+    """core helpers resolve against the latest published settings."""
+    home, work = _isolate(monkeypatch, tmp_path)
+    (work / ".jgt").mkdir()
+    path = work / ".jgt" / "settings.json"
+    _write_json(path, {"i": "EUR/USD"})
+
+    assert core.load_arg_default_from_settings("instrument", None, "i") == "EUR/USD"
+    assert core.load_arg_default_from_settings_if_exist("instrument") is None
+
+    _write_json(path, {"instrument": "AUD/USD"})
+    assert core.load_arg_default_from_settings_if_exist("instrument", "i") == "AUD/USD"
+
+    # The published settings are served by the snapshot's compiled resolver
+    from jgtcore.settings import get_arg_resolver
+
+    resolver = core._settings_resolver()
+    assert resolver.compiled and resolver is get_arg_resolver(core.settings_snapshot())
+    assert core._settings_resolver() is resolver
+
+
+def test_tracing_templates_follow_environment(monkeypatch, tmp_path):
+    """Tracing templates are compiled once and re-resolved on env change."""
+    print("Testing compiled tracing templates...")
+    home, work = _isolate_config(monkeypatch, tmp_path)
+    monkeypatch.setenv("JGT_TEST_TRACE_HOST", "alpha")
+    monkeypatch.delenv("JGT_TEST_TRACE_MISSING", raising=False)
+    config = {
+        "tracing": {
+            "enabled": True,
+            "langfuse": {"host": "https://${JGT_TEST_TRACE_HOST}/api", "tags": ["${JGT_TEST_TRACE_MISSING}"]},
+            "service": "jgt",
+        }
+    }
+
+    first = core.get_tracing_config(config)
+    assert first["langfuse"]["host"] == "https://alpha/api"
+    assert first["langfuse"]["tags"] == ["${JGT_TEST_TRACE_MISSING}"]
+    first["added_by_caller"] = 1
+
+    first["langfuse"]["tags"].append("added")
+    second = core.get_tracing_config(config)
+    assert "added_by_caller" not in second
+    # Nested sections are copies too
+    assert second["langfuse"]["tags"] == ["${JGT_TEST_TRACE_MISSING}"]
+
+    monkeypatch.setenv("JGT_TEST_TRACE_HOST", "beta")
+    third = core.get_tracing_config(config)
+    assert third["langfuse"]["host"] == "https://beta/api"
+    assert core._resolve_env_variables(["${JGT_TEST_TRACE_HOST}", 1]) == ["beta", 1]
+
+    # A caller's config edited in place is compiled again
+    config["tracing"]["service"] = "edited"
+    config["tracing"]["langfuse"]["host"] = "${JGT_TEST_TRACE_HOST}:443"
+    fourth = core.get_tracing_config(config)
+    assert fourth["service"] == "edited" and fourth["langfuse"]["host"] == "beta:443"
+
+
+def test_shared_tracing_config_compiled_once(monkeypatch, tmp_path):
+    """Only the shared configuration's tracing templates are kept compiled."""
+    home, work = _isolate_config(monkeypatch, tmp_path)
+    monkeypatch.setenv("JGT_TEST_TRACE_HOST", "alpha")
+    _write_json(home / "config.json", {"tracing": {"host": "${JGT_TEST_TRACE_HOST}"}})
+    monkeypatch.setattr(core, "_tracing_compiled", None)
+
+    assert core.get_tracing_config() == {"host": "alpha"}
+    compiled = core._tracing_compiled
+    monkeypatch.setenv("JGT_TEST_TRACE_HOST", "beta")
+    assert core.get_tracing_config() == {"host": "beta"}
+    assert core._tracing_compiled is compiled
+
+    core.get_tracing_config({"tracing": {"host": "caller"}})
+    assert core._tracing_compiled is compiled
+
+
+def test_env_file_loaded_once(monkeypatch, tmp_path, capsys):
+    """The .env file is re-read only when it changes."""
+    print("Testing env file cache...")
+    home, work = _isolate(monkeypatch, tmp_path)
+    monkeypatch.delenv("JGT_TEST_ENV_FILE_VALUE", raising=False)
+    env_file = work / ".env.test"
+    env_file.write_text("JGT_TEST_ENV_FILE_VALUE=one\n")
+    core._ENV_FILES_LOADED.pop(".env.test", None)
+
+    core._load_env_file(".env.test")
+    assert os.environ["JGT_TEST_ENV_FILE_VALUE"] == "one"
+    monkeypatch.setenv("JGT_TEST_ENV_FILE_VALUE", "overridden")
+    core._load_env_file(".env.test")
+    assert os.environ["JGT_TEST_ENV_FILE_VALUE"] == "overridden"
+
+    env_file.write_text("JGT_TEST_ENV_FILE_VALUE=second\n")
+    stat = env_file.stat()
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    core._load_env_file(".env.test")
+    assert os.environ["JGT_TEST_ENV_FILE_VALUE"] == "second"
+    assert capsys.readouterr().out.count("Loaded 1 environment variables") == 2
+
+
+def test_async_settings_loader_matches_load_settings(monkeypatch, tmp_path):
+    """Concurrent loaders merge in load_settings precedence and share its cache."""
+    import asyncio
+
+    from jgtcore.settings import aio
+
+    print("Testing concurrent settings loading...")
+    home, work = _isolate(monkeypatch, tmp_path)
+    (home / ".jgt").mkdir()
+    (work / ".jgt").mkdir()
+    _write_json(home / ".jgt" / "settings.json", {"a": "home", "b": "home", "c": "home"})
+    _write_json(work / ".jgt" / "settings.json", {"b": "cwd", "c": "cwd"})
+    monkeypatch.setenv("JGT_SETTINGS_PROCESS", json.dumps({"c": "process"}))
+
+    async_settings = asyncio.run(aio.aload_settings())
+    assert async_settings == {"a": "home", "b": "cwd", "c": "process"}
+
+    calls = []
+    original = core._parse_settings_source
+    monkeypatch.setattr(
+        core, "_parse_settings_source", lambda s: calls.append(s.name) or original(s)
+    )
+    assert core.load_settings() == async_settings
+    assert aio.load_settings_concurrent(old={"z": 1}) == dict(async_settings, z=1)
+    assert calls == [], "Sources read concurrently are reused from the cache"
+
+
+def test_concurrent_yaml_sources_use_one_parser_per_thread(monkeypatch, tmp_path):
+    """YAML sources parsed on the thread pool do not share a ruamel instance."""
+    pytest.importorskip("ruamel.yaml")
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from jgtcore.settings import aio
+
+    home, work = _isolate(monkeypatch, tmp_path)
+    (work / ".jgt").mkdir()
+    body = "".join(f"k{i}: [{i}, {{nested: v{i}}}]\n" for i in range(200))
+    (work / ".jgt" / "settings.yml").write_text(body + "src: settings\n")
+    (work / "_config.yml").write_text("jgt:\n" + "".join("  " + line + "\n" for line in body.splitlines()) + "  cfg: 1\n")
+    (work / "jgt.yml").write_text(body + "last: jgt\n")
+
+    expected = core.load_settings()
+    assert expected["src"] == "settings" and expected["cfg"] == 1 and expected["last"] == "jgt"
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        for _ in range(5):
+            core._SOURCE_CACHE.clear()
+            assert aio.load_settings_concurrent(executor=pool) == expected
+
+    instances = []
+    threads = [threading.Thread(target=lambda: instances.append(core._get_yaml())) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert instances[0] is not instances[1]
+
+
+def test_async_config_loader(monkeypatch, tmp_path):
+    """aget_config resolves the same config file readconfig does."""
+    import asyncio
+
+    from jgtcore.settings import aio
+
+    home, work = _isolate_config(monkeypatch, tmp_path)
+    _write_json(home / "config.json", {"user_id": "u1", "account": "acc"})
+
+    config = asyncio.run(aio.aget_config())
+    assert config == {"user_id": "u1", "account": "acc"}
+    assert core._CONFIG_LOCATIONS, "The resolved location is cached for readconfig"
+    assert aio.get_config_concurrent() == core.readconfig() == config
+
+
+def test_load_arg_default_sees_in_place_changes(monkeypatch, tmp_path):
+    """Settings assigned and then edited in place are not served stale."""
+    _isolate(monkeypatch, tmp_path)
+    monkeypatch.setattr(core, "settings", {"instrument": "EUR/USD"})
+    assert core.load_arg_default_from_settings("instrument", None) == "EUR/USD"
+    core.settings["instrument"] = "GBP/USD"
+    assert core.load_arg_default_from_settings("instrument", None) == "GBP/USD"
+    assert core.load_arg_default_from_settings_if_exist("instrument") == "GBP/USD"
+
+
+def test_cli_settings_are_published_snapshots(monkeypatch, tmp_path):
+    """cli.common keeps an immutable snapshot and never hands out the shared dict."""
+    from jgtcore.cli import common
+    from jgtcore.settings import get_arg_resolver
+
+    home, work = _isolate(monkeypatch, tmp_path)
+    custom = tmp_path / "custom.json"
+    _write_json(custom, {"instrument": "AUD/USD"})
+    monkeypatch.setattr(common, "settings", None)
+    monkeypatch.setattr(common.sys, "argv", ["prog", "--settings", str(custom)])
+
+    parser = common.new_parser("test")
+    assert isinstance(common.settings, core.SettingsSnapshot)
+    assert common.settings["instrument"] == "AUD/USD"
+    assert get_arg_resolver(common.settings).compiled
+    assert common.load_arg_default_from_settings("instrument", None) == "AUD/USD"
+
+    args = common.parse_args(parser)
+    args.jgtcommon_settings["instrument"] = "changed"
+    assert core.settings_snapshot()["instrument"] == "AUD/USD"
@@ -0,0 +1,580 @@
+#!/usr/bin/env python3
+"""
+Tests for the jgtcore.timeframe package
+"""
+
+import datetime
+
+import pytest
+
+from jgtcore import timeframe
+from jgtcore.timeframe import boundaries
+
+
+def _legacy_times(minutes):
+    """Trigger list as the string-building implementation generated it."""
+    start_range = 1 if minutes >= 60 else 0
+    return [
+        f"{h:02d}:{m:02d}"
+        for h in range(start_range, 24)
+        for m in range(0, 60, minutes)
+    ]
+
+
+
+@pytest.fixture(autouse=True)
+def utc_session_calendar():
+    """Run the engine on a UTC wall clock so expectations do not depend on the host."""
+    previous = timeframe.set_session_calendar(timeframe.SessionCalendar(wall_timezone="UTC"))
+    yield
+    timeframe.set_session_calendar(previous)
+
+
+def test_intraday_trigger_times_match_legacy_lists():
+    """m frames keep their per-hour trigger lists."""
+    print("Testing boundary engine against legacy lists...")
+    for tf, minutes in (("m5", 5), ("m15", 15), ("m30", 30)):
+        assert timeframe.get_times_by_timeframe_str(tf) == _legacy_times(minutes)
+        for entry in _legacy_times(minutes):
+            assert timeframe.is_timeframe_reached(tf, entry)
+    assert len(timeframe.get_times_by_timeframe_str("m1")) == 24 * 60 * 2
+    assert timeframe.is_timeframe_reached("m1", "13:37:01")
+    assert not timeframe.is_timeframe_reached("m1", "13:37:02")
+    assert not timeframe.is_timeframe_reached("m1", "13:37")
+    assert not timeframe.is_timeframe_reached("m5", "13:35:00")
+    assert not timeframe.is_timeframe_reached("m5", "13:36")
+    assert not timeframe.is_timeframe_reached("m5", "garbage")
+
+
+def test_hour_frames_anchor_at_one():
+    """H frames start at 01:00 and repeat every N hours within the day."""
+    assert timeframe.get_times_by_timeframe_str("H4") == [
+        "01:00", "05:00", "09:00", "13:00", "17:00", "21:00"
+    ]
+    assert timeframe.is_timeframe_reached("H4", "05:00")
+    assert not timeframe.is_timeframe_reached("H4", "06:00")
+    assert timeframe.get_times_by_timeframe_str("H8") == ["01:00", "09:00", "17:00"]
+
+
+def test_boundary_arithmetic():
+    """previous/next boundary and bar opens by integer arithmetic."""
+    t = datetime.datetime(2024, 7, 10, 10, 7, 30)
+    assert timeframe.previous_boundary(t, "m5") == datetime.datetime(2024, 7, 10, 10, 5)
+    assert timeframe.next_boundary(t, "m5") == datetime.datetime(2024, 7, 10, 10, 10)
+    assert timeframe.next_boundary(t, "H4") == datetime.datetime(2024, 7, 10, 13, 0)
+    assert timeframe.next_boundary(
+        datetime.datetime(2024, 7, 10, 23, 0), "H4"
+    ) == datetime.datetime(2024, 7, 11, 1, 0)
+    assert timeframe.next_boundary(
+        datetime.datetime(2024, 7, 10, 10, 5), "m5"
+    ) == datetime.datetime(2024, 7, 10, 10, 10), "Boundaries are strictly after"
+    assert timeframe.is_boundary(datetime.datetime(2024, 7, 10, 10, 5, 40), "m5")
+
+    # Daily close is 17:00 New York (21:00 UTC in July, 22:00 UTC in January)
+    assert timeframe.bar_open(t, "D1") == datetime.datetime(2024, 7, 9, 21, 0)
+    assert timeframe.bar_open(
+        datetime.datetime(2024, 1, 10, 12, 0), "D1"
+    ) == datetime.datetime(2024, 1, 9, 22, 0)
+    # Weeks open at the Sunday close, months at the close before the 1st
+    assert timeframe.bar_open(t, "W1") == datetime.datetime(2024, 7, 7, 21, 0)
+    assert timeframe.bar_open(t, "M1") == datetime.datetime(2024, 6, 30, 21, 0)
+
+
+def test_parse_timeframe_table():
+    """Timeframe strings are parsed once into (unit, multiple, minutes)."""
+    assert timeframe.parse_timeframe("H4") == ("H", 4, 240)
+    assert timeframe.timeframe_minutes("m15") == 15
+    assert timeframe.parse_timeframe("H4") is timeframe.parse_timeframe("H4")
+    with pytest.raises(ValueError):
+        timeframe.parse_timeframe("X1")
+    with pytest.raises(ValueError):
+        timeframe.get_times_by_timeframe_str("H")
+
+
+def test_checker_triggers_once_per_boundary(monkeypatch):
+    """TimeframeChecker fires once per boundary without scanning lists."""
+    now = [datetime.datetime(2024, 7, 10, 10, 5, 0)]
+    monkeypatch.setattr(timeframe.triggers, "wall_now", lambda: now[0])
+    checker = timeframe.TimeframeChecker("m5")
+    assert checker.check_now()
+    assert not checker.check_now()
+    now[0] = datetime.datetime(2024, 7, 10, 10, 6, 0)
+    assert not checker.check_now()
+    assert checker.get_next_trigger_time() == "10:10"
+    assert checker.seconds_until_next_trigger() == 240
+    now[0] = datetime.datetime(2024, 7, 10, 10, 10, 0)
+    assert checker.check_now()
+
+
+def test_scheduler_dispatches_coinciding_boundaries():
+    """Timeframes due at the same instant are dispatched together, in order."""
+    print("Testing heap scheduler...")
+    now = [datetime.datetime(2024, 7, 10, 9, 58, 30)]
+    fired = []
+
+    class Scheduler(timeframe.TimeframeScheduler):
+        def _now(self):
+            return now[0]
+
+    scheduler = Scheduler(["H1", "m15", "m5"], lambda tf, b: fired.append((tf, b)))
+    hour = datetime.datetime(2024, 7, 10, 10, 0)
+    assert scheduler.next_due() == (hour, ["m5", "m15", "H1"])
+    assert scheduler.seconds_until_next() == 90
+    assert scheduler.run_pending() == []
+
+    now[0] = datetime.datetime(2024, 7, 10, 10, 0, 0, 5000)
+    assert scheduler.run_pending() == [("m5", hour), ("m15", hour), ("H1", hour)]
+    assert fired == [("m5", hour), ("m15", hour), ("H1", hour)]
+    assert scheduler.next_due() == (datetime.datetime(2024, 7, 10, 10, 5), ["m5"])
+
+    # A late wakeup fires once and resumes at the next future boundary
+    own = []
+    scheduler.add("m5", lambda tf, b: own.append(b))
+    now[0] = datetime.datetime(2024, 7, 10, 10, 17)
+    assert [tf for tf, _ in scheduler.run_pending()] == ["m5", "m15"]
+    assert len(own) == 1
+    assert scheduler.next_due() == (datetime.datetime(2024, 7, 10, 10, 20), ["m5"])
+
+    scheduler.remove("m5")
+    assert scheduler.timeframes == ["H1", "m15"]
+
+
+def test_scheduler_thread_starts_and_stops():
+    """The scheduler thread waits on a condition and stops promptly."""
+    with timeframe.TimeframeScheduler(["H4"]) as scheduler:
+        assert scheduler.running
+    assert not scheduler.running
+
+
+def test_async_timeframe_iteration(monkeypatch):
+    """aiter_timeframes yields boundary events using asyncio.sleep only."""
+    import asyncio
+
+    print("Testing asyncio timeframe events...")
+    now = [datetime.datetime(2024, 7, 10, 9, 59, 58)]
+    slept = []
+
+    async def fake_sleep(delay):
+        slept.append(delay)
+        now[0] += datetime.timedelta(seconds=delay)
+
+    monkeypatch.setattr(timeframe.TimeframeScheduler, "_now", lambda self: now[0])
+    monkeypatch.setattr(timeframe.aio.asyncio, "sleep", fake_sleep)
+
+    async def collect():
+        events = []
+        async for event in timeframe.aiter_timeframes(["H1", "m5"]):
+            events.append(event)
+            if len(events) == 3:
+                break
+        return events
+
+    events = asyncio.run(collect())
+    hour = datetime.datetime(2024, 7, 10, 10, 0)
+    assert events == [
+        timeframe.TimeframeEvent("m5", hour),
+        timeframe.TimeframeEvent("H1", hour),
+        timeframe.TimeframeEvent("m5", datetime.datetime(2024, 7, 10, 10, 5)),
+    ]
+    assert slept == [2.0, 300.0]
+
+
+def test_wait_for_timeframe_async_times_out():
+    """wait_for_timeframe_async honours max_wait_seconds without blocking."""
+    import asyncio
+
+    async def run():
+        return await timeframe.wait_for_timeframe_async("D1", max_wait_seconds=0.01)
+
+    reached = asyncio.run(run())
+    assert reached is False or timeframe.is_timeframe_reached("D1")
+
+
+def test_bucket_matches_bar_open():
+    """Vectorized bucketing agrees with the scalar bar_open for every frame."""
+    np = pytest.importorskip("numpy")
+
+    print("Testing vectorized bucketing...")
+    start = np.datetime64("2023-01-01T00:00:00")
+    offsets = np.arange(0, 2 * 365 * 24 * 3600, 7919 * 13, dtype=np.int64)
+    timestamps = start + offsets.astype("timedelta64[s]")
+    for tf in ("m1", "m5", "m15", "H1", "H4", "D1", "W1", "M1", "H6", "D2"):
+        opened = timeframe.bucket(timestamps, tf)
+        assert opened.dtype == timestamps.dtype
+        expected = [timeframe.bar_open(ts.item(), tf) for ts in timestamps]
+        assert [value.item() for value in opened] == expected, tf
+
+
+def test_bucket_keeps_missing_values():
+    """NaT stays NaT and scalars fall back to bar_open."""
+    np = pytest.importorskip("numpy")
+
+    values = np.array(["NaT", "2024-07-10T10:07"], dtype="datetime64[m]")
+    opened = timeframe.bucket(values, "m5")
+    assert np.isnat(opened[0])
+    assert opened[1] == np.datetime64("2024-07-10T10:05")
+    assert timeframe.bucket(datetime.datetime(2024, 7, 10, 10, 7), "H4") == datetime.datetime(
+        2024, 7, 10, 9, 0
+    )
+
+
+def test_session_calendar_dst_edges():
+    """Daily closes are 17:00 New York in UTC, including historical rules."""
+    print("Testing session calendar...")
+    calendar = timeframe.SessionCalendar(wall_timezone="UTC")
+    if not timeframe.HAS_ZONEINFO:
+        pytest.skip("zoneinfo not available")
+    close = lambda *ymd: calendar.close_wall(datetime.date(*ymd))
+    assert close(2024, 3, 8) == datetime.datetime(2024, 3, 8, 22, 0)
+    assert close(2024, 3, 10) == datetime.datetime(2024, 3, 10, 21, 0)
+    assert close(2024, 11, 1) == datetime.datetime(2024, 11, 1, 21, 0)
+    assert close(2024, 11, 3) == datetime.datetime(2024, 11, 3, 22, 0)
+    # Before 2007 US DST started in April
+    assert close(2006, 3, 20) == datetime.datetime(2006, 3, 20, 22, 0)
+    assert close(2006, 4, 3) == datetime.datetime(2006, 4, 3, 21, 0)
+    assert calendar.close_utc(datetime.date(2024, 7, 10)) == datetime.datetime(
+        2024, 7, 10, 21, 0, tzinfo=datetime.timezone.utc
+    )
+    first, last = calendar.years
+    assert first <= 2006 and last >= 2024
+
+    tokyo = timeframe.SessionCalendar(wall_timezone="Asia/Tokyo")
+    assert tokyo.close_wall(datetime.date(2024, 7, 10)) == datetime.datetime(2024, 7, 11, 6, 0)
+
+
+def test_session_calendar_defaults_and_tz_database_fallback(monkeypatch):
+    """Local wall clock by default; the DST rule is used without a tz database."""
+    assert timeframe.SessionCalendar().wall_timezone is None
+
+    def missing(key):
+        raise timeframe.sessions.ZoneInfoNotFoundError(key)
+
+    monkeypatch.setattr(timeframe.sessions, "ZoneInfo", missing)
+    calendar = timeframe.SessionCalendar(wall_timezone="UTC")
+    assert calendar.close_utc(datetime.date(2024, 7, 10)) == datetime.datetime(
+        2024, 7, 10, 21, 0, tzinfo=datetime.timezone.utc
+    )
+    assert calendar.close_wall(datetime.date(2024, 1, 10)) == datetime.datetime(2024, 1, 10, 22, 0)
+    with pytest.raises(ValueError):
+        timeframe.SessionCalendar("Europe/London")
+
+
+def test_engine_uses_session_calendar():
+    """The engine reads daily closes from the configured calendar."""
+    if not timeframe.HAS_ZONEINFO:
+        pytest.skip("zoneinfo not available")
+    previous = timeframe.set_session_calendar(
+        timeframe.SessionCalendar(wall_timezone="America/New_York")
+    )
+    try:
+        t = datetime.datetime(2024, 7, 10, 12, 0)
+        assert timeframe.bar_open(t, "D1") == datetime.datetime(2024, 7, 9, 17, 0)
+        assert timeframe.next_boundary(t, "D1") == datetime.datetime(2024, 7, 10, 17, 0)
+    finally:
+        timeframe.set_session_calendar(previous)
+
+
+def test_market_hours_intervals_and_holidays():
+    """The market runs Sunday to Friday 17:00 New York, minus holidays."""
+    print("Testing market hours...")
+    if not timeframe.HAS_ZONEINFO:
+        pytest.skip("zoneinfo not available")
+    hours = timeframe.MarketHours()
+    dt = datetime.datetime
+    assert hours.is_open(dt(2024, 7, 12, 20, 59))
+    assert not hours.is_open(dt(2024, 7, 12, 21, 0)), "Friday close is 21:00 UTC in July"
+    assert not hours.is_open(dt(2024, 7, 14, 20, 59))
+    assert hours.is_open(dt(2024, 7, 14, 21, 0))
+    assert hours.is_open(dt(2024, 1, 12, 21, 30)), "Friday close is 22:00 UTC in January"
+    assert not hours.is_open(dt(2024, 12, 25, 12, 0)), "Christmas session is closed"
+
+    assert hours.next_open(dt(2024, 7, 13, 12, 0)) == dt(2024, 7, 14, 21, 0)
+    assert hours.next_close(dt(2024, 7, 10, 12, 0)) == dt(2024, 7, 12, 21, 0)
+    assert hours.next_open(dt(2024, 12, 25, 12, 0)) == dt(2024, 12, 25, 22, 0)
+    assert hours.intervals(dt(2024, 12, 23), dt(2024, 12, 28)) == [
+        (dt(2024, 12, 22, 22, 0), dt(2024, 12, 24, 22, 0)),
+        (dt(2024, 12, 25, 22, 0), dt(2024, 12, 27, 22, 0)),
+    ]
+
+
+def test_market_hours_vectorized():
+    """Arrays are answered in one call and agree with the scalar lookups."""
+    np = pytest.importorskip("numpy")
+
+    hours = timeframe.MarketHours()
+    stamps = np.arange(
+        np.datetime64("2024-12-20T00:00"), np.datetime64("2025-01-08T00:00"), np.timedelta64(37, "m")
+    )
+    result = hours.is_open(stamps)
+    assert result.dtype == bool and result.shape == stamps.shape
+    assert list(result) == [hours.is_open(ts.item()) for ts in stamps]
+    assert not hours.is_open(np.array(["NaT"], dtype="datetime64[m]"))[0]
+
+
+@pytest.fixture
+def host_tz(monkeypatch):
+    """Set the process local time zone with host_tz(name); restored after the test."""
+    time = pytest.importorskip("time")
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset not available")
+
+    def set_tz(name):
+        monkeypatch.setenv("TZ", name)
+        time.tzset()
+
+    yield set_tz
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_market_hours_pandas_local_wall_clock(host_tz):
+    """Aware pandas timestamps are converted to the local wall clock, not UTC."""
+    pd = pytest.importorskip("pandas")
+    host_tz("Asia/Tokyo")
+
+    hours = timeframe.MarketHours(timeframe.SessionCalendar())
+    stamps = pd.date_range("2024-07-12 18:00", periods=12, freq="37min", tz="UTC")
+    expected = [hours.is_open(ts.to_pydatetime()) for ts in stamps]
+    assert list(hours.is_open(stamps)) == expected
+    assert expected[0] and not expected[-1], "Friday close is 21:00 UTC in July"
+
+
+def test_boundaries_convert_aware_datetimes(host_tz):
+    """Aware datetimes are floored on the wall clock and returned in their own zone."""
+    utc = datetime.timezone.utc
+    when = datetime.datetime(2024, 3, 5, 20, 30, tzinfo=utc)
+    host_tz("America/New_York")
+    previous = timeframe.set_session_calendar(timeframe.SessionCalendar())
+    try:
+        d1 = timeframe.get_timeframe("D1")
+        assert timeframe.bar_open(when, "D1") == d1.bar_open(when) == datetime.datetime(2024, 3, 4, 22, 0, tzinfo=utc)
+        assert timeframe.bar_open(when, "D1").tzinfo is utc
+        assert timeframe.next_boundary(when, "D1") == datetime.datetime(2024, 3, 5, 22, 0, tzinfo=utc)
+        assert timeframe.previous_boundary(when, "H4") == datetime.datetime(2024, 3, 5, 18, 0, tzinfo=utc)
+        assert timeframe.is_boundary(datetime.datetime(2024, 3, 5, 22, 0, tzinfo=utc), "D1")
+        # Naive datetimes are still wall-clock readings
+        assert timeframe.bar_open(datetime.datetime(2024, 3, 5, 20, 30), "D1") == datetime.datetime(2024, 3, 5, 17, 0)
+    finally:
+        timeframe.set_session_calendar(previous)
+
+
+def test_market_hours_aware_entry_points(host_tz):
+    """Every MarketHours lookup converts aware datetimes like is_open does."""
+    if not timeframe.HAS_ZONEINFO:
+        pytest.skip("zoneinfo not available")
+    utc = datetime.timezone.utc
+    friday = datetime.datetime(2024, 3, 8, 21, 30, tzinfo=utc)
+    monday = datetime.datetime(2024, 3, 11, 3, 0, tzinfo=utc)
+    reference = timeframe.MarketHours(timeframe.SessionCalendar(wall_timezone="UTC"))
+    host_tz("America/New_York")
+    hours = timeframe.MarketHours(timeframe.SessionCalendar())
+
+    assert hours.is_open(friday)
+    assert hours.next_close(friday) == datetime.datetime(2024, 3, 8, 22, 0, tzinfo=utc)
+    assert hours.next_open(friday) == datetime.datetime(2024, 3, 10, 21, 0, tzinfo=utc)
+    naive = monday.replace(tzinfo=None)
+    assert hours.bars_back(monday, "H1", 10) == reference.bars_back(naive, "H1", 10).replace(tzinfo=utc)
+    # H4 bars are cut on the New York wall clock: Sunday 21:00 and 17:00, then Friday 13:00 EST
+    assert hours.bars_back_many([(monday, "H4", 3)]) == [datetime.datetime(2024, 3, 8, 18, 0, tzinfo=utc)]
+    assert hours.intervals(friday - datetime.timedelta(days=1), monday) == [
+        (datetime.datetime(2024, 3, 3, 22, 0, tzinfo=utc), datetime.datetime(2024, 3, 8, 22, 0, tzinfo=utc)),
+        (datetime.datetime(2024, 3, 10, 21, 0, tzinfo=utc), datetime.datetime(2024, 3, 15, 21, 0, tzinfo=utc)),
+    ]
+
+
+def test_bucket_aware_pandas_uses_wall_clock(host_tz):
+    """Aware pandas input buckets the same on every host, labelled in its own zone."""
+    pd = pytest.importorskip("pandas")
+    stamps = pd.DatetimeIndex(["2024-03-05 20:30", "2024-03-05 22:30"], tz="UTC")
+    expected = pd.DatetimeIndex(["2024-03-04 22:00", "2024-03-05 22:00"], tz="UTC")
+    assert timeframe.bucket(stamps, "D1").equals(expected)
+
+    host_tz("America/New_York")
+    previous = timeframe.set_session_calendar(timeframe.SessionCalendar())
+    try:
+        assert timeframe.bucket(stamps, "D1").equals(expected)
+        tokyo = stamps.tz_convert("Asia/Tokyo")
+        assert timeframe.bucket(tokyo, "D1").equals(expected.tz_convert("Asia/Tokyo"))
+    finally:
+        timeframe.set_session_calendar(previous)
+
+
+def test_replay_clock_drives_timeframe_functions():
+    """Checks, waits and the scheduler follow the installed ReplayClock."""
+    print("Testing replay clock...")
+    start = datetime.datetime(2024, 7, 10, 8, 59, 30)
+    with pytest.raises(TypeError):
+        timeframe.Clock()
+    with timeframe.ReplayClock(start) as clock:
+        assert timeframe.get_clock() is clock
+        assert timeframe.wall_now() == start
+        assert timeframe.get_current_time("m5") == "08:59"
+
+        checker = timeframe.TimeframeChecker("m5")
+        assert not checker.check_now()
+        assert clock.jump(["m5", "H1", "m15"]) == (
+            datetime.datetime(2024, 7, 10, 9, 0),
+            ["m5", "H1", "m15"],
+        )
+        assert timeframe.is_timeframe_reached("H1")
+        assert checker.check_now() and not checker.check_now()
+
+        # Waiting and simulated delays advance virtual time only
+        clock.advance(60)
+        assert timeframe.wait_for_timeframe("H4")
+        assert clock.now() == datetime.datetime(2024, 7, 10, 13, 0)
+        assert not timeframe.wait_for_timeframe("D1", max_wait_seconds=60)
+        assert clock.now() == datetime.datetime(2024, 7, 10, 13, 1)
+        assert timeframe.simulate_timeframe_reached("m1")
+        assert clock.now() == datetime.datetime(2024, 7, 10, 13, 1, 1)
+    assert isinstance(timeframe.get_clock(), timeframe.SystemClock)
+
+
+def test_scheduler_replays_a_month_without_waiting():
+    """run_until under a ReplayClock dispatches every boundary in order."""
+    fired = []
+    start = datetime.datetime(2024, 1, 1)
+    end = datetime.datetime(2024, 2, 1)
+    with timeframe.ReplayClock(start):
+        scheduler = timeframe.TimeframeScheduler(["m5", "H1", "D1"], lambda tf, b: fired.append((tf, b)))
+        dispatched = scheduler.run_until(end)
+
+    counts = {tf: sum(1 for name, _ in fired if name == tf) for tf in ("m5", "H1", "D1")}
+    assert counts == {"m5": 31 * 288, "H1": 31 * 24, "D1": 31}
+    assert dispatched == len(fired)
+    assert [b for _, b in fired] == sorted(b for _, b in fired)
+    assert fired[-1][1] <= end
+
+
+def test_timeframe_registry_records():
+    """Records are interned, ordered and support arbitrary multiples."""
+    print("Testing timeframe registry...")
+    m1 = timeframe.get_timeframe("m1")
+    assert m1 is timeframe.get_timeframe("mi1") is timeframe.get_timeframe("min1")
+    assert (m1.filename, m1.poll_seconds) == ("mi1", 2)
+    assert timeframe.get_timeframe("M1").filename == "M1"
+
+    h6 = timeframe.get_timeframe("H6")
+    assert (h6.minutes, h6.poll_seconds) == (360, 60)
+    assert timeframe.get_timeframe("m3").poll_seconds == 30
+    assert timeframe.get_timeframe("15") is timeframe.get_timeframe("m15")
+    assert timeframe.find_timeframe("X9") is None
+    with pytest.raises(ValueError):
+        timeframe.get_timeframe("H0")
+
+    names = ["M1", "D2", "m3", "H6", "W1", "m1"]
+    assert [tf.name for tf in sorted(map(timeframe.get_timeframe, names))] == [
+        "m1", "m3", "H6", "D2", "W1", "M1",
+    ]
+    now = datetime.datetime(2024, 7, 10, 10, 7)
+    assert h6.next_boundary(now) == timeframe.next_boundary(now, "H6")
+    assert h6.bar_open(now) == timeframe.bar_open(now, "H6")
+    assert timeframe.get_sleep_duration_for_timeframe("m1") == 2
+    assert timeframe.get_sleep_duration_for_timeframe("unknown") == 60
+
+
+def test_os_helpers_use_registry():
+    """Filename codes and start dates come from the registry records."""
+    from jgtcore import os as jos
+
+    assert jos.t2fn("m1") == "mi1" and jos.t2fn("H4") == "H4"
+    # Minute counts and unknown codes pass through as before
+    assert jos.t2fn("15") == "15" and jos.t2fn("xyz") == "xyz"
+    assert jos.fn2t("mi1") == jos.fn2t("min1") == "m1"
+    assert jos.fn2pov("EUR-USD_mi1") == ("EUR/USD", "m1")
+    assert jos.calculate_start_datetime("2024-07-10 12:00", "H6", 4) == datetime.datetime(2024, 7, 9, 12, 0)
+    assert jos.calculate_start_datetime("2024-07-10", "15", 4) == datetime.datetime(2024, 7, 9, 23, 0)
+    # Months are calendar months, not 30 days
+    assert jos.calculate_start_datetime("2024-03-31 00:00", "M1", 1) == datetime.datetime(2024, 2, 29)
+    assert jos.calculate_start_datetime("24-07-10", "M2", 3) == datetime.datetime(2024, 1, 10)
+
+
+def test_checker_poll_catches_up_missed_boundaries():
+    """poll() reports every boundary crossed since the previous call."""
+    print("Testing catch-up polling...")
+    start = datetime.datetime(2024, 7, 10, 9, 58, 40)
+    with timeframe.ReplayClock(start) as clock:
+        checker = timeframe.TimeframeChecker("m5")
+        assert checker.poll() == []
+
+        clock.set(datetime.datetime(2024, 7, 10, 10, 11, 30))
+        assert checker.poll() == [
+            datetime.datetime(2024, 7, 10, 10, 0),
+            datetime.datetime(2024, 7, 10, 10, 5),
+            datetime.datetime(2024, 7, 10, 10, 10),
+        ]
+        assert checker.last_trigger_time == "10:10"
+        assert checker.poll() == []
+        assert not checker.check_now(), "check_now shares the processed boundary"
+
+        clock.advance(datetime.timedelta(minutes=4))
+        assert checker.poll() == [datetime.datetime(2024, 7, 10, 10, 15)]
+
+        # Boundaries older than the catch-up window are dropped
+        limited = timeframe.TimeframeChecker("m1", max_catch_up=datetime.timedelta(minutes=2))
+        clock.set(datetime.datetime(2024, 7, 10, 11, 0, 0))
+        assert limited.poll() == [datetime.datetime(2024, 7, 10, 11, 0)]
+        clock.set(datetime.datetime(2024, 7, 10, 11, 30, 20))
+        assert limited.poll() == [
+            datetime.datetime(2024, 7, 10, 11, 29),
+            datetime.datetime(2024, 7, 10, 11, 30),
+        ]
+
+        # A clock stepping back does not replay processed boundaries
+        clock.set(datetime.datetime(2024, 7, 10, 10, 0))
+        assert checker.poll() == [] and limited.poll() == []
+        clock.set(datetime.datetime(2024, 7, 10, 11, 31))
+        assert limited.poll() == [datetime.datetime(2024, 7, 10, 11, 31)]
+
+        # One day of catch-up by default; the latest boundary is always kept
+        assert checker.max_catch_up == timeframe.triggers.DEFAULT_MAX_CATCH_UP
+        clock.set(datetime.datetime(2024, 7, 13, 10, 16))
+        assert len(checker.poll()) == 24 * 12
+        weekly = timeframe.TimeframeChecker("H4", max_catch_up=60)
+        weekly.poll()
+        clock.advance(datetime.timedelta(hours=3))
+        assert weekly.poll() == [datetime.datetime(2024, 7, 13, 13, 0)]
+
+
+def test_bars_back_skips_market_closures():
+    """bars_back counts only bars that overlap a trading interval."""
+    print("Testing session-aware bars_back...")
+    if not timeframe.HAS_ZONEINFO:
+        pytest.skip("zoneinfo not available")
+    dt = datetime.datetime
+    monday_noon = dt(2024, 7, 15, 12, 0)
+    # Sunday 21:00 to Monday 11:00 is 15 H1 bars; the 16th is Friday 20:00
+    assert timeframe.bars_back(monday_noon, "H1", 15) == dt(2024, 7, 14, 21, 0)
+    assert timeframe.bars_back(monday_noon, "H1", 16) == dt(2024, 7, 12, 20, 0)
+    assert timeframe.bars_back(monday_noon, "D1", 2) == dt(2024, 7, 11, 21, 0)
+    assert timeframe.bars_back(monday_noon, "W1", 3) == dt(2024, 6, 30, 21, 0)
+    # The Christmas session is skipped
+    assert timeframe.bars_back(dt(2024, 12, 27, 12, 0), "D1", 3) == dt(2024, 12, 23, 22, 0)
+
+    requests = [(monday_noon, "H1", 16), (dt(2024, 12, 27, 12, 0), "D1", 3), (monday_noon, "m5", 1)]
+    assert timeframe.bars_back_many(requests) == [
+        dt(2024, 7, 12, 20, 0),
+        dt(2024, 12, 23, 22, 0),
+        dt(2024, 7, 15, 11, 55),
+    ]
+
+    # A week of H1 bars spans more than a calendar week
+    hours = timeframe.MarketHours()
+    start = hours.bars_back(monday_noon, "H1", 120)
+    assert start < monday_noon - datetime.timedelta(hours=120)
+    bar_opens = [start + datetime.timedelta(hours=k) for k in range(int((monday_noon - start).total_seconds()) // 3600)]
+    assert sum(hours.is_open(bar) for bar in bar_opens) == 120
+    with pytest.raises(ValueError):
+        hours.bars_back(monday_noon, "H1", 0)
+
+
+def test_session_start_datetime_helpers():
+    """os helpers expose the session-aware start calculation."""
+    from jgtcore import os as jos
+
+    if not timeframe.HAS_ZONEINFO:
+        pytest.skip("zoneinfo not available")
+    assert jos.calculate_session_start_datetime("2024-07-15 12:00", "H1", 16) == datetime.datetime(2024, 7, 12, 20, 0)
+    assert jos.calculate_session_start_datetimes(
+        [("2024-07-15 12:00", "H1", 16), ("24-07-15", "D1", 1)]
+    ) == [datetime.datetime(2024, 7, 12, 20, 0), datetime.datetime(2024, 7, 14, 21, 0)]